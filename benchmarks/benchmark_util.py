@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Helpers shared by all benchmark scripts in this directory.
+
+The benchmarks always measure the pycerberus version of this source tree (not 
+some installed version) so you can compare different revisions easily."""
+
+import os
+import sys
+import timeit
+
+__all__ = ['print_results', 'time_per_call']
+
+source_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if source_root not in sys.path:
+    sys.path.insert(0, source_root)
+
+
+def time_per_call(function, number=10000, repeat=3):
+    """Return the best time (in seconds) for a single call of ``function`` 
+    (best of ``repeat`` runs with ``number`` calls each)."""
+    timer = timeit.default_timer
+    best = None
+    for i in range(repeat):
+        start = timer()
+        for j in xrange(number):
+            function()
+        duration = (timer() - start) / number
+        if (best is None) or (duration < best):
+            best = duration
+    return best
+
+
+def print_results(title, results):
+    """Print a list of (label, seconds per call) tuples."""
+    print(title)
+    print('-' * len(title))
+    label_width = max([len(label) for label, seconds in results])
+    for label, seconds in results:
+        print('%s  %10.2f µs' % (label.ljust(label_width), seconds * 1000000))
+    print('')
@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Validate a column of integer cells (5% invalid) with process() for each 
+cell, process_many() and process_column() (list input and - if NumPy is 
+installed - NumPy arrays).
+
+    python benchmarks/column_benchmark.py
+"""
+
+import random
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.validators import IntegerValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def build_column(size, randomizer):
+    column = []
+    for i in range(size):
+        if randomizer.random() < 0.05:
+            column.append(randomizer.choice(['', 'abc', '-1', '100000']))
+        else:
+            column.append(str(randomizer.randint(0, 9999)))
+    return column
+
+
+def process_each_cell(validator, column):
+    def process():
+        for value in column:
+            try:
+                validator.process(value)
+            except InvalidDataError:
+                pass
+    return process
+
+
+def main():
+    size = 100000
+    validator = IntegerValidator(min=0, max=9999)
+    column = build_column(size, random.Random(42))
+    per_cell = lambda function: time_per_call(function, number=3) / size
+    results = [
+        ('process() per cell', per_cell(process_each_cell(validator, column))),
+        ('process_many()', per_cell(lambda: validator.process_many(column))),
+        ('process_column(list)', per_cell(lambda: validator.process_column(column))),
+    ]
+    if numpy is not None:
+        string_array = numpy.array(column)
+        # same cells, invalid values are out of range
+        integer_array = validator.process_column(string_array).converted()
+        integer_array[integer_array == 0] = -1
+        results.extend([
+            ('process_column(str array)', per_cell(lambda: validator.process_column(string_array))),
+            ('process_column(int array)', per_cell(lambda: validator.process_column(integer_array))),
+        ])
+    print_results('IntegerValidator, time per cell (%d cells)' % size, results)
+
+
+if __name__ == '__main__':
+    main()
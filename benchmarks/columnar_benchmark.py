@@ -0,0 +1,98 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Validate column-oriented data (dict of lists) with a schema: Build a dict
+for every row and use process_many()/check() versus process_columns() (lists 
+and - if NumPy is installed - NumPy arrays).
+
+    python benchmarks/columnar_benchmark.py
+"""
+
+import random
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.api import Validator
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class MinBelowMax(Validator):
+    def validate(self, fields, context):
+        if fields['min'] > fields['max']:
+            self.error('empty', fields, context)
+
+
+class MeasurementSchema(SchemaValidator):
+    id = IntegerValidator(min=0)
+    min = IntegerValidator(min=-1000, max=1000)
+    max = IntegerValidator(min=-1000, max=1000)
+    unit = StringValidator()
+    
+    formvalidators = (MinBelowMax(), )
+
+
+def build_columns(size, randomizer):
+    columns = {'id': [], 'min': [], 'max': [], 'unit': []}
+    for i in range(size):
+        columns['id'].append(str(i))
+        columns['min'].append(str(randomizer.randint(-1100, 500)))
+        columns['max'].append(str(randomizer.randint(0, 1000)))
+        columns['unit'].append(randomizer.choice(['m', 's', 'kg']))
+    return columns
+
+
+def to_rows(columns, size):
+    rows = []
+    items = columns.items()
+    for index in range(size):
+        rows.append(dict([(key, column[index]) for key, column in items]))
+    return rows
+
+
+def main():
+    size = 20000
+    schema = MeasurementSchema()
+    columns = build_columns(size, random.Random(42))
+    per_row = lambda function: time_per_call(function, number=3) / size
+    results = [
+        ('rows: process_many()', per_row(lambda: schema.process_many(to_rows(columns, size)))),
+        ('rows: check()', per_row(lambda: [schema.check(row) for row in to_rows(columns, size)])),
+        ('process_columns(lists)', per_row(lambda: schema.process_columns(columns))),
+    ]
+    if numpy is not None:
+        converted = schema.process_columns(columns).columns()
+        arrays = {'unit': columns['unit']}
+        for key in ('id', 'min', 'max'):
+            arrays[key] = numpy.array([value or 0 for value in converted[key]])
+        results.append(('process_columns(int arrays)', per_row(lambda: schema.process_columns(arrays))))
+    print_results('MeasurementSchema, time per row (%d rows)' % size, results)
+
+
+if __name__ == '__main__':
+    main()
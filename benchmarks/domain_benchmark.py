@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compare the DomainNameValidator (precompiled pattern, no self.super() 
+introspection) with the previous implementation for valid, invalid and long 
+inputs.
+
+    python benchmarks/domain_benchmark.py
+"""
+
+import re
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.validators import DomainNameValidator, StringValidator
+
+
+class LegacyDomainNameValidator(StringValidator):
+    # DomainNameValidator.validate() before the rewrite
+    messages = DomainNameValidator().messages()
+    
+    def validate(self, value, context):
+        self.super()
+        if value.startswith('.'):
+            self.error('leading_dot', value, context, domain=repr(value))
+        if value.endswith('.'):
+            self.error('trailing_dot', value, context, domain=repr(value))
+        if '..' in value:
+            self.error('double_dot', value, context, domain=repr(value))
+        
+        match = re.search('([^a-zA-Z0-9\.\-])', value)
+        if match is not None:
+            self.error('invalid_domain_character', value, context, invalid_character=repr(match.group(1)), domain=repr(value))
+
+
+def processing(validator, value):
+    def process():
+        try:
+            validator.process(value)
+        except InvalidDataError:
+            pass
+    return process
+
+
+inputs = (
+    ('valid', 'www.example.com', 20000),
+    ('invalid character', 'www.exa_mple.com', 20000),
+    ('double dot', 'www..example.com', 20000),
+    ('long valid (100k)', 'a.' * 50000 + 'com', 200),
+    ('long invalid (100k)', 'a.' * 50000 + 'com!', 200),
+)
+
+
+def main():
+    for title, validator in (('before', LegacyDomainNameValidator()), 
+                             ('after', DomainNameValidator())):
+        print_results(title, [(label, time_per_call(processing(validator, value), number=number)) 
+                              for label, value, number in inputs])
+
+
+if __name__ == '__main__':
+    main()
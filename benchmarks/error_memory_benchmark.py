@@ -0,0 +1,116 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure memory (tracemalloc, bytes per error), creation time and pickle 
+size of the slots-based InvalidDataError compared to the previous 
+implementation (details stored as an AttrDict of lambdas) and to plain 
+instance attributes (no __slots__).
+
+    python benchmarks/error_memory_benchmark.py
+
+tracemalloc requires Python 3.4+, older versions only report time and pickle 
+size.
+"""
+
+import pickle
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError, ValidationError
+from pycerberus.lib import AttrDict
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+class LegacyInvalidDataError(ValidationError):
+    # InvalidDataError as it was before the slots-based implementation
+    def __init__(self, msg, value, key=None, context=None, error_dict=None):
+        ValidationError.__init__(self, msg)
+        self._details = AttrDict(key=lambda: key, msg=lambda: msg, 
+                                 value=lambda: value, context=lambda: context)
+        self._error_dict = error_dict or {}
+    
+    def __reduce__(self):
+        e = self._details
+        arguments = (e.msg(), e.value(), e.key(), e.context(), self._error_dict)
+        return (self.__class__, arguments)
+
+
+class PlainAttributesInvalidDataError(ValidationError):
+    # same attributes as InvalidDataError but without __slots__ (exceptions 
+    # always support an instance dict, slots avoid creating it)
+    def __init__(self, msg, value, key=None, context=None, error_dict=None):
+        ValidationError.__init__(self, msg)
+        self.value = value
+        self.key = key
+        self.context = context
+        self.error_dict = error_dict or None
+    
+    def __reduce__(self):
+        arguments = (self.msg(), self.value, self.key, self.context, self.error_dict)
+        return (self.__class__, arguments)
+
+
+def create_errors(errorclass, number):
+    context = {'locale': 'en'}
+    errors = []
+    for i in range(number):
+        errors.append(errorclass('Please enter a number.', 'foo', key='invalid_number', context=context))
+    return errors
+
+
+def bytes_per_error(errorclass, number=10000):
+    create_errors(errorclass, 10)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        errors = create_errors(errorclass, number)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / float(len(errors))
+
+
+def main():
+    errorclasses = (('before (AttrDict with lambdas)', LegacyInvalidDataError), 
+                    ('plain attributes (no __slots__)', PlainAttributesInvalidDataError), 
+                    ('after (__slots__)', InvalidDataError))
+    print_results('create one error', [
+        (title, time_per_call(lambda: create_errors(errorclass, 1), number=20000))
+        for title, errorclass in errorclasses])
+    for title, errorclass in errorclasses:
+        error = create_errors(errorclass, 1)[0]
+        size = len(pickle.dumps(error, pickle.HIGHEST_PROTOCOL))
+        print('%s: %d bytes pickled' % (title, size))
+    if tracemalloc is None:
+        print('tracemalloc not available, can not measure memory usage.')
+        return
+    for title, errorclass in errorclasses:
+        print('%s: %.0f bytes per error (tracemalloc)' % (title, bytes_per_error(errorclass)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure the latency for invalid payloads with many expensive fields: 
+collect all errors (default) vs. fail-fast mode (with and without declared 
+field costs).
+
+    python benchmarks/fail_fast_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class ExpensiveValidator(StringValidator):
+    cost = 100
+    
+    def validate(self, value, context):
+        self.super()
+        # simulate some expensive check (e.g. a complex regex)
+        for i in range(200):
+            value.lower()
+
+
+def schema(**kwargs):
+    schema = SchemaValidator(**kwargs)
+    for i in range(20):
+        schema.add('text%02d' % i, ExpensiveValidator())
+    schema.add('id', IntegerValidator())
+    return schema
+
+
+def main():
+    invalid_payload = {'id': 'invalid'}
+    for i in range(20):
+        invalid_payload['text%02d' % i] = 'some text'
+    default_schema = schema()
+    fail_fast_schema = schema(fail_fast=True)
+    
+    class CostUnawareValidator(ExpensiveValidator):
+        cost = 0
+    unordered_schema = SchemaValidator(fail_fast=True)
+    for name in sorted(invalid_payload):
+        if name != 'id':
+            unordered_schema.add(name, CostUnawareValidator())
+    unordered_schema.add('id', IntegerValidator())
+    
+    def process(schema):
+        try:
+            schema.process(invalid_payload)
+        except Exception:
+            pass
+    print_results('invalid payload (20 expensive fields, invalid id)', [
+        ('collect all errors', time_per_call(lambda: process(default_schema), number=500)),
+        ('fail fast (no costs)', time_per_call(lambda: process(unordered_schema), number=500)),
+        ('fail fast (cheap fields first)', time_per_call(lambda: process(fail_fast_schema), number=500)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
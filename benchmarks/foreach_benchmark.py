@@ -0,0 +1,69 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Validate a list of nested schemas: A hand-written loop which calls 
+process() for every item versus the ForEachValidator (eager and lazy).
+
+    python benchmarks/foreach_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import ForEachValidator, IntegerValidator, StringValidator
+
+
+class ItemSchema(SchemaValidator):
+    id = IntegerValidator(min=0)
+    name = StringValidator()
+
+
+def manual_loop(schema, items):
+    def process():
+        results = []
+        errors = {}
+        for index, item in enumerate(items):
+            try:
+                results.append(schema.process(item, {}))
+            except InvalidDataError, e:
+                errors[index] = e
+        return results
+    return process
+
+
+def main():
+    size = 1000
+    items = [{'id': str(i), 'name': 'item %d' % i} for i in range(size)]
+    schema = ItemSchema()
+    foreach = ForEachValidator(schema)
+    per_item = lambda function: time_per_call(function, number=20) / size
+    print_results('list of %d schemas, time per item' % size, [
+        ('manual loop', per_item(manual_loop(schema, items))),
+        ('ForEachValidator (list)', per_item(lambda: foreach.process(items))),
+        ('ForEachValidator (generator)', per_item(lambda: list(foreach.process(iter(items))))),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Reject an invalid 200-field form in fail-fast mode when a cheap form 
+validator fails: form validator without declared dependencies (run after all
+fields were validated) versus a form validator which declares its fields (run
+as soon as these fields are valid).
+
+    python benchmarks/formvalidator_dependencies_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.api import Validator
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class PasswordsMatch(Validator):
+    def messages(self):
+        return {'mismatch': 'Passwords do not match.'}
+    
+    def validate(self, fields, context):
+        if fields['password'] != fields['confirm']:
+            self.error('mismatch', fields, context)
+
+
+def build_schema(depends_on=None, nr_fields=200):
+    schema = SchemaValidator(fail_fast=True)
+    schema.add('password', StringValidator())
+    schema.add('confirm', StringValidator())
+    for i in range(nr_fields - 2):
+        schema.add('number_%d' % i, IntegerValidator())
+    schema.add_formvalidator(PasswordsMatch(), depends_on=depends_on)
+    return schema
+
+
+def build_payload(nr_fields=200):
+    payload = {'password': 'secret', 'confirm': 'typo'}
+    for i in range(nr_fields - 2):
+        payload['number_%d' % i] = str(i)
+    return payload
+
+
+def checking(schema, payload):
+    def check():
+        schema.check(payload)
+    return check
+
+
+def main():
+    payload = build_payload()
+    print_results('fail-fast: form validator fails', [
+        ('no dependencies', time_per_call(checking(build_schema(), payload), number=2000)),
+        ('depends_on', time_per_call(checking(build_schema(('password', 'confirm')), payload), number=2000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure the IDNA support of the DomainNameValidator for ASCII-only, IDN-only
+and mixed corpora - with a cold normalization cache (every domain is encoded 
+again) and a warm cache.
+
+    python benchmarks/idna_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.validators import DomainNameValidator
+from pycerberus.validators.domain import domain_cache
+
+
+ascii_domains = ['www.example.com', 'mail.example.org', 'foo-bar.example.net', 
+                 'xn--bcher-kva.example', 'a.b.c.example']
+idn_domains = [u'b\xfccher.example', u'm\xfcnchen.example', u'\xe9t\xe9.example', 
+               u'рф.example', u'例え.テスト']
+corpora = (
+    ('ascii', ascii_domains),
+    ('idn', idn_domains),
+    ('mixed', ascii_domains + idn_domains),
+)
+
+
+def processing(validator, domains, clear_cache=False):
+    def process():
+        if clear_cache:
+            domain_cache.clear()
+        for domain in domains:
+            try:
+                validator.process(domain)
+            except InvalidDataError:
+                pass
+    return process
+
+
+def main():
+    validator = DomainNameValidator(idna_output='ascii')
+    results = []
+    for label, domains in corpora:
+        per_domain = lambda seconds: seconds / len(domains)
+        cold = time_per_call(processing(validator, domains, clear_cache=True), number=2000)
+        warm = time_per_call(processing(validator, domains), number=2000)
+        results.append(('%s (cold cache)' % label, per_domain(cold)))
+        results.append(('%s (warm cache)' % label, per_domain(warm)))
+    ascii_only = DomainNameValidator()
+    results.append(('ascii (idna disabled)', 
+        time_per_call(processing(ascii_only, ascii_domains), number=2000) / len(ascii_domains)))
+    print_results('DomainNameValidator(idna_output="ascii"), time per domain', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Revalidate a 200-field form after a single field was edited: full 
+``check()`` versus ``check_incremental()`` (with automatic change detection
+and with an explicit set of changed fields).
+
+    python benchmarks/incremental_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.api import Validator
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class RangeValidator(Validator):
+    """Form validator: 'start_<n>' must not be greater than 'end_<n>'."""
+    def __init__(self, nr, *args, **kwargs):
+        self.start = 'start_%d' % nr
+        self.end = 'end_%d' % nr
+        self.depends_on = (self.start, self.end)
+        self.super(*args, **kwargs)
+    
+    def messages(self):
+        return {'invalid_range': 'Start must not be greater than end.'}
+    
+    def convert(self, fields, context):
+        if fields[self.start] > fields[self.end]:
+            self.error('invalid_range', fields, context)
+        return fields
+
+
+def build_schema(nr_fields=200, nr_ranges=10):
+    schema = SchemaValidator()
+    for i in range(nr_ranges):
+        schema.add('start_%d' % i, IntegerValidator())
+        schema.add('end_%d' % i, IntegerValidator())
+        schema.add_formvalidator(RangeValidator(i))
+    for i in range(nr_fields - 2 * nr_ranges):
+        if i % 2:
+            schema.add('number_%d' % i, IntegerValidator(min=0))
+        else:
+            schema.add('text_%d' % i, StringValidator())
+    return schema
+
+
+def build_payload(schema):
+    payload = {}
+    for name in schema.fieldvalidators():
+        if name.startswith('text_'):
+            payload[name] = 'some text'
+        else:
+            payload[name] = '%d' % len(name)
+    return payload
+
+
+def edits(payload, key, values):
+    edited = []
+    for value in values:
+        fields = payload.copy()
+        fields[key] = value
+        edited.append(fields)
+    return edited
+
+
+def full_check(schema, payloads):
+    state = {'index': 0}
+    def check():
+        state['index'] = (state['index'] + 1) % len(payloads)
+        schema.check(payloads[state['index']])
+    return check
+
+
+def incremental_check(schema, payloads, key=None):
+    changed = None
+    if key is not None:
+        changed = (key,)
+    state = {'index': 0, 'result': schema.check_incremental(payloads[0])}
+    def check():
+        state['index'] = (state['index'] + 1) % len(payloads)
+        state['result'] = schema.check_incremental(payloads[state['index']], state['result'], changed=changed)
+    return check
+
+
+def main():
+    schema = build_schema()
+    payload = build_payload(schema)
+    for title, key in (('edit a plain field', 'number_41'), ('edit a field with a form validator', 'end_3')):
+        payloads = edits(payload, key, ('7', '8', '9', 'x'))
+        print_results(title, [
+            ('check()', time_per_call(full_check(schema, payloads), number=2000)),
+            ('check_incremental()', time_per_call(incremental_check(schema, payloads), number=2000)),
+            ('check_incremental(changed=...)', time_per_call(incremental_check(schema, payloads, key), number=2000)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
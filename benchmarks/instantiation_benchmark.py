@@ -0,0 +1,67 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure the instantiation cost of validators with deep class hierarchies 
+(e.g. EmailAddressValidator -> DomainNameValidator -> StringValidator -> 
+Validator) with and without the per-class implementation table.
+
+    python benchmarks/instantiation_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator, \
+    IntegerValidator, StringValidator
+
+
+class ContactSchema(SchemaValidator):
+    name = StringValidator()
+    age = IntegerValidator()
+    email = EmailAddressValidator()
+    website = DomainNameValidator()
+
+
+validator_classes = (StringValidator, DomainNameValidator, EmailAddressValidator, ContactSchema)
+
+
+def without_cached_table(validator_class):
+    def instantiate():
+        # forget the table so every instance has to build it again
+        if '_implementations_cache' in validator_class.__dict__:
+            delattr(validator_class, '_implementations_cache')
+        return validator_class()
+    return instantiate
+
+
+def main():
+    for title, factory in (('rebuild implementation table (before)', without_cached_table), 
+                           ('cached implementation table (after)', lambda klass: klass)):
+        results = []
+        for validator_class in validator_classes:
+            results.append((validator_class.__name__ + '()', time_per_call(factory(validator_class), number=2000)))
+        print_results(title, results)
+
+
+if __name__ == '__main__':
+    main()
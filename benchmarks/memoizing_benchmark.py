@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure DomainNameValidator/EmailAddressValidator with and without 
+memoization for input with many repeated values (100 distinct values).
+
+    python benchmarks/memoizing_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator, \
+    MemoizingValidator
+
+
+def process_all(validator, values):
+    for value in values:
+        try:
+            validator.process(value)
+        except InvalidDataError:
+            pass
+
+
+def main():
+    domains = ['host%d.example.com' % (i % 100) for i in range(1000)]
+    emails = ['user%d@example.com' % (i % 100) for i in range(1000)]
+    invalid_domains = ['host%d..example.com' % (i % 100) for i in range(1000)]
+    for title, validator_class, values in (
+            ('DomainNameValidator', DomainNameValidator, domains), 
+            ('DomainNameValidator (invalid)', DomainNameValidator, invalid_domains), 
+            ('EmailAddressValidator', EmailAddressValidator, emails)):
+        plain = validator_class()
+        memoized = MemoizingValidator(validator_class(), maxsize=1000)
+        print_results(title + ', per value', [
+            ('without cache', time_per_call(lambda: process_all(plain, values), number=20) / len(values)),
+            ('MemoizingValidator', time_per_call(lambda: process_all(memoized, values), number=20) / len(values)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Process a JSON-like payload with three levels of nested schemas: nested 
+schemas which are processed by their plan directly (default) versus nested
+schemas which go through process() for every level (custom process method).
+
+    python benchmarks/nested_schema_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class OpaqueSchema(SchemaValidator):
+    def process(self, value, context=None):
+        return super(OpaqueSchema, self).process(value, context=context)
+
+
+def build_schema(schema_class):
+    geo = schema_class()
+    geo.add('lat', IntegerValidator())
+    geo.add('lon', IntegerValidator())
+    address = schema_class()
+    address.add('street', StringValidator())
+    address.add('city', StringValidator())
+    address.add('geo', geo)
+    person = SchemaValidator()
+    person.add('name', StringValidator())
+    person.add('age', IntegerValidator())
+    person.add('home', address)
+    person.add('work', address)
+    return person
+
+
+def processing(schema, payload):
+    def process():
+        try:
+            schema.process(payload)
+        except InvalidDataError:
+            pass
+    return process
+
+
+def main():
+    address = {'street': 'Main Street', 'city': 'Springfield', 'geo': {'lat': '1', 'lon': '2'}}
+    valid = {'name': 'Foo', 'age': '42', 'home': address, 'work': address}
+    invalid = valid.copy()
+    invalid['work'] = {'street': 'Main Street', 'city': None, 'geo': {'lat': 'x', 'lon': '2'}}
+    for title, schema_class in (('process() per level', OpaqueSchema), ('flattened', SchemaValidator)):
+        schema = build_schema(schema_class)
+        print_results(title, [
+            ('valid', time_per_call(processing(schema, valid))),
+            ('invalid', time_per_call(processing(schema, invalid))),
+        ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure how parallel batch validation scales with the number of worker 
+processes (Python 3.7+ only).
+
+    python3 benchmarks/parallel_benchmark.py [max_workers]
+"""
+
+import multiprocessing
+import sys
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.parallel import ParallelProcessor
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator, \
+    IntegerValidator
+
+
+class ContactSchema(SchemaValidator):
+    id = IntegerValidator()
+    email = EmailAddressValidator()
+    backup_email = EmailAddressValidator()
+    website = DomainNameValidator()
+    mail_server = DomainNameValidator()
+
+
+def records(nr_records):
+    values = []
+    for i in range(nr_records):
+        values.append({'id': str(i), 'email': 'user%d@example.com' % i, 
+                       'backup_email': 'backup%d@example.org' % i,
+                       'website': 'www%d.example.com' % i, 'mail_server': 'mx.example.com'})
+    return values
+
+
+def main():
+    max_workers = multiprocessing.cpu_count()
+    if len(sys.argv) > 1:
+        max_workers = int(sys.argv[1])
+    schema = ContactSchema()
+    values = records(20000)
+    
+    results = [('process_many() (single process)', time_per_call(lambda: schema.process_many(values), number=1))]
+    workers = 1
+    while workers <= max_workers:
+        processor = ParallelProcessor(schema, workers=workers, chunksize=500)
+        # start all worker processes before measuring
+        processor.process_many(values[:500 * workers])
+        try:
+            seconds = time_per_call(lambda: processor.process_many(values), number=1)
+        finally:
+            processor.shutdown()
+        results.append(('ParallelProcessor, %d worker(s)' % workers, seconds))
+        workers *= 2
+    print_results('ContactSchema, %d records (time per batch)' % len(values), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compare ``process_many()`` with a naive loop over ``process()`` for single 
+validators and schemas (with valid input only and with 10% invalid values).
+
+    python benchmarks/process_many_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import EmailAddressValidator, IntegerValidator, \
+    StringValidator
+
+
+class RecordSchema(SchemaValidator):
+    id = IntegerValidator()
+    name = StringValidator()
+    email = EmailAddressValidator()
+
+
+def integers(nr_values, invalid_every):
+    values = []
+    for i in xrange(nr_values):
+        if invalid_every and (i % invalid_every == 0):
+            values.append('invalid')
+        else:
+            values.append(str(i))
+    return values
+
+def records(nr_values, invalid_every):
+    values = []
+    for i in xrange(nr_values):
+        record = {'id': str(i), 'name': 'name %d' % i, 'email': 'user%d@example.com' % i}
+        if invalid_every and (i % invalid_every == 0):
+            record['email'] = 'invalid'
+        values.append(record)
+    return values
+
+
+def naive_loop(validator, values):
+    results = []
+    for value in values:
+        try:
+            results.append(validator.process(value))
+        except InvalidDataError, e:
+            results.append(e)
+    return results
+
+
+def main():
+    nr_values = 1000
+    for invalid_every, invalid_label in ((None, 'all valid'), (10, '10% invalid')):
+        for title, validator, values in (
+                    ('IntegerValidator', IntegerValidator(), integers(nr_values, invalid_every)), 
+                    ('SchemaValidator (3 fields)', RecordSchema(), records(nr_values, invalid_every))):
+            print_results('%s, %d values (%s)' % (title, nr_values, invalid_label), [
+                ('loop over process()', time_per_call(lambda: naive_loop(validator, values), number=10)),
+                ('process_many()', time_per_call(lambda: validator.process_many(values), number=10)),
+            ])
+
+
+if __name__ == '__main__':
+    main()
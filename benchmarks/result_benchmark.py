@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Compare the throughput of process() (raising InvalidDataError) with 
+check() (returning a ValidationResult) for a schema at 0%, 10% and 90% 
+invalid input.
+
+    python benchmarks/result_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import EmailAddressValidator, IntegerValidator, \
+    StringValidator
+
+
+class RecordSchema(SchemaValidator):
+    id = IntegerValidator()
+    name = StringValidator()
+    email = EmailAddressValidator()
+
+
+def records(invalid_percentage, number=100):
+    records = []
+    for i in range(number):
+        if i < invalid_percentage:
+            records.append({'id': 'x%d' % i, 'name': None, 'email': 'foo@example.com'})
+        else:
+            records.append({'id': str(i), 'name': 'foo', 'email': 'foo@example.com'})
+    return records
+
+
+def process_all(schema, values):
+    for value in values:
+        try:
+            schema.process(value)
+        except InvalidDataError:
+            pass
+
+
+def check_all(schema, values):
+    for value in values:
+        schema.check(value).is_valid()
+
+
+def main():
+    schema = RecordSchema()
+    for invalid_percentage in (0, 10, 90):
+        values = records(invalid_percentage)
+        print_results('%d%% invalid records (per record)' % invalid_percentage, [
+            ('process()', time_per_call(lambda: process_all(schema, values), number=100) / len(values)),
+            ('check()', time_per_call(lambda: check_all(schema, values), number=100) / len(values)),
+        ])
+
+
+if __name__ == '__main__':
+    main()
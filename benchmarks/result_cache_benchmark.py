@@ -0,0 +1,93 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Process the same webhook-like payload again and again (retries, duplicate 
+deliveries): schema without result cache versus a schema with 
+``enable_result_cache()`` (cache hits) and the overhead for cache misses 
+(every payload is different).
+
+    python benchmarks/result_cache_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import EmailAddressValidator, IntegerValidator, \
+    StringValidator
+
+
+def build_schema(cached):
+    schema = SchemaValidator()
+    schema.add('event', StringValidator())
+    schema.add('email', EmailAddressValidator())
+    for i in range(10):
+        schema.add('amount_%d' % i, IntegerValidator(min=0))
+        schema.add('label_%d' % i, StringValidator())
+    if cached:
+        schema.enable_result_cache(maxsize=10000)
+    return schema
+
+
+def build_payload(nr=0):
+    payload = {'event': 'order.created', 'email': 'foo@example.com'}
+    for i in range(10):
+        payload['amount_%d' % i] = str(nr + i)
+        payload['label_%d' % i] = 'label'
+    return payload
+
+
+def processing(schema, payloads):
+    state = {'index': 0}
+    def process():
+        state['index'] = (state['index'] + 1) % len(payloads)
+        try:
+            schema.process(payloads[state['index']])
+        except InvalidDataError:
+            pass
+    return process
+
+
+def main():
+    duplicates = [build_payload()] * 10
+    invalid = build_payload()
+    invalid['email'] = 'foo@@example.com'
+    unique = [build_payload(nr) for nr in range(20000)]
+    plain = build_schema(cached=False)
+    cached = build_schema(cached=True)
+    print_results('same payload (valid)', [
+        ('no cache', time_per_call(processing(plain, duplicates))),
+        ('result cache', time_per_call(processing(cached, duplicates))),
+    ])
+    print_results('same payload (invalid)', [
+        ('no cache', time_per_call(processing(plain, [invalid]))),
+        ('result cache', time_per_call(processing(cached, [invalid]))),
+    ])
+    print_results('different payloads (cache misses)', [
+        ('no cache', time_per_call(processing(plain, unique), number=5000)),
+        ('result cache', time_per_call(processing(cached, unique), number=5000)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Stream a few million records through a schema with ``validate_stream()`` 
+(every tenth record is invalid) and show that memory stays constant: The 
+number of records alive at the same time and the peak RSS of the process are
+reported after 10%, 50% and 100% of the records.
+
+    python benchmarks/stream_memory_benchmark.py [number of records]
+
+The default is 3,000,000 records (takes about a minute). Peak RSS is only 
+available on Unix.
+"""
+
+import sys
+import time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.stream import StreamStatistics, validate_stream
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class RecordSchema(SchemaValidator):
+    id = IntegerValidator()
+    name = StringValidator()
+
+
+class Record(dict):
+    "Counts how many records are alive at the same time."
+    alive = 0
+    max_alive = 0
+    
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        Record.alive += 1
+        Record.max_alive = max(Record.alive, Record.max_alive)
+    
+    def __del__(self):
+        Record.alive -= 1
+
+
+def records(nr_records):
+    for i in xrange(nr_records):
+        if i % 10 == 0:
+            yield Record(id='invalid', name='name %d' % i)
+        else:
+            yield Record(id=str(i), name='name %d' % i)
+
+
+def peak_rss():
+    if resource is None:
+        return 'n/a'
+    # kilobytes on Linux
+    return '%d KB' % resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main():
+    nr_records = 3000000
+    if len(sys.argv) > 1:
+        nr_records = int(sys.argv[1])
+    checkpoints = (nr_records // 10, nr_records // 2, nr_records)
+    statistics = StreamStatistics()
+    start = time.time()
+    stream = validate_stream(RecordSchema(), records(nr_records), statistics=statistics)
+    for index, result in stream:
+        if statistics.processed in checkpoints:
+            values = (statistics.processed, statistics.invalid, Record.max_alive, peak_rss())
+            print('%9d records (%d invalid): max. %d records alive, peak RSS %s' % values)
+    print('%.1f seconds' % (time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Benchmark suite for pycerberus: validator throughput, schemas with 10, 100 
+and 1000 fields, the error path (including translation), instantiation and 
+positional argument parsing. Everything runs locally without network access.
+
+    python benchmarks/suite.py                              # print results
+    python benchmarks/suite.py --output=results.json        # store results
+    python benchmarks/suite.py --compare=baseline.json      # flag regressions
+
+In compare mode the script exits with status 1 if any benchmark is slower than
+the baseline by more than the threshold (default: 10%). Use ``--filter`` to 
+run only benchmarks containing the given string.
+"""
+
+import json
+import optparse
+import platform
+import sys
+import time
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import SuperProxy
+from pycerberus.schema import SchemaValidator
+from pycerberus.schemas import PositionalArgumentsParsingSchema
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator, \
+    IntegerValidator, StringValidator
+
+
+__all__ = ['benchmarks', 'compare', 'main', 'run']
+
+# every benchmark should run for about this time (in seconds) per repetition
+target_duration = 0.1
+
+
+# -----------------------------------------------------------------------------
+# benchmark definitions
+
+def processing(validator, value, context=None):
+    def process():
+        return validator.process(value, context)
+    return process
+
+def failing(validator, value, context=None):
+    def process():
+        try:
+            validator.process(value, context)
+        except InvalidDataError:
+            pass
+    return process
+
+
+def schema_with_fields(nr_fields):
+    schema = SchemaValidator()
+    for i in range(nr_fields):
+        schema.add('field%04d' % i, IntegerValidator())
+    return schema
+
+def payload(nr_fields, invalid_fields=0):
+    fields = {}
+    for i in range(nr_fields):
+        fields['field%04d' % i] = str(i)
+    for i in range(invalid_fields):
+        fields['field%04d' % i] = 'invalid'
+    return fields
+
+
+class ContactSchema(SchemaValidator):
+    name = StringValidator()
+    age = IntegerValidator()
+    email = EmailAddressValidator()
+    website = DomainNameValidator()
+
+
+class ConfigSchema(PositionalArgumentsParsingSchema):
+    name = StringValidator()
+    port = IntegerValidator()
+    host = DomainNameValidator()
+    parameter_order = ('name', 'port', 'host')
+
+
+class Upper(object):
+    def method(self, value, context):
+        return value
+
+class SuperCall(Upper):
+    super = SuperProxy()
+    
+    def method(self, value, context):
+        return self.super(value, context)
+
+
+def benchmarks():
+    """Return a list of (group, [(name, function), ...]) tuples."""
+    groups = []
+    groups.append(('validators', [
+        ('IntegerValidator.process', processing(IntegerValidator(), '42')),
+        ('StringValidator.process', processing(StringValidator(), 'foo')),
+        ('DomainNameValidator.process', processing(DomainNameValidator(), 'www.example.com')),
+        ('EmailAddressValidator.process', processing(EmailAddressValidator(), 'foo@example.com')),
+    ]))
+    schemas = []
+    for nr_fields in (10, 100, 1000):
+        schemas.append(('%d_fields' % nr_fields, 
+                        processing(schema_with_fields(nr_fields), payload(nr_fields))))
+    schemas.append(('100_fields_10_invalid', 
+                    failing(schema_with_fields(100), payload(100, invalid_fields=10))))
+    schemas.append(('ContactSchema', processing(ContactSchema(), 
+        {'name': 'Foo', 'age': '42', 'email': 'foo@example.com', 'website': 'example.com'})))
+    groups.append(('schemas', schemas))
+    groups.append(('errors', [
+        ('IntegerValidator.invalid.en', failing(IntegerValidator(), 'foo', {'locale': 'en'})),
+        ('IntegerValidator.invalid.de', failing(IntegerValidator(), 'foo', {'locale': 'de'})),
+        ('IntegerValidator.too_big.de', failing(IntegerValidator(max=10), '42', {'locale': 'de'})),
+        ('EmailAddressValidator.invalid.de', failing(EmailAddressValidator(), 'foo', {'locale': 'de'})),
+        ('IntegerValidator.invalid.lazy', failing(IntegerValidator(), 'foo', {'lazy_messages': True})),
+    ]))
+    groups.append(('instantiation', [
+        ('IntegerValidator()', IntegerValidator),
+        ('EmailAddressValidator()', EmailAddressValidator),
+        ('ContactSchema()', ContactSchema),
+        ('SchemaValidator with 100 fields', lambda: schema_with_fields(100)),
+    ]))
+    super_call = SuperCall()
+    groups.append(('super', [
+        ('self.super(value, context)', lambda: super_call.method(42, None)),
+    ]))
+    groups.append(('parsing', [
+        ('PositionalArgumentsParsingSchema.process', processing(ConfigSchema(), 'foo, 8080, example.com')),
+    ]))
+    return groups
+
+
+# -----------------------------------------------------------------------------
+# running benchmarks
+
+def calibrated_number(function):
+    """Return the number of calls needed to run for about 
+    ``target_duration``."""
+    number = 1
+    while True:
+        start = time.time()
+        for i in range(number):
+            function()
+        duration = time.time() - start
+        if duration >= target_duration / 10:
+            break
+        number *= 10
+    return max(1, int(number * target_duration / max(duration, 1e-9)))
+
+
+def run(name_filter=None, repeat=3):
+    """Run all benchmarks (optionally only those which contain 
+    ``name_filter``) and return a dict which maps the benchmark names to the 
+    time per call (in seconds)."""
+    results = {}
+    for group, group_benchmarks in benchmarks():
+        group_results = []
+        for name, function in group_benchmarks:
+            name = '%s.%s' % (group, name)
+            if (name_filter is not None) and (name_filter not in name):
+                continue
+            seconds = time_per_call(function, number=calibrated_number(function), repeat=repeat)
+            results[name] = seconds
+            group_results.append((name, seconds))
+        if group_results:
+            print_results(group, group_results)
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    """Compare the results with the baseline (both dicts as returned by 
+    ``run()``), print a table and return the names of all benchmarks which are
+    slower than the baseline by more than ``threshold``."""
+    regressions = []
+    names = [name for name in sorted(results) if name in baseline]
+    if not names:
+        print('No common benchmarks in baseline.')
+        return regressions
+    label_width = max([len(name) for name in names])
+    print('%s  %13s  %13s  %7s' % ('benchmark'.ljust(label_width), 'baseline', 'current', 'change'))
+    for name in names:
+        ratio = results[name] / baseline[name]
+        status = ''
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = 'faster'
+        print('%s  %10.2f µs  %10.2f µs  %+6.1f%%  %s' % (name.ljust(label_width), 
+              baseline[name] * 1000000, results[name] * 1000000, (ratio - 1) * 100, status))
+    return regressions
+
+
+def main(argv=None):
+    parser = optparse.OptionParser(usage='%prog [options]')
+    parser.add_option('-o', '--output', help='write results as JSON to this file')
+    parser.add_option('-c', '--compare', help='compare results with this JSON file')
+    parser.add_option('-t', '--threshold', type='float', default=10.0, 
+                      help='max. allowed slowdown in percent (default: %default)')
+    parser.add_option('-f', '--filter', dest='name_filter', 
+                      help='run only benchmarks whose name contains this string')
+    parser.add_option('-r', '--repeat', type='int', default=3, 
+                      help='repetitions per benchmark, best is used (default: %default)')
+    options, arguments = parser.parse_args(argv)
+    
+    results = run(name_filter=options.name_filter, repeat=options.repeat)
+    if options.output:
+        data = {
+            'python': platform.python_version(), 
+            'platform': platform.platform(), 
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'results': results,
+        }
+        output_file = open(options.output, 'w')
+        try:
+            json.dump(data, output_file, indent=2, sort_keys=True)
+        finally:
+            output_file.close()
+    if options.compare:
+        baseline_file = open(options.compare, 'r')
+        try:
+            baseline = json.load(baseline_file)['results']
+        finally:
+            baseline_file.close()
+        regressions = compare(results, baseline, threshold=options.threshold / 100)
+        if regressions:
+            print('\n%d regression(s) detected.' % len(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure the overhead of ``self.super()`` compared to a plain ``super()`` 
+call - with the caching SuperProxy as well as the old IntrospectingSuperProxy 
+(which resolves everything on each call).
+
+    python benchmarks/super_call_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.api import BaseValidator
+from pycerberus.lib import IntrospectingSuperProxy, SuperProxy
+from pycerberus.validators import DomainNameValidator, IntegerValidator
+
+
+class Upper(object):
+    def method(self, value, context):
+        return value
+
+
+class PlainSuper(Upper):
+    def method(self, value, context):
+        return super(PlainSuper, self).method(value, context)
+
+
+class WithoutArguments(Upper):
+    def method(self, value, context):
+        return self.super()
+
+
+class ExplicitArguments(Upper):
+    def method(self, value, context):
+        return self.super(value, context)
+
+
+def method_call_results(proxy):
+    WithoutArguments.super = proxy
+    ExplicitArguments.super = proxy
+    without_arguments = WithoutArguments()
+    explicit_arguments = ExplicitArguments()
+    return [
+        ('self.super()', time_per_call(lambda: without_arguments.method(42, {}))),
+        ('self.super(value, context)', time_per_call(lambda: explicit_arguments.method(42, {}))),
+    ]
+
+
+def validator_results(proxy):
+    BaseValidator.super = proxy
+    validator = DomainNameValidator()
+    try:
+        return [
+            ('IntegerValidator()', time_per_call(IntegerValidator, number=2000)),
+            ('DomainNameValidator().process()', time_per_call(lambda: validator.process('example.com'), number=2000)),
+        ]
+    finally:
+        BaseValidator.super = SuperProxy()
+
+
+def main():
+    plain = PlainSuper()
+    print_results('super() without proxy', [
+        ('super(Class, self).method(value, context)', time_per_call(lambda: plain.method(42, {}))),
+    ])
+    for title, proxy in (('IntrospectingSuperProxy (before)', IntrospectingSuperProxy()),
+                         ('SuperProxy (after)', SuperProxy())):
+        print_results(title, method_call_results(proxy) + validator_results(proxy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Process a schema with 8 fields which wait 2 ms for a (simulated) local 
+service and 20 CPU-only fields: ``schema.process()`` versus a 
+``ThreadedProcessor`` (with and without a concurrency limit).
+
+    python benchmarks/threaded_benchmark.py
+"""
+
+import time
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.schema import SchemaValidator
+from pycerberus.threaded import ThreadedProcessor
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class LookupValidator(StringValidator):
+    blocking = True
+    
+    def validate(self, value, context):
+        # simulates a request to a local cache daemon
+        time.sleep(0.002)
+
+
+def build_schema(nr_blocking=8, nr_inline=20):
+    schema = SchemaValidator()
+    for i in range(nr_blocking):
+        schema.add('lookup_%d' % i, LookupValidator())
+    for i in range(nr_inline):
+        schema.add('number_%d' % i, IntegerValidator())
+    return schema
+
+
+def build_payload(schema):
+    payload = {}
+    for name in schema.fieldvalidators():
+        if name.startswith('lookup_'):
+            payload[name] = 'key'
+        else:
+            payload[name] = '42'
+    return payload
+
+
+def main():
+    schema = build_schema()
+    payload = build_payload(schema)
+    threaded = ThreadedProcessor(schema)
+    limited = ThreadedProcessor(schema, max_concurrency=4)
+    print_results('8 blocking fields (2 ms each), 20 inline fields', [
+        ('schema.process()', time_per_call(lambda: schema.process(payload), number=50)),
+        ('ThreadedProcessor', time_per_call(lambda: threaded.process(payload), number=50)),
+        ('ThreadedProcessor(max_concurrency=4)', time_per_call(lambda: limited.process(payload), number=50)),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Measure error-heavy validation throughput (every value is invalid so each 
+call has to translate an error message) with the process-wide catalog cache 
+and without it (cache invalidated before each call, like before).
+
+    python benchmarks/translation_cache_benchmark.py
+"""
+
+from benchmark_util import print_results, time_per_call
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.i18n import catalog_cache
+from pycerberus.validators import IntegerValidator
+
+
+def validate_invalid(validator, context):
+    try:
+        validator.process('invalid', context=context)
+    except InvalidDataError:
+        pass
+
+
+def results(locale, use_cache):
+    validator = IntegerValidator()
+    context = {'locale': locale}
+    if use_cache:
+        catalog_cache.warm_up('pycerberus', [locale])
+        function = lambda: validate_invalid(validator, context)
+    else:
+        def function():
+            catalog_cache.invalidate()
+            validate_invalid(validator, context)
+    return ('locale %r' % locale, time_per_call(function, number=2000))
+
+
+def main():
+    for title, use_cache in (('without catalog cache (before)', False), 
+                             ('with catalog cache (after)', True)):
+        print_results(title, [results('en', use_cache), results('de', use_cache)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""asyncio support for validators (Python 3.5+ only).
+
+Use ``await validator.aprocess(value, context)`` to process a value in a 
+coroutine. ``convert()``, ``validate()`` (and ``process()``) of your validators
+may be coroutines (``async def``) then, e.g. if a validator needs to check a 
+value against an external service. The same is true for form validators.
+
+Schemas process all fields with synchronous validators directly (without any 
+event loop overhead) while the fields with asynchronous validators are 
+processed concurrently (``asyncio.gather()``). Errors are aggregated exactly
+like ``process()`` does. Schemas without any asynchronous validator just call
+``process()``. Schemas with asynchronous validators can not be processed if 
+they override ``process()``, ``convert()`` or one of the processing helpers 
+(or strip their input) because these would get coroutines instead of values.
+The result cache (``enable_result_cache()``) is not used for these schemas.
+
+``ForEachValidator`` processes all items concurrently if its item validator is
+asynchronous (only lists and other sequences, iterators are not supported).
+
+In fail-fast mode the synchronous fields are processed first (cheapest first),
+remaining asynchronous fields are cancelled as soon as one of them fails."""
+
+import asyncio
+import inspect
+import weakref
+
+from pycerberus.api import is_implemented_by, BaseValidator, Validator
+from pycerberus.errors import EmptyError, InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators.foreach import ForEachValidator
+
+__all__ = ['aprocess', 'is_async']
+
+
+def _is_coroutine_method(validator, name):
+    return inspect.iscoroutinefunction(getattr(validator, name, None))
+
+def is_async(validator):
+    """Return True if the validator (or for schemas: any field/form validator)
+    needs to await something."""
+    if isinstance(validator, SchemaValidator):
+        return _async_plan(validator).is_async
+    if isinstance(validator, ForEachValidator) and is_async(validator.validator()):
+        return True
+    for name in ('aprocess', 'process', 'convert', 'validate'):
+        if _is_coroutine_method(validator, name):
+            return True
+    return False
+
+
+async def aprocess(validator, value, context=None):
+    "Coroutine version of ``validator.process(value, context)``."
+    if isinstance(validator, SchemaValidator):
+        return await aprocess_schema(validator, value, context)
+    elif isinstance(validator, ForEachValidator) and is_async(validator.validator()):
+        return await aprocess_foreach(validator, value, context)
+    elif isinstance(validator, Validator):
+        return await aprocess_validator(validator, value, context)
+    result = validator.process(value, context)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def aprocess_validator(validator, value, context=None, convert=None):
+    if context is None:
+        context = {}
+    if convert is None:
+        convert = validator.convert
+    if not is_implemented_by(validator.process, Validator, 'process'):
+        result = validator.process(value, context)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    # same steps as Validator.process()
+    if validator._strip_input and hasattr(value, 'strip'):
+        value = value.strip()
+    value = super(Validator, validator).process(value, context)
+    if validator.is_empty(value, context) == True:
+        if validator.is_required() == True:
+            validator.error('empty', value, context, errorclass=EmptyError)
+        return validator.empty_value(context)
+    converted_value = convert(value, context)
+    if inspect.isawaitable(converted_value):
+        converted_value = await converted_value
+    result = validator.validate(converted_value, context)
+    if inspect.isawaitable(result):
+        await result
+    return converted_value
+
+
+async def aprocess_foreach(validator, value, context=None):
+    "Process a list with a ``ForEachValidator`` for an asynchronous validator."
+    if not is_implemented_by(validator.convert, ForEachValidator, 'convert'):
+        raise NotImplementedError('%r overrides convert() so it can not await its items' % validator)
+    async def convert(value, context):
+        return await _aconvert_items(validator, value, context)
+    return await aprocess_validator(validator, value, context, convert=convert)
+
+
+async def _aconvert_items(validator, items, context):
+    # same steps as ForEachValidator.convert()
+    if validator._is_iterator(items, context):
+        raise NotImplementedError('iterators can not be processed lazily with an asynchronous validator')
+    validator._check_length(items, len(items), context)
+    item_validator = validator.validator()
+    errors = {}
+    if validator.max_errors is None:
+        coroutines = [aprocess(item_validator, item, context) for item in items]
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, InvalidDataError):
+                errors[index] = result
+            elif isinstance(result, BaseException):
+                raise result
+    else:
+        # the number of errors limits how many items are processed
+        results = []
+        for index, item in enumerate(items):
+            try:
+                results.append(await aprocess(item_validator, item, context))
+            except InvalidDataError as e:
+                errors[index] = e
+                if len(errors) >= validator.max_errors:
+                    break
+    if len(errors) > 0:
+        validator._raise_item_errors(errors, context)
+    return results
+
+
+class AsyncPlan(object):
+    """Splits the execution plan of a schema in fields which can be processed
+    synchronously and fields which need to be awaited."""
+    
+    def __init__(self, schema, plan):
+        self.plan = plan
+        self.sync_fields = []
+        self.async_fields = []
+        async_names = set()
+        for name, validator in schema.fieldvalidators().items():
+            if is_async(validator):
+                self.async_fields.append((name, validator))
+                async_names.add(name)
+            else:
+                self.sync_fields.append((name, validator.process, validator.empty_value))
+        self.sync_fields_by_cost = [step for step in plan.fields_by_cost if step[0] not in async_names]
+        self.formvalidators = []
+        for formvalidator in schema.formvalidators():
+            self.formvalidators.append((formvalidator, is_async(formvalidator)))
+        has_async_formvalidators = True in [needs_await for fv, needs_await in self.formvalidators]
+        self.is_async = bool(self.async_fields) or has_async_formvalidators
+
+# AsyncPlan for each ExecutionPlan (a new plan is compiled whenever the schema
+# changes so this can never contain outdated information)
+_async_plans = weakref.WeakKeyDictionary()
+
+def _async_plan(schema):
+    plan = schema.compile()
+    async_plan = _async_plans.get(plan)
+    if async_plan is None:
+        async_plan = AsyncPlan(schema, plan)
+        _async_plans[plan] = async_plan
+    return async_plan
+
+
+async def _aprocess_field(key, validator, fields, context):
+    if key in fields:
+        original_value = fields[key]
+    else:
+        original_value = validator.empty_value(context)
+    return await validator.aprocess(original_value, context)
+
+
+async def _aprocess_fields_fail_fast(async_plan, fields, context):
+    async_plan.plan.check_additional_items(fields, context)
+    schema = async_plan.plan.schema
+    validated_fields = {}
+    for key, process, empty_value in async_plan.sync_fields_by_cost:
+        try:
+            if key in fields:
+                original_value = fields[key]
+            else:
+                original_value = empty_value(context)
+            validated_fields[key] = process(original_value, context)
+        except InvalidDataError as e:
+            schema._raise_exception({key: e}, context)
+    
+    key_for_task = {}
+    for key, validator in async_plan.async_fields:
+        task = asyncio.ensure_future(_aprocess_field(key, validator, fields, context))
+        key_for_task[task] = key
+    pending = set(key_for_task)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    validated_fields[key_for_task[task]] = task.result()
+                except InvalidDataError as e:
+                    schema._raise_exception({key_for_task[task]: e}, context)
+    finally:
+        for task in pending:
+            task.cancel()
+    return validated_fields
+
+
+async def aprocess_schema(schema, value, context=None):
+    if context is None:
+        context = {}
+    async_plan = _async_plan(schema)
+    if not async_plan.is_async:
+        if not schema._uses_default_processing():
+            # custom process() or convert() might be coroutines
+            return await aprocess_validator(schema, value, context)
+        return schema.process(value, context)
+    if not schema._has_default_processing_methods():
+        message = '%r uses custom processing so it can not await its (asynchronous) validators' % schema
+        raise NotImplementedError(message)
+    
+    # same steps as SchemaValidator.convert()
+    fields = value
+    if fields is None:
+        return schema.empty_value(context)
+    if not isinstance(fields, dict):
+        schema.error('invalid_type', fields, context, classname=fields.__class__)
+    
+    if async_plan.plan.is_fail_fast(context):
+        validated_fields = await _aprocess_fields_fail_fast(async_plan, fields, context)
+        return await _aprocess_formvalidators(async_plan, validated_fields, context)
+    
+    results = {}
+    for key, process, empty_value in async_plan.sync_fields:
+        try:
+            if key in fields:
+                original_value = fields[key]
+            else:
+                original_value = empty_value(context)
+            results[key] = process(original_value, context)
+        except InvalidDataError as e:
+            results[key] = e
+    coroutines = [_aprocess_field(key, validator, fields, context) for key, validator in async_plan.async_fields]
+    async_results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for (key, validator), result in zip(async_plan.async_fields, async_results):
+        if isinstance(result, BaseException) and not isinstance(result, InvalidDataError):
+            raise result
+        results[key] = result
+    
+    # aggregate results in the same order as the synchronous plan
+    validated_fields = {}
+    exceptions = {}
+    for key, process, empty_value in async_plan.plan.fields:
+        result = results[key]
+        if isinstance(result, InvalidDataError):
+            exceptions[key] = result
+        else:
+            validated_fields[key] = result
+    validated_fields = async_plan.plan.check_field_results(fields, validated_fields, exceptions, context)
+    return await _aprocess_formvalidators(async_plan, validated_fields, context)
+
+
+async def _aprocess_formvalidators(async_plan, validated_fields, context):
+    for formvalidator, needs_await in async_plan.formvalidators:
+        if not needs_await:
+            validated_fields = formvalidator.process(validated_fields, context=context)
+        elif isinstance(formvalidator, BaseValidator):
+            validated_fields = await formvalidator.aprocess(validated_fields, context)
+        else:
+            validated_fields = await formvalidator.process(validated_fields, context=context)
+    return validated_fields
@@ -23,12 +23,14 @@
 # THE SOFTWARE.
 
 import inspect
+import sys
 
 from pycerberus.compat import reversed, set
 from pycerberus.errors import EmptyError, InvalidArgumentsError, InvalidDataError, \
-    ThreadSafetyError
+    LazyMessage, ThreadSafetyError
 from pycerberus.i18n import _, GettextTranslation
 from pycerberus.lib import SuperProxy
+from pycerberus.result import ColumnResult, ValidationResult
 
 __all__ = ['BaseValidator', 'Validator']
 
@@ -37,6 +39,13 @@ class NoValueSet(object):
     pass
 
 
+def is_implemented_by(method, klass, name):
+    """Return True if the (bound) method is the implementation of ``name`` 
+    which was defined in ``klass`` (and not overridden in a subclass)."""
+    function = getattr(method, 'im_func', getattr(method, '__func__', None))
+    return function is klass.__dict__[name]
+
+
 class EarlyBindForMethods(type):
     
     super = SuperProxy()
@@ -118,11 +127,98 @@ class BaseValidator(object):
         In case of errors a ``InvalidDataError`` is thrown."""
         return value
     
+    def process_many(self, values, context=None):
+        """Process all items of the iterable ``values`` and return a list which
+        contains either the (Python) representation of each value or the 
+        ``InvalidDataError`` which was raised for that value. This method will
+        not raise an exception for invalid values.
+        
+        All values are processed with the same ``context``."""
+        if context is None:
+            context = {}
+        process = self.process
+        results = []
+        append = results.append
+        for value in values:
+            try:
+                append(process(value, context))
+            except InvalidDataError, e:
+                append(e)
+        return results
+    
+    def process_column(self, column, context=None):
+        """Process all values of the sequence ``column`` (e.g. a column of a 
+        CSV file) and return a ``ColumnResult`` with the converted values and
+        the indices of all invalid cells. This method will not raise an 
+        exception for invalid values.
+        
+        The default implementation processes each cell separately, some 
+        validators (e.g. the ``IntegerValidator``) provide a faster 
+        implementation which handles the whole column at once."""
+        context = self._context_for_check(context)
+        values = []
+        append = values.append
+        failures = {}
+        errors = {}
+        index = 0
+        for result in self.process_many(column, context):
+            if isinstance(result, InvalidDataError):
+                failures[index] = (result.key(), result.value())
+                errors[index] = result
+                result = None
+            append(result)
+            index += 1
+        return ColumnResult(values, failures, errors=errors, validator=self, context=context)
+    
+    def check(self, value, context=None):
+        """Validate the value like ``process()`` but return a 
+        ``ValidationResult`` instead of raising an exception for invalid 
+        values. Error messages are translated only when you read them (see 
+        'lazy_messages').
+        
+        Use this method if many values are invalid and you don't need all
+        details about each error."""
+        context = self._context_for_check(context)
+        try:
+            return ValidationResult(self.process(value, context))
+        except InvalidDataError, e:
+            return ValidationResult(error=e)
+    
+    def _context_for_check(self, context):
+        if context is None:
+            return {'lazy_messages': True}
+        elif context.get('lazy_messages'):
+            return context
+        context = context.copy()
+        context['lazy_messages'] = True
+        return context
+    
+    def aprocess(self, value, context=None):
+        """Coroutine version of ``process()``: Use 
+        ``await validator.aprocess(value)`` if some of your validators need to 
+        await something (``convert()``, ``validate()`` and form validators may
+        be coroutines then). Requires Python 3.5+, see ``pycerberus.aio``."""
+        if sys.version_info < (3, 5):
+            # pycerberus.aio can not even be imported (async syntax)
+            raise NotImplementedError('aprocess() requires Python 3.5 or newer')
+        from pycerberus.aio import aprocess
+        return aprocess(self, value, context)
+    
     def as_string(self, value, context=None):
         """Return the (Python) value as string which could be converted back to
         the given value using this validator. This is useful for widget 
         libraries like ToscaWidgets."""
         return str(value)
+    
+    def is_pure(self):
+        """Return True if the result of ``process()`` only depends on the 
+        input value and the locale (no side effects, no external state like 
+        a database). Only pure validators can be memoized 
+        (see ``MemoizingValidator``).
+        
+        The built-in validators are pure only if they are not subclassed 
+        because subclasses might add checks which are not pure."""
+        return False
 
 
 class Validator(BaseValidator):
@@ -178,6 +274,18 @@ class Validator(BaseValidator):
         return (self._default is not NoValueSet)
     
     def _freeze_implementations_for_class(self):
+        # The implementations only depend on the class hierarchy so they are 
+        # computed once per class and shared (read-only!) by all instances. 
+        # Changing the class hierarchy (e.g. assigning __bases__) creates a new
+        # __mro__ which invalidates the cached tables.
+        klass = self.__class__
+        cached = klass.__dict__.get('_implementations_cache')
+        if (cached is None) or (cached[0] is not klass.__mro__):
+            cached = (klass.__mro__, ) + self._build_implementations_for_class()
+            setattr(klass, '_implementations_cache', cached)
+        return cached[1], cached[2]
+    
+    def _build_implementations_for_class(self):
         class_for_key = {}
         implementations_for_class = {}
         known_functions = set()
@@ -185,8 +293,9 @@ class Validator(BaseValidator):
             if self._class_defines_custom_keys(cls, known_functions):
                 known_functions.add(cls.keys)
                 for key in cls.keys(self):
-                    class_for_key[key] = self._implementations_by_key(cls)
-                    implementations_for_class[cls] = class_for_key[key]
+                    if cls not in implementations_for_class:
+                        implementations_for_class[cls] = self._implementations_by_key(cls)
+                    class_for_key[key] = implementations_for_class[cls]
         return class_for_key, implementations_for_class
     
     def _implementations_by_key(self, cls):
@@ -205,7 +314,10 @@ class Validator(BaseValidator):
         return {'empty': _('Value must not be empty.')}
     
     def error(self, key, value, context, errorclass=InvalidDataError, **values):
-        translated_message = self.message(key, context, **values)
+        if context and context.get('lazy_messages'):
+            translated_message = LazyMessage(self, key, context, values)
+        else:
+            translated_message = self.message(key, context, **values)
         raise errorclass(translated_message, value, key=key, context=context)
     
     def process(self, value, context=None):
@@ -222,6 +334,63 @@ class Validator(BaseValidator):
         self.validate(converted_value, context)
         return converted_value
     
+    def process_many(self, values, context=None):
+        if not is_implemented_by(self.process, Validator, 'process'):
+            return self.super(values, context=context)
+        if context is None:
+            context = {}
+        # same steps as process() but all lookups are done only once
+        strip_input = self._strip_input
+        super_process = super(Validator, self).process
+        if is_implemented_by(super_process, BaseValidator, 'process'):
+            super_process = None
+        is_required = (self.is_required() == True)
+        is_empty = self.is_empty
+        empty_value = self.empty_value
+        convert = self.convert
+        validate = self.validate
+        
+        results = []
+        append = results.append
+        for value in values:
+            try:
+                if strip_input and hasattr(value, 'strip'):
+                    value = value.strip()
+                if super_process is not None:
+                    value = super_process(value, context)
+                if is_empty(value, context) == True:
+                    if is_required:
+                        self.error('empty', value, context, errorclass=EmptyError)
+                    append(empty_value(context))
+                    continue
+                converted_value = convert(value, context)
+                validate(converted_value, context)
+                append(converted_value)
+            except InvalidDataError, e:
+                append(e)
+        return results
+    
+    def check(self, value, context=None):
+        if not is_implemented_by(self.process, Validator, 'process'):
+            return self.super(value, context=context)
+        context = self._context_for_check(context)
+        # same steps as process() but empty values are handled without raising
+        # an exception
+        try:
+            if self._strip_input and hasattr(value, 'strip'):
+                value = value.strip()
+            value = super(Validator, self).process(value, context)
+            if self.is_empty(value, context) == True:
+                if self.is_required() == True:
+                    message = LazyMessage(self, 'empty', context, {})
+                    return ValidationResult(error=EmptyError(message, value, key='empty', context=context))
+                return ValidationResult(self.empty_value(context))
+            converted_value = self.convert(value, context)
+            self.validate(converted_value, context)
+        except InvalidDataError, e:
+            return ValidationResult(error=e)
+        return ValidationResult(converted_value)
+    
     # --------------------------------------------------------------------------
     # Defining a convenience API
     
@@ -304,5 +473,22 @@ class Validator(BaseValidator):
         self.__dict__[name] = value
     
     # -------------------------------------------------------------------------
+    # pickle support
+    
+    def __getstate__(self):
+        # The implementation table contains functions generated by the 
+        # metaclass which can not be pickled but it can be restored easily.
+        state = self.__dict__.copy()
+        del state['_implementations']
+        del state['_implementation_by_class']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        implementations, implementation_by_class = self._freeze_implementations_for_class()
+        self.__dict__['_implementations'] = implementations
+        self.__dict__['_implementation_by_class'] = implementation_by_class
+    
+    # -------------------------------------------------------------------------
 
 
@@ -25,7 +25,7 @@ for all versions of Python."""
 # THE SOFTWARE.
 
 
-__all__ = ['reversed', 'set']
+__all__ = ['frozenset', 'reversed', 'set']
 
 
 try:
@@ -41,3 +41,7 @@ try:
 except NameError:
     from sets import Set as set
 
+try:
+    frozenset = frozenset
+except NameError:
+    from sets import ImmutableSet as frozenset
@@ -22,15 +22,54 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from pycerberus.lib import AttrDict, SuperProxy
+from pycerberus.lib import SuperProxy
 
 __all__ = ['EmptyError', 'InvalidArgumentsError', 'InvalidDataError', 
-           'ThreadSafetyError', 'ValidationError']
+           'LazyMessage', 'ThreadSafetyError', 'ValidationError']
+
+
+class LazyMessage(object):
+    """Placeholder for an error message which is translated and formatted 
+    only when somebody reads it (the result is memoized). Validators raise 
+    errors with lazy messages if the context contains a true value for 
+    'lazy_messages'.
+    
+    Lazy messages are equal if validator class, message key, values and 
+    locale match. They are never equal to strings (not even to their own 
+    text) so comparing never translates a message."""
+    
+    def __init__(self, validator, key, context, values):
+        self.validator = validator
+        self.key = key
+        self.context = context
+        self.values = values
+        self._message = None
+    
+    def resolve(self):
+        if self._message is None:
+            self._message = self.validator.message(self.key, self.context, **self.values)
+        return self._message
+    
+    def _identity(self):
+        # everything the message text depends on
+        return (self.validator.__class__, self.key, self.values, (self.context or {}).get('locale'))
+    
+    def __eq__(self, other):
+        if not isinstance(other, LazyMessage):
+            return False
+        return self._identity() == other._identity()
+    
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    
+    def __hash__(self):
+        return hash((self.validator.__class__, self.key))
 
 
 
 class ValidationError(Exception):
     "All exceptions thrown by this library must be derived from this base class"
+    __slots__ = ('_msg',)
     
     def __init__(self, msg):
         # Exceptions are old-style classes so we need an explicit call the the
@@ -39,31 +78,80 @@ class ValidationError(Exception):
         self._msg = msg
     
     def msg(self):
+        msg = self._msg
+        if isinstance(msg, LazyMessage):
+            # the lazy message memoizes the text
+            return msg.resolve()
+        return msg
+    
+    def raw_msg(self):
+        """Return the message without resolving it (this may be a 
+        ``LazyMessage``)."""
         return self._msg
 
 
 class InvalidDataError(ValidationError):
     """All exceptions which were caused by data to be validated must be derived 
-    from this base class."""
+    from this base class.
+    
+    Batch validation may create a lot of these so the error stores its details
+    in slots (no closures, the instance dict which every exception has is only
+    created if somebody uses it). ``details()`` just returns the error itself.
+    
+    Messages are compared as they were raised (see ``LazyMessage``) so an 
+    error with a lazy message is never equal to an error with a translated 
+    message."""
+    __slots__ = ('_value', '_key', '_context', '_error_dict')
+    
     def __init__(self, msg, value, key=None, context=None, error_dict=None):
         ValidationError.__init__(self, msg)
-        self._details = AttrDict(key=lambda: key, msg=lambda: msg, 
-                                 value=lambda: value, context=lambda: context)
-        self._error_dict = error_dict or {}
+        self._value = value
+        self._key = key
+        self._context = context
+        # the (empty) error dict is created only if somebody asks for it
+        self._error_dict = error_dict or None
     
     def __repr__(self):
         cls_name = self.__class__.__name__
-        e = self.details()
-        values = (cls_name, repr(e.msg()), repr(e.value()), repr(e.key()), repr(e.context()))
+        values = (cls_name, repr(self.msg()), repr(self._value), repr(self._key), repr(self._context))
         return '%s(%s, %s, key=%s, context=%s)' % values
     __str__ = __repr__
     
+    def __reduce__(self):
+        arguments = (self.msg(), self._value, self._key, self._context, self._error_dict)
+        return (self.__class__, arguments)
+    
+    def __eq__(self, other):
+        if self.__class__ is not other.__class__:
+            return False
+        return (self._key == other._key) and (self._value == other._value) and \
+            (self._error_dict == other._error_dict) and (self._msg == other._msg)
+    
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    
+    def __hash__(self):
+        # values and error dicts might not be hashable
+        return hash((self.__class__, self._key))
+    
     def details(self):
-        """Return information about the *first* error."""
-        return self._details
+        """Return information about the *first* error (``key()``, ``msg()``, 
+        ``value()`` and ``context()``)."""
+        return self
+    
+    def key(self):
+        return self._key
+    
+    def value(self):
+        return self._value
+    
+    def context(self):
+        return self._context
     
     def error_dict(self):
         "Return all errors as an iterable."
+        if self._error_dict is None:
+            self._error_dict = {}
         return self._error_dict
     
     def error_for(self, field_name):
@@ -71,13 +159,13 @@ class InvalidDataError(ValidationError):
 
 
 class EmptyError(InvalidDataError):
-    pass
+    __slots__ = ()
 
 
 class InvalidArgumentsError(ValidationError):
-    pass
+    __slots__ = ()
 
 
 class ThreadSafetyError(ValidationError):
-    pass
+    __slots__ = ()
 
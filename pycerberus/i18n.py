@@ -25,22 +25,42 @@
 import gettext
 import os
 import sys
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
 
 from pkg_resources import resource_filename
 
-__all__ = ['_', 'GettextTranslation']
+from pycerberus.lib import LRUCache
 
+__all__ = ['_', 'catalog_cache', 'CatalogCache', 'GettextTranslation']
 
-class GettextTranslation(object):
+
+class CatalogCache(object):
+    """Process-wide cache for gettext catalogs (keyed by domain, locale dir and
+    locale) so that looking up a translation does not need to search the file 
+    system again. Catalogs are loaded on first use, you can load them in 
+    advance with ``warm_up()``. Call ``invalidate()`` if the catalog files 
+    changed.
     
-    def __init__(self, domain='messages', **kwargs):
-        self._gettext_domain = domain
-        self._gettext_args = kwargs
+    The cache keeps at most ``maxsize`` catalogs (least recently used catalogs
+    are dropped first) because the locale usually comes from user input (e.g.
+    an HTTP header). The cache is thread-safe."""
     
-    def _domain(self):
-        return self._gettext_domain
+    def __init__(self, maxsize=100):
+        self._catalogs = LRUCache(maxsize=maxsize)
+        self._default_localedir = None
+        self._lock = threading.Lock()
     
-    def _default_localedir(self):
+    def default_localedir(self):
+        localedir = self._default_localedir
+        if localedir is None:
+            localedir = self._find_default_localedir()
+            self._default_localedir = localedir
+        return localedir
+    
+    def _find_default_localedir(self):
         locale_dir_in_egg = resource_filename(__name__, "/locales")
         if os.path.exists(locale_dir_in_egg):
             return locale_dir_in_egg
@@ -49,6 +69,53 @@ class GettextTranslation(object):
             return locale_dir_on_filesystem
         return os.path.normpath('/usr/share/locale')
     
+    def catalog(self, domain, localedir, locale):
+        key = (domain, localedir, locale)
+        catalog = self._catalogs.get(key)
+        if catalog is not None:
+            return catalog
+        self._lock.acquire()
+        try:
+            catalog = self._catalogs.get(key)
+            if catalog is None:
+                catalog = gettext.translation(domain, localedir=localedir, 
+                                              languages=[locale], fallback=True)
+                self._catalogs.set(key, catalog)
+            return catalog
+        finally:
+            self._lock.release()
+    
+    def warm_up(self, domain, locales, localedir=None):
+        """Load the catalogs for the given domain and locales in advance."""
+        if localedir is None:
+            localedir = self.default_localedir()
+        for locale in locales:
+            self.catalog(domain, localedir, locale)
+    
+    def invalidate(self):
+        """Drop all cached catalogs (and the default locale dir)."""
+        self._lock.acquire()
+        try:
+            self._catalogs.clear()
+            self._default_localedir = None
+        finally:
+            self._lock.release()
+
+catalog_cache = CatalogCache()
+
+
+class GettextTranslation(object):
+    
+    def __init__(self, domain='messages', **kwargs):
+        self._gettext_domain = domain
+        self._gettext_args = kwargs
+    
+    def _domain(self):
+        return self._gettext_domain
+    
+    def _default_localedir(self):
+        return catalog_cache.default_localedir()
+    
     def _locale(self, context):
         return (context or {}).get('locale', 'en')
     
@@ -59,6 +126,11 @@ class GettextTranslation(object):
         return args
     
     def translation(self, context):
+        gettext_args = self._gettext_args
+        if (not gettext_args) or (len(gettext_args) == 1 and 'localedir' in gettext_args):
+            localedir = gettext_args.get('localedir') or self._default_localedir()
+            return catalog_cache.catalog(self._domain(), localedir, self._locale(context))
+        # custom arguments for gettext, can not use the cache
         return gettext.translation(self._domain(), fallback=True, **self._args(context))
     
     def _context_from_stack(self):
@@ -0,0 +1,259 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Optional instrumentation for schemas: call counts, latencies (cumulative 
+and percentiles) and errors by error key for every field (and for the schema
+as a whole), attributed to the schema name and the field name. For schemas 
+the number of skipped form validator runs (because a field was invalid, a 
+previous form validator failed or the outcome could be reused) is recorded 
+as well.
+
+The schema name is the module and class name of the schema unless you set a
+name (``SchemaValidator(instrumentation_name=...)`` or 
+``set_instrumentation_name()``) so all unnamed instances of a class share 
+their metrics. Only schemas are instrumented, validators which are used 
+outside of a schema are not recorded.
+
+Instrumentation is disabled by default and costs nothing then: After you 
+called ``enable()`` every execution plan is rebuilt with instrumented field 
+validators when it is used next, after ``disable()`` plans are rebuilt without
+instrumentation::
+
+    from pycerberus import instrumentation
+    
+    instrumentation.enable()
+    # ... process some data
+    print(instrumentation.registry.to_prometheus())
+    instrumentation.registry.reset()
+"""
+
+import timeit
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
+from pycerberus.errors import InvalidDataError
+
+__all__ = ['disable', 'enable', 'FieldMetrics', 'is_enabled', 'Registry', 
+           'registry']
+
+
+class FieldMetrics(object):
+    """Counters for a single field (or a schema if ``field`` is None). The 
+    percentiles are computed from the latest ``sample_size`` calls."""
+    
+    def __init__(self, schema, field, sample_size=1000):
+        self.schema = schema
+        self.field = field
+        self.sample_size = sample_size
+        self.reset()
+    
+    def reset(self):
+        self.calls = 0
+        self.errors = 0
+        self.errors_by_key = {}
+        self.skipped = 0
+        self.total_seconds = 0.0
+        self._samples = []
+        self._next_sample = 0
+    
+    def record(self, duration, error_key=None):
+        self.calls += 1
+        self.total_seconds += duration
+        if len(self._samples) < self.sample_size:
+            self._samples.append(duration)
+        else:
+            self._samples[self._next_sample] = duration
+            self._next_sample = (self._next_sample + 1) % self.sample_size
+        if error_key is not None:
+            self.errors += 1
+            self.errors_by_key[error_key] = self.errors_by_key.get(error_key, 0) + 1
+    
+    def record_skipped(self, count):
+        self.skipped += count
+    
+    def percentile(self, percent):
+        if not self._samples:
+            return None
+        samples = list(self._samples)
+        samples.sort()
+        index = int(round(percent / 100.0 * (len(samples) - 1)))
+        return samples[index]
+    
+    def snapshot(self):
+        return {
+            'schema': self.schema,
+            'field': self.field,
+            'calls': self.calls,
+            'errors': self.errors,
+            'errors_by_key': self.errors_by_key.copy(),
+            'skipped': self.skipped,
+            'total_seconds': self.total_seconds,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+        }
+
+
+class Registry(object):
+    """Collects ``FieldMetrics`` for all instrumented schemas (thread-safe)."""
+    
+    def __init__(self, sample_size=1000, timer=timeit.default_timer):
+        self.sample_size = sample_size
+        self.timer = timer
+        self._metrics = {}
+        self._lock = threading.Lock()
+    
+    def metrics_for(self, schema, field):
+        self._lock.acquire()
+        try:
+            key = (schema, field)
+            if key not in self._metrics:
+                self._metrics[key] = FieldMetrics(schema, field, sample_size=self.sample_size)
+            return self._metrics[key]
+        finally:
+            self._lock.release()
+    
+    def record(self, metrics, duration, error_key=None):
+        self._lock.acquire()
+        try:
+            metrics.record(duration, error_key)
+        finally:
+            self._lock.release()
+    
+    def record_skipped(self, metrics, count):
+        self._lock.acquire()
+        try:
+            metrics.record_skipped(count)
+        finally:
+            self._lock.release()
+    
+    def instrument(self, schema, field, process):
+        """Return a function which calls ``process`` and records its latency 
+        (and errors) for the given schema/field."""
+        metrics = self.metrics_for(schema, field)
+        timer = self.timer
+        record = self.record
+        def instrumented_process(value, context=None):
+            start = timer()
+            try:
+                result = process(value, context)
+            except InvalidDataError, e:
+                record(metrics, timer() - start, e.details().key())
+                raise
+            record(metrics, timer() - start)
+            return result
+        return instrumented_process
+    
+    def snapshot(self):
+        """Return a list of dicts (one for each field/schema) sorted by schema 
+        and field name."""
+        self._lock.acquire()
+        try:
+            # field is None for the schema itself (Python 3 can not compare 
+            # None and strings)
+            items = [((schema, field or ''), metrics) for (schema, field), metrics in self._metrics.items()]
+            items.sort()
+            return [metrics.snapshot() for key, metrics in items]
+        finally:
+            self._lock.release()
+    
+    def reset(self):
+        self._lock.acquire()
+        try:
+            for metrics in self._metrics.values():
+                metrics.reset()
+        finally:
+            self._lock.release()
+    
+    def to_json(self):
+        import json
+        return json.dumps(self.snapshot(), sort_keys=True)
+    
+    def to_prometheus(self, prefix='pycerberus_validation'):
+        """Return all metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        def add_header(name, metric_type, description):
+            lines.append('# HELP %s_%s %s' % (prefix, name, description))
+            lines.append('# TYPE %s_%s %s' % (prefix, name, metric_type))
+        def add_value(name, item, value, **labels):
+            label_values = [('schema', item['schema']), ('field', item['field'] or '')]
+            label_values.extend(labels.items())
+            label_string = ','.join(['%s="%s"' % (key, _escape(label)) for key, label in label_values])
+            lines.append('%s_%s{%s} %s' % (prefix, name, label_string, _format_number(value)))
+        
+        add_header('seconds', 'summary', 'Time spent in validation (field is empty for the whole schema).')
+        for item in snapshot:
+            for quantile, name in (('0.5', 'p50'), ('0.9', 'p90'), ('0.99', 'p99')):
+                value = item[name]
+                if value is not None:
+                    add_value('seconds', item, value, quantile=quantile)
+            add_value('seconds_sum', item, item['total_seconds'])
+            add_value('seconds_count', item, item['calls'])
+        add_header('errors_total', 'counter', 'Number of validation errors by error key.')
+        for item in snapshot:
+            keys = item['errors_by_key'].keys()
+            keys.sort()
+            for key in keys:
+                add_value('errors_total', item, item['errors_by_key'][key], key=key)
+        add_header('skipped_formvalidators_total', 'counter', 'Number of skipped form validator runs.')
+        for item in snapshot:
+            if item['field'] is None:
+                add_value('skipped_formvalidators_total', item, item['skipped'])
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_number(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+registry = Registry()
+# schemas compare the registry of their plan with the active registry so 
+# plans are rebuilt after enable()/disable()
+_active_registry = None
+
+
+def enable(new_registry=None):
+    """Enable instrumentation for all schemas (using the module-level 
+    ``registry`` if ``new_registry`` is None)."""
+    global _active_registry
+    if new_registry is None:
+        new_registry = registry
+    _active_registry = new_registry
+
+def disable():
+    global _active_registry
+    _active_registry = None
+
+def is_enabled():
+    return (_active_registry is not None)
+
+def active_registry():
+    return _active_registry
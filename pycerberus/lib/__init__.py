@@ -1,5 +1,6 @@
 
 from pycerberus.lib.attribute_dict import *
+from pycerberus.lib.lru_cache import *
 from pycerberus.lib.simple_super import *
 from pycerberus.lib.testcase import *
 
@@ -0,0 +1,202 @@
+# -*- coding: UTF-8 -*-
+
+# License: Public Domain
+# Authors: Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Version 1.1
+
+# 1.1 (17.10.2026)
+#   - optional time to live for entries (ttl)
+# 1.0 (17.10.2026)
+#   - initial release
+
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+import time
+from unittest import TestCase
+
+
+__all__ = ['LRUCache']
+
+
+class LRUCache(object):
+    """Thread-safe, size-bounded mapping which drops the least recently used 
+    items first. Works with Python 2.3+ (no OrderedDict needed).
+    
+    If ``ttl`` is set, entries expire ``ttl`` seconds after they were set 
+    (expired entries are dropped on access and count as misses)."""
+    
+    def __init__(self, maxsize=1000, ttl=None, timer=time.time):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._lock = threading.Lock()
+        self.clear()
+    
+    def clear(self):
+        self._lock.acquire()
+        try:
+            # key -> [previous, next, key, value, expiration time], the root 
+            # is a sentinel entry which links the most and least recently used
+            # items.
+            self._entries = {}
+            root = []
+            root[:] = [root, root, None, None, None]
+            self._root = root
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+        finally:
+            self._lock.release()
+    
+    def get(self, key, default=None):
+        self._lock.acquire()
+        try:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if (entry[4] is not None) and (entry[4] <= self.timer()):
+                self._unlink(entry)
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._unlink(entry)
+            self._append(entry)
+            return entry[3]
+        finally:
+            self._lock.release()
+    
+    def set(self, key, value):
+        expires = None
+        if self.ttl is not None:
+            expires = self.timer() + self.ttl
+        self._lock.acquire()
+        try:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[3] = value
+                entry[4] = expires
+                self._unlink(entry)
+                self._append(entry)
+                return
+            if len(self._entries) >= self.maxsize:
+                oldest = self._root[1]
+                self._unlink(oldest)
+                del self._entries[oldest[2]]
+                self.evictions += 1
+            entry = [None, None, key, value, expires]
+            self._append(entry)
+            self._entries[key] = entry
+        finally:
+            self._lock.release()
+    
+    def _unlink(self, entry):
+        previous, next_ = entry[0], entry[1]
+        previous[1] = next_
+        next_[0] = previous
+    
+    def _append(self, entry):
+        root = self._root
+        last = root[0]
+        entry[0] = last
+        entry[1] = root
+        last[1] = entry
+        root[0] = entry
+    
+    def keys(self):
+        "Return all keys (least recently used first)."
+        self._lock.acquire()
+        try:
+            keys = []
+            entry = self._root[1]
+            while entry is not self._root:
+                keys.append(entry[2])
+                entry = entry[1]
+            return keys
+        finally:
+            self._lock.release()
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 
+                'expirations': self.expirations, 'size': len(self._entries), 
+                'maxsize': self.maxsize}
+
+
+class LRUCacheTests(TestCase):
+    
+    def test_can_store_and_retrieve_items(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('foo', 1)
+        self.assertEqual(1, cache.get('foo'))
+        self.assertEqual(None, cache.get('bar'))
+        self.assertEqual(42, cache.get('bar', 42))
+        self.assertEqual(1, len(cache))
+        self.assertTrue('foo' in cache)
+    
+    def test_drops_least_recently_used_item(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        cache.set('baz', 3)
+        self.assertEqual(['foo', 'baz'], cache.keys())
+        self.assertEqual(None, cache.get('bar'))
+    
+    def test_setting_existing_key_updates_value(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.set('foo', 3)
+        self.assertEqual(['bar', 'foo'], cache.keys())
+        self.assertEqual(3, cache.get('foo'))
+    
+    def test_keeps_statistics(self):
+        cache = LRUCache(maxsize=1)
+        cache.get('foo')
+        cache.set('foo', 1)
+        cache.get('foo')
+        cache.set('bar', 2)
+        self.assertEqual({'hits': 1, 'misses': 1, 'evictions': 1, 'expirations': 0, 
+                          'size': 1, 'maxsize': 1}, cache.stats())
+    
+    def test_can_clear_cache(self):
+        cache = LRUCache()
+        cache.set('foo', 1)
+        cache.get('foo')
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual([], cache.keys())
+    
+    def test_entries_can_expire(self):
+        now = [100]
+        cache = LRUCache(ttl=10, timer=lambda: now[0])
+        cache.set('foo', 1)
+        now[0] = 109
+        self.assertEqual(1, cache.get('foo'))
+        now[0] = 110
+        self.assertEqual(None, cache.get('foo'))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.expirations)
+        self.assertEqual(1, cache.misses)
+        
+        cache.set('foo', 2)
+        self.assertEqual(2, cache.get('foo'))
+    
+    def test_rejects_invalid_size(self):
+        self.assertRaises(ValueError, LRUCache, 0)
+
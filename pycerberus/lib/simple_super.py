@@ -4,7 +4,7 @@
 # License: Public Domain
 # Authors: Martin Häcker, Felix Schwarz
 
-# Version 1.0.5
+# Version 1.1.0
 
 # This is how it works:
 # In the superclass of the class where you want to use this
@@ -25,6 +25,13 @@
 # - Package it all up nicely so it's super easy to use
 
 # Changelog
+# 1.1.0 (2026-10-17)
+#   - SuperProxy caches the super class, the detection of explicit arguments
+#     and the argument forwarding strategy so repeated calls don't need to 
+#     inspect source code or argument specs anymore. The old implementation 
+#     is still available as IntrospectingSuperProxy.
+#   - Python 3: find the caller's class without relying on inspect internals
+#
 # 1.0.5 (2010-06-12)
 #   - Avoid exception if no source code could be found
 #
@@ -48,7 +55,7 @@
 # 1.0
 #   - initial release
 
-__all__ = ['SuperProxy']
+__all__ = ['IntrospectingSuperProxy', 'SuperProxy']
 
 import inspect
 import re
@@ -102,7 +109,7 @@ class SmartMethodCall(object):
         if not inspect.isroutine(self._method):
             # special treatment of object's __init__
             return ([], {})
-        (args, varargs, varkw, defaults) = inspect.getargspec(self._method)
+        (args, varargs, varkw) = _method_argspec(self._method)
         if len(args) == 1 and varargs is None: # just self
             return ([], {})
         return self._find_arguments_for_called_method()
@@ -110,7 +117,7 @@ class SmartMethodCall(object):
     def _find_arguments_for_called_method(self):
         caller_frame = sys._getframe(3+2)
         caller_arg_names, caller_varg_name, caller_kwarg_name, caller_arg_values = inspect.getargvalues(caller_frame)
-        (callee_arg_names, callee_varargs, callee_kwarg_name, callee_defaults) = inspect.getargspec(self._method)
+        (callee_arg_names, callee_varargs, callee_kwarg_name) = _method_argspec(self._method)
         
         vargs = []
         kwargs = {}
@@ -165,8 +172,7 @@ class SuperFinder(object):
         return False
     
     def _points_to_this_function_py3k(self, code, func):
-        other_code = inspect.getmembers(func)[4][1]
-        return id(code) == id(other_code)
+        return _code_for(_function_for(func)) is code
 
     def _find_class(self, instance, code):
         method_name = code.co_name
@@ -177,8 +183,10 @@ class SuperFinder(object):
                     return klass
 
 
-class SuperProxy(object):
-    "This has as few methods as possible, to serve as an ideal proxy."
+class IntrospectingSuperProxy(object):
+    """Reference implementation which resolves the super method and its 
+    arguments on every call. Use SuperProxy unless you want to measure the 
+    overhead of the caching."""
     
     def __call__(self, *vargs, **kwargs):
         method = SuperFinder().super_method()
@@ -188,6 +196,180 @@ class SuperProxy(object):
         return SuperFinder().super_method(method_name=method_name)
 
 
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
+
+
+def _function_for(method):
+    # (un)bound methods wrap the actual function object
+    return getattr(method, 'im_func', getattr(method, '__func__', method))
+
+def _code_for(function):
+    return getattr(function, 'func_code', getattr(function, '__code__', None))
+
+def _argspec(code):
+    nr_args = code.co_argcount + getattr(code, 'co_kwonlyargcount', 0)
+    arg_names = list(code.co_varnames[:nr_args])
+    varg_name = None
+    kwarg_name = None
+    if code.co_flags & CO_VARARGS:
+        varg_name = code.co_varnames[nr_args]
+        nr_args += 1
+    if code.co_flags & CO_VARKEYWORDS:
+        kwarg_name = code.co_varnames[nr_args]
+    return arg_names, varg_name, kwarg_name
+
+def _method_argspec(method):
+    code = _code_for(_function_for(method))
+    if code is None:
+        return inspect.getargspec(method)[:3]
+    return _argspec(code)
+
+
+class ForwardArguments(object):
+    """Knows which arguments of the caller must be passed to the super method
+    (same heuristic as SmartMethodCall._find_arguments_for_called_method)."""
+    
+    def __init__(self, caller_code, callee_arg_names):
+        caller_arg_names, self.varg_name, self.kwarg_name = _argspec(caller_code)
+        # [1:..] because we don't need self
+        self.positional_names = tuple(caller_arg_names[1:len(callee_arg_names)])
+        self.keyword_names = tuple(caller_arg_names[len(callee_arg_names):])
+    
+    def arguments(self, caller_locals):
+        vargs = []
+        kwargs = {}
+        for name in self.keyword_names:
+            kwargs[name] = caller_locals[name]
+        for name in self.positional_names:
+            vargs.append(caller_locals[name])
+        if self.varg_name:
+            vargs.extend(caller_locals[self.varg_name])
+        if self.kwarg_name:
+            kwargs.update(caller_locals[self.kwarg_name])
+        return vargs, kwargs
+
+
+class ForwardNothing(object):
+    def arguments(self, caller_locals):
+        return [], {}
+
+
+class SuperResolver(object):
+    """Resolves the same things as SuperFinder/SmartMethodCall but caches all
+    results which only depend on code (not on the actual values):
+     - the class which defines the caller's code (per instance class)
+     - if self.super() was called with explicit arguments (per source line)
+     - which arguments must be forwarded to the super method (per caller/callee)
+    
+    All caches are plain dicts: Concurrent misses just compute the same value 
+    twice."""
+    
+    def __init__(self):
+        self._defining_class = {}
+        self._explicit_arguments = {}
+        self._forwarding = {}
+    
+    # --- find correct super method --------------------------------------------
+    def caller_self(self, frame):
+        code = frame.f_code
+        return frame.f_locals[code.co_varnames[0]]
+    
+    def super_method(self, frame, method_name=None):
+        code = frame.f_code
+        caller_self = self.caller_self(frame)
+        if method_name is None:
+            method_name = code.co_name
+        super_class = self.defining_class(caller_self.__class__, code)
+        return getattr(super(super_class, caller_self), method_name)
+    
+    def defining_class(self, klass, code):
+        key = (klass, code)
+        try:
+            return self._defining_class[key]
+        except KeyError:
+            defining_class = self._find_class(klass, code)
+            self._defining_class[key] = defining_class
+            return defining_class
+    
+    def _find_class(self, instance_class, code):
+        method_name = code.co_name
+        for klass in reversed(inspect.getmro(instance_class)):
+            if not hasattr(klass, method_name):
+                continue
+            # Objects special methods like __init__ are c-stuff without code 
+            # objects but I only want to find methods defined in python (the 
+            # caller) so I can just skip these.
+            other_code = _code_for(_function_for(getattr(klass, method_name)))
+            if other_code is code:
+                return klass
+    
+    # --- find correct arguments -----------------------------------------------
+    def did_specify_arguments_explicitely(self, frame):
+        key = (frame.f_code, frame.f_lineno)
+        try:
+            return self._explicit_arguments[key]
+        except KeyError:
+            is_explicit = self._source_contains_arguments(frame)
+            self._explicit_arguments[key] = is_explicit
+            return is_explicit
+    
+    def _source_contains_arguments(self, frame):
+        # yes, this is extremly ugly - however in Python 2.x there is no other
+        # way to differentiate between self.super(*[], **{}) and self.super()
+        frame_info = inspect.getframeinfo(frame)
+        caller_source_lines = frame_info[3]
+        if caller_source_lines is None:
+            warnings.warn('No source found for ' + frame_info[0])
+            return False
+        caller_source_code = caller_source_lines[0]
+        match = re.search('self.super\((.*?)\)', caller_source_code)
+        assert match is not None, repr(caller_source_code)
+        if re.search('\S', match.group(1)):
+            return True
+        return False
+    
+    def arguments_for_super_method(self, frame, method):
+        # The strategy only depends on the code of caller and callee. Using 
+        # the code object (instead of the method) as key is important because 
+        # method wrappers (e.g. object.__init__) are created on every access.
+        callee_code = _code_for(_function_for(method))
+        key = (frame.f_code, callee_code)
+        try:
+            forwarding = self._forwarding[key]
+        except KeyError:
+            forwarding = self._forwarding_strategy(frame.f_code, callee_code)
+            self._forwarding[key] = forwarding
+        return forwarding.arguments(frame.f_locals)
+    
+    def _forwarding_strategy(self, caller_code, callee_code):
+        if callee_code is None:
+            # special treatment of object's __init__ (and other methods not 
+            # implemented in Python)
+            return ForwardNothing()
+        (args, varargs, varkw) = _argspec(callee_code)
+        if len(args) == 1 and varargs is None: # just self
+            return ForwardNothing()
+        return ForwardArguments(caller_code, args)
+
+_resolver = SuperResolver()
+
+
+class SuperProxy(object):
+    "This has as few methods as possible, to serve as an ideal proxy."
+    
+    def __call__(self, *vargs, **kwargs):
+        caller = sys._getframe(1)
+        method = _resolver.super_method(caller)
+        # always prefer explicit arguments
+        if not (vargs or kwargs) and not _resolver.did_specify_arguments_explicitely(caller):
+            vargs, kwargs = _resolver.arguments_for_super_method(caller, method)
+        return method(*vargs, **kwargs)
+    
+    def __getattr__(self, method_name):
+        return _resolver.super_method(sys._getframe(1), method_name=method_name)
+
+
 # ------------------------------------------------------------------------------
 # test cases
 
@@ -354,6 +536,73 @@ class SuperTests(unittest.TestCase):
             def foo(self, some_parameter, another_parameter='fnord', **kwargs):
                 return self.super()
         Lower().foo(None).verify()
+    
+    def test_repeated_calls_forward_current_arguments(self):
+        class Upper(Super):
+            def method(self, arg):
+                self.seen = arg
+                return self.super()
+        class Lower(Upper):
+            def method(self, arg):
+                return self.super()
+        
+        lower = Lower()
+        for value in ('foo', 'bar', 'baz'):
+            lower.method(value).verify()
+            self.assertEqual(value, lower.seen)
+    
+    def test_inherited_method_uses_correct_super_class_for_each_subclass(self):
+        class Upper(Super):
+            def method(self):
+                self.calls = self.calls + ['upper']
+                return self.super()
+        class Middle(Upper):
+            def method(self):
+                self.calls = ['middle']
+                return self.super()
+        class Lower(Middle):
+            pass
+        
+        for klass in (Middle, Lower, Middle):
+            instance = klass().method()
+            instance.verify()
+            self.assertEqual(['middle', 'upper'], instance.calls)
+    
+    def test_detect_explicit_arguments_per_call_site(self):
+        class Upper(Super):
+            def method(self, arg=None, **kwargs):
+                self.seen = arg
+                return self.super()
+        class Lower(Upper):
+            def method(self, arg=None, explicit=False):
+                if explicit:
+                    return self.super(*[], **{})
+                return self.super()
+        
+        self.assertEqual('fnord', Lower().method('fnord').seen)
+        self.assertEqual(None, Lower().method('fnord', explicit=True).seen)
+        self.assertEqual('fnord', Lower().method('fnord').seen)
+    
+    def test_introspecting_proxy_behaves_like_super_proxy(self):
+        class Upper(object):
+            super = IntrospectingSuperProxy()
+            def method(self, arg):
+                return arg
+        class Lower(Upper):
+            def method(self, arg):
+                return self.super()
+        
+        self.assertEqual('fnord', Lower().method('fnord'))
+    
+    def test_cache_does_not_grow_for_methods_without_code(self):
+        class Upper(object):
+            super = SuperProxy()
+            def __init__(self):
+                self.super()
+        nr_strategies = len(_resolver._forwarding)
+        Upper()
+        Upper()
+        self.assertEqual(nr_strategies + 1, len(_resolver._forwarding))
 
 
 # TODO: consider adding support for nested tuple unpacking? 
@@ -0,0 +1,106 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Validate large batches on multiple CPU cores. Because of the GIL, CPU-bound
+validation (e.g. schemas with many ``EmailAddressValidator`` fields) can only 
+use a single core within one Python process.
+
+This module requires ``concurrent.futures`` with support for worker 
+initializers (Python 3.7+)."""
+
+from itertools import repeat
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+__all__ = ['ParallelProcessor', 'process_parallel']
+
+
+# validator used by the current worker process (set by _init_worker)
+_worker_validator = None
+
+def _init_worker(validator):
+    global _worker_validator
+    _worker_validator = validator
+
+def _process_chunk(values, context):
+    return _worker_validator.process_many(values, context)
+
+
+def _chunks(values, chunksize):
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ParallelProcessor(object):
+    """Process values with a pool of worker processes. The validator is 
+    transferred to each worker only once (when the worker is started), values
+    are sent to the workers in chunks of ``chunksize`` items.
+    
+    The validator (including all referenced validators) and all values must 
+    be picklable. Errors are returned as ``InvalidDataError`` instances like
+    ``process_many()`` does.
+    
+    Call ``shutdown()`` when you don't need the worker processes anymore."""
+    
+    def __init__(self, validator, workers=None, chunksize=500):
+        if ProcessPoolExecutor is None:
+            raise ImportError('Parallel processing requires the "concurrent.futures" module.')
+        self.chunksize = chunksize
+        self._executor = ProcessPoolExecutor(max_workers=workers, 
+            initializer=_init_worker, initargs=(validator, ))
+    
+    def process_many(self, values, context=None):
+        """Return a list with the result for each item in ``values`` (same 
+        order as the input): Either the (Python) value or the 
+        ``InvalidDataError``."""
+        if context is None:
+            context = {}
+        chunks = _chunks(values, self.chunksize)
+        results = []
+        for chunk_results in self._executor.map(_process_chunk, chunks, repeat(context)):
+            results.extend(chunk_results)
+        return results
+    
+    def shutdown(self):
+        self._executor.shutdown()
+
+
+def process_parallel(validator, values, context=None, workers=None, chunksize=500):
+    """Process all ``values`` with a temporary pool of worker processes (see 
+    ``ParallelProcessor`` for details). If you need to validate multiple 
+    batches, reuse a ``ParallelProcessor`` to avoid starting new processes for
+    every batch."""
+    processor = ParallelProcessor(validator, workers=workers, chunksize=chunksize)
+    try:
+        return processor.process_many(values, context=context)
+    finally:
+        processor.shutdown()
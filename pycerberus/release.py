@@ -30,6 +30,95 @@ your application from malicious (or just garbled) input data.
 Changelog
 ******************************
 
+0.5 (unreleased)
+====================
+- self.super() caches the super class and argument forwarding strategy so only 
+  the first call needs to inspect the source code. This also fixes self.super()
+  on recent Python 3 versions.
+- Validators compute the table of message implementations only once per class
+  (instead of once per instance) which makes instantiation cheaper.
+- SchemaValidator compiles its validators into a flat execution plan (see 
+  SchemaValidator.compile()) which is rebuilt automatically after add() or 
+  add_formvalidator(). Subclasses which override _process_fields(), 
+  _process_field_validators(), _process_form_validators(), _process_field() or
+  _value_for_field() are still supported but do not benefit from the plan.
+- Added process_many() to validate many values at once without raising 
+  exceptions (invalid values are returned as InvalidDataError instances).
+- Added pycerberus.stream.validate_stream() to validate unbounded inputs lazily
+  (with optional error sink, error limit and progress counters).
+- Validators and InvalidDataErrors can be pickled now.
+- Added pycerberus.parallel to validate large batches with multiple worker 
+  processes (Python 3.7+).
+- Added aprocess() to process values in asyncio coroutines: convert(), 
+  validate() and form validators may be coroutines, asynchronous fields of a 
+  schema are processed concurrently (Python 3.5+, see pycerberus.aio).
+- Cache gettext catalogs per domain, locale dir and locale in a process-wide
+  thread-safe LRU cache (pycerberus.i18n.catalog_cache, at most 100 catalogs)
+  with warm_up() and invalidate(), translating error messages is about 4x 
+  faster
+- Added lazy error messages: If the context contains 'lazy_messages', errors
+  are translated and formatted only when the message is actually read
+- InvalidDataError stores its details in __slots__ instead of an AttrDict of
+  lambdas (~1570 -> ~175 bytes per error), details() returns the error itself.
+  Errors support equality comparison.
+- Added fail-fast mode for schemas (SchemaValidator(fail_fast=True) or 
+  'fail_fast' in the context): Raise the first error immediately, fields with
+  a lower 'cost' are processed first
+- Added check() which returns a ValidationResult instead of raising an 
+  exception for invalid input (about 2x faster for schemas if most inputs are
+  invalid)
+- Added benchmark suite (benchmarks/suite.py) with JSON output and a compare
+  mode which flags regressions against a stored baseline
+- Removed debug output from PositionalArgumentsParsingSchema.process()
+- Added optional instrumentation (pycerberus.instrumentation) which records 
+  calls, latency percentiles and errors by key for each schema field with 
+  Prometheus/JSON export
+- Added MemoizingValidator which caches results (values and errors) of pure
+  validators in a thread-safe LRU cache, validators declare purity with 
+  is_pure()
+- DomainNameValidator uses a precompiled pattern and no self.super() 
+  introspection (about 4x faster for valid domains)
+- DomainNameValidator and EmailAddressValidator accept internationalized domain
+  names if you specify idna=True (including checks for the maximum label and
+  domain length). idna_output='ascii'/'unicode' converts domains to/from 
+  punycode, normalized domains are cached (pycerberus.validators.domain.domain_cache).
+- Added process_column() which returns a ColumnResult (converted values, 
+  indices/mask of invalid cells, errors created only on demand). The 
+  IntegerValidator converts a column with a single loop (~4x faster than 
+  process() per cell) and checks NumPy integer arrays with vectorized 
+  comparisons.
+- Added SchemaValidator.process_columns() to validate column-oriented input 
+  (dict of lists/arrays) with process_column() for each field. Returns a 
+  ColumnarResult with the validated columns and a sparse row -> error dict
+  map, form validators are run only for rows without field errors (~3.5x
+  faster than building a dict for each row).
+- Added ForEachValidator to validate lists of values or nested schemas 
+  (min_length/max_length, errors by position in error_dict(), optional 
+  max_errors). Iterators are processed lazily (returns a generator).
+- Nested schemas are processed by the execution plan of the outer schema 
+  directly (~35% faster for nested payloads, error dicts are unchanged). 
+  Added SchemaValidator.paths() and validator_for_path() to address fields in
+  nested schemas ('address.city' or ('address', 'city')).
+- Added SchemaValidator.check_incremental() which revalidates a form after 
+  edits by running only the field validators of changed fields and the form
+  validators whose declared dependencies (add_formvalidator(..., depends_on=)
+  or a 'depends_on' attribute) changed (200 fields: ~190 -> ~50-90 µs).
+- Form validators with declared dependencies are run in fail-fast mode as soon
+  as their fields are valid (dependencies are validated first among fields 
+  with the same cost). check_incremental() tracks which values a form 
+  validator modified so later form validators can still be skipped. The 
+  instrumentation records skipped form validator runs ('skipped').
+- Added pycerberus.threaded.ThreadedProcessor to process schema fields with
+  'blocking' validators (e.g. I/O) concurrently in a (shared) thread pool 
+  while other fields are processed inline, with optional concurrency limit 
+  and per-call timeout ('timeout' error) (Python 3.2+).
+- Added an opt-in result cache for pure schemas 
+  (SchemaValidator.enable_result_cache()): validated fields and errors are 
+  cached per canonical payload and context keys (default: locale, fail_fast)
+  in a bounded LRU cache with optional TTL, cache_stats() reports the hit 
+  rate. SchemaValidator.is_pure() returns True if all field and form 
+  validators are pure. pycerberus.lib.LRUCache supports a ttl.
+
 0.4.2 (05.05.2011)
 ====================
 - More fixes for source distribution because of missing files in tar.gz
@@ -0,0 +1,250 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.errors import InvalidDataError
+
+__all__ = ['ColumnarResult', 'ColumnResult', 'IncrementalResult', 'ValidationResult']
+
+
+class ValidationResult(object):
+    """Outcome of ``validator.check()``: Either the converted value or the 
+    error(s). Invalid results do not contain a raised exception - for schemas
+    the InvalidDataError which summarizes all field errors is only created if
+    you call ``error()`` (or ``value()``)."""
+    __slots__ = ('_value', '_error', '_error_dict', '_schema', '_context')
+    
+    def __init__(self, value=None, error=None, error_dict=None, schema=None, context=None):
+        self._value = value
+        self._error = error
+        self._error_dict = error_dict
+        self._schema = schema
+        self._context = context
+    
+    def is_valid(self):
+        return (self._error is None) and (self._error_dict is None)
+    
+    def value(self):
+        """Return the converted value, raise the InvalidDataError if the 
+        value was not valid."""
+        if not self.is_valid():
+            raise self.error()
+        return self._value
+    
+    def error(self):
+        """Return the InvalidDataError (or None if the value was valid)."""
+        if (self._error is None) and (self._error_dict is not None):
+            self._error = self._schema._error_for_fields(self._error_dict, self._context)
+        return self._error
+    
+    def error_dict(self):
+        """Return the errors for all fields (schemas only, empty dict 
+        otherwise)."""
+        if self._error_dict is not None:
+            return self._error_dict
+        elif self._error is not None:
+            return self._error.error_dict()
+        return {}
+    
+    def __repr__(self):
+        if self.is_valid():
+            return 'ValidationResult(%r)' % (self._value, )
+        return 'ValidationResult(error=%r)' % (self.error(), )
+
+
+
+class IncrementalResult(ValidationResult):
+    """``ValidationResult`` returned by ``schema.check_incremental()``. Besides
+    the outcome it keeps a (shallow) copy of the input and the outcome of 
+    every field and form validator so the next call only needs to run the 
+    validators which are affected by changed fields."""
+    __slots__ = ('_plan', '_fields', '_field_results', '_form_results')
+    
+    def __init__(self, value=None, error=None, error_dict=None, schema=None, context=None, 
+                 plan=None, fields=None, field_results=None, form_results=()):
+        super(IncrementalResult, self).__init__(value, error, error_dict, schema, context)
+        self._plan = plan
+        self._fields = fields
+        # field name -> (True, converted value) or (False, InvalidDataError)
+        self._field_results = field_results
+        # one item per form validator which was run: True (passed, values 
+        # unchanged), an InvalidDataError or None (can not be reused)
+        self._form_results = form_results
+
+
+class ColumnResult(object):
+    """Outcome of ``validator.process_column()``: The converted column and the
+    positions of all invalid cells. The InvalidDataError for an invalid cell 
+    is only created if you call ``error()`` (or ``errors()``) - most 
+    validators just record the error key and the original value.
+    
+    ``converted()`` has the same length as the input column, invalid cells 
+    contain None (or 0 if the validator returned a NumPy array)."""
+    __slots__ = ('_values', '_failures', '_errors', '_mask', '_validator', '_context')
+    
+    def __init__(self, values, failures=None, errors=None, mask=None, validator=None, context=None):
+        self._values = values
+        # index -> (error key, original value)
+        if failures is None:
+            failures = {}
+        self._failures = failures
+        if errors is None:
+            errors = {}
+        self._errors = errors
+        self._mask = mask
+        self._validator = validator
+        self._context = context
+    
+    def is_valid(self):
+        return len(self._failures) == 0
+    
+    def converted(self):
+        """Return the converted column (a list or a NumPy array)."""
+        return self._values
+    
+    def failed_indices(self):
+        """Return the (sorted) indices of all invalid cells."""
+        indices = list(self._failures.keys())
+        indices.sort()
+        return indices
+    
+    def mask(self):
+        """Return a boolean sequence with True for each invalid cell (a NumPy
+        array if the values are a NumPy array)."""
+        if self._mask is None:
+            mask = [False] * len(self._values)
+            for index in self._failures:
+                mask[index] = True
+            self._mask = mask
+        return self._mask
+    
+    def error_keys(self):
+        """Return a dict which maps the index of each invalid cell to the 
+        error key (e.g. 'too_low') without creating any error instance."""
+        error_keys = {}
+        for index, (key, value) in self._failures.items():
+            error_keys[index] = key
+        return error_keys
+    
+    def error(self, index):
+        """Return the InvalidDataError for the cell at ``index`` (None if that
+        cell is valid). The error is identical to the one raised by 
+        ``validator.process()`` for the original value."""
+        if index in self._errors:
+            return self._errors[index]
+        if index not in self._failures:
+            return None
+        key, value = self._failures[index]
+        try:
+            self._validator.process(value, self._context)
+        except InvalidDataError, e:
+            self._errors[index] = e
+            return e
+        raise AssertionError('cell %d (%r) is valid when processed alone' % (index, value))
+    
+    def errors(self):
+        """Return a dict which maps the index of each invalid cell to its
+        InvalidDataError."""
+        errors = {}
+        for index in self._failures:
+            errors[index] = self.error(index)
+        return errors
+    
+    def __len__(self):
+        return len(self._values)
+    
+    def __repr__(self):
+        return 'ColumnResult(%d values, failed=%r)' % (len(self._values), self.failed_indices())
+
+
+class ColumnarResult(object):
+    """Outcome of ``schema.process_columns()``: The validated columns (a dict 
+    which maps field names to converted columns) and the invalid rows. Errors
+    are only created when you access them (``row()``, ``error_dicts()``).
+    
+    Cells of invalid rows contain the converted value if the field itself was
+    valid, None (or 0 for NumPy arrays) otherwise."""
+    __slots__ = ('_columns', '_length', '_field_results', '_row_results', '_schema', '_context')
+    
+    def __init__(self, columns, length, field_results=None, row_results=None, schema=None, context=None):
+        self._columns = columns
+        self._length = length
+        # field name -> ColumnResult
+        if field_results is None:
+            field_results = {}
+        self._field_results = field_results
+        # row -> ValidationResult (only invalid rows which were checked 
+        # completely, e.g. by form validators)
+        if row_results is None:
+            row_results = {}
+        self._row_results = row_results
+        self._schema = schema
+        self._context = context
+    
+    def columns(self):
+        return self._columns
+    
+    def is_valid(self):
+        return len(self.failed_rows()) == 0
+    
+    def failed_rows(self):
+        """Return the (sorted) indices of all invalid rows."""
+        rows = self._row_results.copy()
+        for result in self._field_results.values():
+            for index in result.failed_indices():
+                rows[index] = True
+        rows = list(rows.keys())
+        rows.sort()
+        return rows
+    
+    def row(self, index):
+        """Return a ``ValidationResult`` for the given row (just like 
+        ``schema.check()`` would return for that row)."""
+        if index in self._row_results:
+            return self._row_results[index]
+        exceptions = {}
+        for name, result in self._field_results.items():
+            error = result.error(index)
+            if error is not None:
+                exceptions[name] = error
+        if len(exceptions) > 0:
+            return ValidationResult(error_dict=exceptions, schema=self._schema, context=self._context)
+        fields = {}
+        for name, column in self._columns.items():
+            fields[name] = column[index]
+        return ValidationResult(fields)
+    
+    def error_dicts(self):
+        """Return a dict which maps the index of every invalid row to its 
+        error dict (field name -> InvalidDataError, empty dict for rows which
+        were rejected by a form validator - see ``row(index).error()``)."""
+        error_dicts = {}
+        for index in self.failed_rows():
+            error_dicts[index] = self.row(index).error_dict()
+        return error_dicts
+    
+    def __len__(self):
+        return self._length
+    
+    def __repr__(self):
+        return 'ColumnarResult(%d rows, failed=%r)' % (self._length, self.failed_rows())
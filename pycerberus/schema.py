@@ -22,10 +22,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from pycerberus.api import BaseValidator, EarlyBindForMethods, Validator
-from pycerberus.compat import set
+from pycerberus import instrumentation
+from pycerberus.api import is_implemented_by, BaseValidator, EarlyBindForMethods, \
+    Validator
+from pycerberus.compat import frozenset, set
 from pycerberus.i18n import _
-from pycerberus.errors import InvalidDataError
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.lib import LRUCache
+from pycerberus.result import ColumnarResult, IncrementalResult, ValidationResult
 
 __all__ = ['SchemaValidator']
 
@@ -103,15 +107,631 @@ class SchemaMeta(EarlyBindForMethods):
     restore_overwritten_methods = classmethod(restore_overwritten_methods)
 
 
+class ExecutionPlan(object):
+    """A flat, precomputed representation of a schema instance so processing
+    input does not need to copy the field validators or dispatch through 
+    several methods for every field. The plan must be rebuilt whenever 
+    validators are added to the schema (``SchemaValidator`` does that 
+    automatically).
+    
+    In fail-fast mode the plan processes the fields ordered by their cost (see
+    ``SchemaValidator.field_cost()``, cheap fields first) and raises the first
+    error immediately.
+    
+    Nested schemas (fields which are validated by another schema) are 
+    processed by calling their plan directly so there is no per-level overhead
+    for ``process()``, ``convert()`` and the plan lookup. The nested output 
+    dicts and error dicts are exactly the same as with ``process()``. Use 
+    ``paths()`` to get all fields of the schema tree.
+    
+    If instrumentation is enabled (see ``pycerberus.instrumentation``) the 
+    plan records metrics for each field and for the whole schema (including
+    the number of form validator runs which were skipped).
+    
+    Form validators may declare the fields they read (``depends_on``). In 
+    fail-fast mode these form validators are run as soon as all their fields
+    were validated (but always in the order they were added) so invalid 
+    input is rejected without validating the remaining fields. Early form 
+    validators only get a copy of the values: If they modify the values they
+    are run again after all fields were validated."""
+    
+    def __init__(self, schema):
+        self.schema = schema
+        registry = instrumentation.active_registry()
+        schema_name = schema.instrumentation_name()
+        fields = schema.fieldvalidators()
+        dependencies = []
+        for depends_on in schema.formvalidator_dependencies():
+            if depends_on is not None:
+                depends_on = frozenset(depends_on)
+            dependencies.append(depends_on)
+        self.formvalidator_dependencies = tuple(dependencies)
+        early_dependencies = self._early_dependencies(fields)
+        steps = []
+        steps_with_cost = []
+        column_steps = []
+        for name, validator in fields.items():
+            process = validator.process
+            if isinstance(validator, SchemaValidator):
+                # nested schemas are processed by their plan directly
+                process = nested_process(validator)
+            if registry is not None:
+                process = registry.instrument(schema_name, name, process)
+            step = (name, process, validator.empty_value)
+            steps.append(step)
+            is_late = (name not in early_dependencies)
+            steps_with_cost.append((schema.field_cost(name), is_late, len(steps), step))
+            column_steps.append((name, validator.process_column, validator.empty_value))
+        self.fields = tuple(steps)
+        self.column_fields = tuple(column_steps)
+        # Fields with the same cost: Dependencies of form validators which can
+        # be run early come first. sort() is stable only since Python 2.4 so 
+        # we use the position as a tie breaker.
+        steps_with_cost.sort()
+        self.fields_by_cost = tuple([step for cost, is_late, position, step in steps_with_cost])
+        self.allowed_keys = frozenset(fields)
+        self.formvalidators = tuple([validator.process for validator in schema.formvalidators()])
+        run_until = self._early_formvalidators()
+        self.fail_fast_steps = tuple([step + (run_until[position], ) for position, step in enumerate(self.fields_by_cost)])
+        self.fail_fast = schema.fail_fast
+        self.uses_default_processing = schema._uses_default_processing()
+        self.uses_default_hooks = schema._has_default_hooks()
+        self.registry = registry
+        self.schema_metrics = None
+        if registry is not None:
+            self.schema_metrics = registry.metrics_for(schema_name, None)
+            self.process = registry.instrument(schema_name, None, self.process)
+    
+    def _early_dependencies(self, fields):
+        """Return the fields which are needed by form validators that can be
+        run before all fields were validated (fail-fast mode)."""
+        early_dependencies = set()
+        for depends_on in self.formvalidator_dependencies:
+            if (depends_on is None) or (not depends_on.issubset(fields)):
+                break
+            early_dependencies.update(depends_on)
+        return early_dependencies
+    
+    def _early_formvalidators(self):
+        """Return the number of form validators which can be run in fail-fast
+        mode after each field (ordered by cost). Only form validators with 
+        declared dependencies (and only in the order they were added) are
+        run before all fields were validated."""
+        positions = {}
+        for position, step in enumerate(self.fields_by_cost):
+            positions[step[0]] = position
+        run_until = [0] * len(self.fields_by_cost)
+        ready = 0
+        for index, depends_on in enumerate(self.formvalidator_dependencies):
+            if (depends_on is None) or (not self.allowed_keys.issuperset(depends_on)):
+                break
+            for name in depends_on:
+                ready = max(ready, positions[name])
+            run_until[ready] = index + 1
+        for position in range(1, len(run_until)):
+            run_until[position] = max(run_until[position], run_until[position - 1])
+        return run_until
+    
+    def record_skipped(self, count):
+        """Record ``count`` skipped form validator runs (if instrumentation 
+        is enabled)."""
+        if (self.schema_metrics is not None) and (count > 0):
+            self.registry.record_skipped(self.schema_metrics, count)
+    
+    def is_fail_fast(self, context):
+        return context.get('fail_fast', self.fail_fast)
+    
+    def paths(self):
+        """Return the paths (tuple of field names) of all fields in this 
+        schema and all nested schemas (depth-first, sorted by name). Nested
+        schemas themselves are not included, only their fields."""
+        paths = []
+        names = list(self.allowed_keys)
+        names.sort()
+        for name in names:
+            validator = self.schema.validator_for(name)
+            if isinstance(validator, SchemaValidator):
+                for path in validator.compile().paths():
+                    paths.append((name, ) + path)
+            else:
+                paths.append((name, ))
+        return paths
+    
+    def process_nested(self, value, context):
+        """Process ``value`` as a nested schema: Same as ``schema.process()``
+        but without the generic prologue (context, stripping, empty check)
+        which is never used by schemas with default processing."""
+        if value is None:
+            return self.schema.empty_value(context)
+        if not isinstance(value, dict):
+            self.schema.error('invalid_type', value, context, classname=value.__class__)
+        return self.process(value, context)
+    
+    def process_field_validators(self, fields, context):
+        validated_fields = {}
+        exceptions = {}
+        for key, process, empty_value in self.fields:
+            try:
+                if key in fields:
+                    original_value = fields[key]
+                else:
+                    original_value = empty_value(context)
+                validated_fields[key] = process(original_value, context)
+            except InvalidDataError, e:
+                exceptions[key] = e
+        return self.check_field_results(fields, validated_fields, exceptions, context)
+    
+    def process_field_validators_fail_fast(self, fields, context):
+        """Process the fields ordered by cost until the first error, form 
+        validators with declared dependencies are run as soon as possible.
+        Returns a tuple (validated fields, error dict, form validator error,
+        number of form validators which were run already)."""
+        validated_fields = {}
+        formvalidators = self.formvalidators
+        done = 0
+        run_early = True
+        for key, process, empty_value, run_until in self.fail_fast_steps:
+            try:
+                if key in fields:
+                    original_value = fields[key]
+                else:
+                    original_value = empty_value(context)
+                validated_fields[key] = process(original_value, context)
+            except InvalidDataError, e:
+                return (validated_fields, {key: e}, None, done)
+            while run_early and (done < run_until):
+                values = validated_fields.copy()
+                try:
+                    result = formvalidators[done](values, context=context)
+                except InvalidDataError, e:
+                    return (validated_fields, None, e, done)
+                if (result is not values) or (values != validated_fields):
+                    # The form validator modified the values so it must be run
+                    # again when all fields were validated (otherwise later 
+                    # field validators could overwrite its changes).
+                    run_early = False
+                    break
+                done += 1
+        return (validated_fields, None, None, done)
+    
+    def check_field_results(self, fields, validated_fields, exceptions, context):
+        """Raise an InvalidDataError if any field validator failed or if 
+        there are additional (not allowed) fields, otherwise return the 
+        validated fields."""
+        if len(exceptions) > 0:
+            self.record_skipped(len(self.formvalidators))
+            self.schema._raise_exception(exceptions, context)
+        self.check_additional_items(fields, context)
+        return validated_fields
+    
+    def check_additional_items(self, fields, context):
+        if (not self.schema.allow_additional_parameters) and (not self.allowed_keys.issuperset(fields)):
+            self.record_skipped(len(self.formvalidators))
+            additional_items = set(fields).difference(self.allowed_keys)
+            additional_arguments = ' '.join(["'%s'" % fields[key] for key in additional_items])
+            self.schema.error('additional_items', None, context, additional_items=additional_arguments)
+    
+    def process(self, fields, context):
+        done = 0
+        if self.is_fail_fast(context):
+            self.check_additional_items(fields, context)
+            validated_fields, exceptions, error, done = self.process_field_validators_fail_fast(fields, context)
+            if exceptions is not None:
+                self.record_skipped(len(self.formvalidators) - done)
+                self.schema._raise_exception(exceptions, context)
+            elif error is not None:
+                self.record_skipped(len(self.formvalidators) - done - 1)
+                raise error
+        else:
+            validated_fields = self.process_field_validators(fields, context)
+        return self.process_formvalidators(validated_fields, context, done)
+    
+    def process_formvalidators(self, validated_fields, context, start=0):
+        """Run all form validators (except for the first ``start`` ones which
+        were run already)."""
+        formvalidators = self.formvalidators
+        if start > 0:
+            formvalidators = formvalidators[start:]
+        done = start
+        try:
+            for process in formvalidators:
+                validated_fields = process(validated_fields, context=context)
+                done += 1
+        except InvalidDataError:
+            self.record_skipped(len(self.formvalidators) - done - 1)
+            raise
+        return validated_fields
+    
+    def check(self, fields, context):
+        """Process the fields like ``process()`` but return a 
+        ``ValidationResult``. Field errors are collected without raising an
+        exception for the schema."""
+        done = 0
+        if self.is_fail_fast(context):
+            try:
+                self.check_additional_items(fields, context)
+            except InvalidDataError, e:
+                return ValidationResult(error=e)
+            validated_fields, exceptions, error, done = self.process_field_validators_fail_fast(fields, context)
+            if exceptions is not None:
+                self.record_skipped(len(self.formvalidators) - done)
+                return ValidationResult(error_dict=exceptions, schema=self.schema, context=context)
+            elif error is not None:
+                self.record_skipped(len(self.formvalidators) - done - 1)
+                return ValidationResult(error=error)
+        else:
+            validated_fields = {}
+            exceptions = {}
+            for key, process, empty_value in self.fields:
+                try:
+                    if key in fields:
+                        original_value = fields[key]
+                    else:
+                        original_value = empty_value(context)
+                    validated_fields[key] = process(original_value, context)
+                except InvalidDataError, e:
+                    exceptions[key] = e
+            if len(exceptions) > 0:
+                self.record_skipped(len(self.formvalidators))
+                return ValidationResult(error_dict=exceptions, schema=self.schema, context=context)
+            try:
+                self.check_additional_items(fields, context)
+            except InvalidDataError, e:
+                return ValidationResult(error=e)
+        try:
+            validated_fields = self.process_formvalidators(validated_fields, context, done)
+        except InvalidDataError, e:
+            return ValidationResult(error=e)
+        return ValidationResult(validated_fields)
+    
+    def check_incremental(self, fields, previous, changed, context):
+        """Like ``check()`` but reuse the outcome of all field validators 
+        whose input did not change since the ``previous`` result (as well as
+        form validators whose declared dependencies did not change). Returns
+        an ``IncrementalResult``.
+        
+        Form validators which return modified values (or write any value in 
+        place) must be run again but only the changed values are passed on so
+        later form validators can
+        still be skipped. In fail-fast mode form validators are run early 
+        exactly like in ``process()``, these are never skipped."""
+        previous_results = {}
+        previous_forms = ()
+        if (previous is not None) and (previous._plan is self) and (previous._context == context):
+            previous_results = previous._field_results
+            previous_forms = previous._form_results
+            if changed is None:
+                changed = changed_keys(previous._fields, fields)
+            else:
+                changed = set(changed)
+        else:
+            changed = None
+        validated_fields = {}
+        exceptions = {}
+        field_results = {}
+        state = dict(schema=self.schema, context=context.copy(), plan=self, fields=fields.copy(), 
+                     field_results=field_results)
+        nr_formvalidators = len(self.formvalidators)
+        # same steps as process_field_validators_fail_fast() in fail-fast mode
+        fail_fast = self.is_fail_fast(context)
+        steps = self.fields
+        if fail_fast:
+            try:
+                self.check_additional_items(fields, context)
+            except InvalidDataError, e:
+                return IncrementalResult(error=e, **state)
+            steps = self.fail_fast_steps
+        done = 0
+        run_early = fail_fast
+        form_error = None
+        for step in steps:
+            key = step[0]
+            if (changed is not None) and (key not in changed) and (key in previous_results):
+                outcome = previous_results[key]
+            else:
+                if key in fields:
+                    original_value = fields[key]
+                else:
+                    original_value = step[2](context)
+                try:
+                    outcome = (True, step[1](original_value, context))
+                except InvalidDataError, e:
+                    outcome = (False, e)
+            field_results[key] = outcome
+            if outcome[0]:
+                validated_fields[key] = outcome[1]
+            else:
+                exceptions[key] = outcome[1]
+                if fail_fast:
+                    break
+            # early form validators (fail-fast mode only) are always run
+            while run_early and (done < step[3]):
+                values = validated_fields.copy()
+                try:
+                    result = self.formvalidators[done](values, context=context)
+                except InvalidDataError, e:
+                    form_error = e
+                    break
+                if (result is not values) or (values != validated_fields):
+                    # run again when all fields were validated
+                    run_early = False
+                    break
+                done += 1
+            if form_error is not None:
+                break
+        if form_error is not None:
+            self.record_skipped(nr_formvalidators - done - 1)
+            return IncrementalResult(error=form_error, **state)
+        if len(exceptions) > 0:
+            self.record_skipped(nr_formvalidators - done)
+            return IncrementalResult(error_dict=exceptions, **state)
+        if not fail_fast:
+            try:
+                self.check_additional_items(fields, context)
+            except InvalidDataError, e:
+                return IncrementalResult(error=e, **state)
+        # Form validators which were run early have no reusable outcome.
+        form_results = [None] * done
+        state['form_results'] = form_results
+        # If ``changed`` is not None it contains all keys with values which 
+        # differ from the values the same form validator got in the previous
+        # call. ``previous_values`` are the values after the same form 
+        # validator in the previous call (only needed after a form validator
+        # modified the values).
+        previous_values = None
+        reused = 0
+        for index in range(done, nr_formvalidators):
+            previous_outcome = None
+            if (changed is not None) and (index < len(previous_forms)):
+                previous_outcome = previous_forms[index]
+            depends_on = self.formvalidator_dependencies[index]
+            is_reusable = (previous_outcome is True) or isinstance(previous_outcome, InvalidDataError)
+            if is_reusable and (depends_on is not None) and (not changed.intersection(depends_on)):
+                outcome = previous_outcome
+                reused += 1
+            else:
+                values = validated_fields
+                if isinstance(validated_fields, dict):
+                    # Form validators which write values in place must not be
+                    # reused even if the values did not change: The next 
+                    # call might get different values for the written keys.
+                    values = WriteRecordingDict(validated_fields)
+                try:
+                    result = self.formvalidators[index](values, context=context)
+                except InvalidDataError, e:
+                    outcome = e
+                else:
+                    if (result is values) and (not getattr(values, 'written', None)):
+                        outcome = True
+                    else:
+                        # later form validators only get a copy so the stored
+                        # outcome is never modified
+                        outcome = result
+                        if isinstance(result, dict):
+                            outcome = dict(result)
+                        validated_fields = outcome
+            form_results.append(outcome)
+            if isinstance(outcome, InvalidDataError):
+                self.record_skipped(reused + nr_formvalidators - index - 1)
+                return IncrementalResult(error=outcome, **state)
+            if (changed is None) or ((outcome is True) and (previous_outcome is True)):
+                continue
+            if isinstance(previous_outcome, dict):
+                previous_values = previous_outcome
+            elif previous_outcome is not True:
+                changed = None
+                continue
+            elif previous_values is None:
+                previous_values = valid_values(previous._field_results)
+            if isinstance(validated_fields, dict):
+                changed = changed_keys(previous_values, validated_fields)
+            else:
+                changed = None
+        self.record_skipped(reused)
+        return IncrementalResult(validated_fields, **state)
+    
+    def process_columns(self, columns, length, context):
+        """Validate column-oriented input: Every field validator processes its
+        complete column (``process_column()``), form validators are run only
+        for rows without field errors. Returns a ``ColumnarResult``."""
+        self.check_additional_columns(columns, context)
+        converted_columns = {}
+        field_results = {}
+        failed_rows = {}
+        for key, process_column, empty_value in self.column_fields:
+            if key in columns:
+                column = columns[key]
+            else:
+                column = [empty_value(context)] * length
+            result = process_column(column, context)
+            field_results[key] = result
+            converted_columns[key] = result.converted()
+            for index in result.failed_indices():
+                failed_rows[index] = True
+        row_results = {}
+        if len(self.formvalidators) > 0:
+            row_results = self.process_formvalidators_for_columns(converted_columns, length, failed_rows, context)
+        return ColumnarResult(converted_columns, length, field_results, row_results, schema=self.schema, context=context)
+    
+    def process_formvalidators_for_columns(self, converted_columns, length, failed_rows, context):
+        # plain Python values (not NumPy scalars) for the form validators
+        cells = []
+        for key, column in converted_columns.items():
+            if hasattr(column, 'tolist'):
+                column = column.tolist()
+            cells.append((key, column))
+        row_results = {}
+        copied_columns = {}
+        for index in xrange(length):
+            if index in failed_rows:
+                continue
+            fields = {}
+            for key, column in cells:
+                fields[key] = column[index]
+            validated_fields = fields
+            try:
+                for process in self.formvalidators:
+                    validated_fields = process(validated_fields, context=context)
+            except InvalidDataError, e:
+                row_results[index] = ValidationResult(error=e)
+                continue
+            if validated_fields is fields:
+                continue
+            # form validator returned modified values
+            for key, value in validated_fields.items():
+                if key not in copied_columns:
+                    column = converted_columns.get(key)
+                    if column is None:
+                        column = [None] * length
+                    elif hasattr(column, 'copy'):
+                        column = column.copy()
+                    else:
+                        column = list(column)
+                    converted_columns[key] = column
+                    copied_columns[key] = True
+                converted_columns[key][index] = value
+        return row_results
+    
+    def check_additional_columns(self, columns, context):
+        if (not self.schema.allow_additional_parameters) and (not self.allowed_keys.issuperset(columns)):
+            additional_items = list(set(columns).difference(self.allowed_keys))
+            additional_items.sort()
+            additional_arguments = ' '.join(["'%s'" % key for key in additional_items])
+            self.schema.error('additional_items', None, context, additional_items=additional_arguments)
+
+
+_missing = object()
+_not_cached = object()
+
+def changed_keys(previous_fields, fields):
+    """Return the set of keys which were added, removed or changed (compared 
+    by identity and equality)."""
+    changed = set()
+    for key, value in fields.items():
+        previous_value = previous_fields.get(key, _missing)
+        if (previous_value is not value) and (previous_value != value):
+            changed.add(key)
+    for key in previous_fields:
+        if key not in fields:
+            changed.add(key)
+    return changed
+
+
+class WriteRecordingDict(dict):
+    """A dict which records the keys which were set or deleted (``written``)
+    so form validators which write values in place can be detected even if 
+    the new values are equal to the old ones."""
+    
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.written = set()
+    
+    def __setitem__(self, key, value):
+        self.written.add(key)
+        dict.__setitem__(self, key, value)
+    
+    def __delitem__(self, key):
+        self.written.add(key)
+        dict.__delitem__(self, key)
+    
+    def update(self, *args, **kwargs):
+        values = dict(*args, **kwargs)
+        self.written.update(values)
+        dict.update(self, values)
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.written.add(key)
+        return dict.setdefault(self, key, default)
+    
+    def pop(self, key, *args):
+        if key in self:
+            self.written.add(key)
+        return dict.pop(self, key, *args)
+    
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.written.add(key)
+        return (key, value)
+    
+    def clear(self):
+        self.written.update(self)
+        dict.clear(self)
+
+
+_scalar_types = frozenset([str, unicode, int, long, float, bool, type(None)])
+
+def canonical_key(value):
+    """Return a hashable representation of ``value`` which is the same for 
+    equal input (regardless of the order of dict items). The type of every 
+    item is included so that e.g. 1, 1.0 and True are different. Raises a 
+    TypeError for unhashable values which are not dicts, lists, tuples or 
+    sets."""
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            if (item.__class__ in _scalar_types) and (key.__class__ in _scalar_types):
+                # shortcut for the most common case (flat JSON-like payloads)
+                items.append((key.__class__, key, item.__class__, item))
+            else:
+                items.append((canonical_key(key), canonical_key(item)))
+        return (dict, frozenset(items))
+    elif isinstance(value, (list, tuple)):
+        return (value.__class__, tuple([canonical_key(item) for item in value]))
+    elif isinstance(value, (set, frozenset)):
+        return (value.__class__, frozenset([canonical_key(item) for item in value]))
+    hash(value)
+    return (value.__class__, value)
+
+
+def is_pure(validator):
+    "Return True if ``validator`` (any object with ``process()``) is pure."
+    is_pure = getattr(validator, 'is_pure', None)
+    return (is_pure is not None) and is_pure()
+
+
+def valid_values(field_results):
+    "Return the converted values of all valid fields."
+    values = {}
+    for key, (is_valid, value) in field_results.items():
+        if is_valid:
+            values[key] = value
+    return values
+
+
+def nested_process(schema):
+    """Return a callable which processes values for the nested ``schema`` 
+    with its current plan (so changes of the nested schema are picked up, 
+    e.g. an enabled result cache). Schemas without default processing are 
+    processed by calling ``process()``."""
+    compile = schema.compile
+    schema_process = schema.process
+    def process(value, context):
+        plan = compile()
+        if plan.uses_default_processing:
+            return plan.process_nested(value, context)
+        return schema_process(value, context)
+    return process
+
+
 class SchemaValidator(Validator):
     
     __metaclass__ = SchemaMeta
     
+    fail_fast = False
+    
     def __init__(self, *args, **kwargs):
         self._fields = {}
         self._formvalidators = []
+        self._formvalidator_dependencies = []
+        self._plan = None
+        self._result_cache = None
+        self._result_cache_settings = None
         self.allow_additional_parameters = True
-        self.super()
+        if 'fail_fast' in kwargs:
+            self.fail_fast = kwargs.pop('fail_fast')
+        self._instrumentation_name = kwargs.pop('instrumentation_name', None)
+        self.super(*args, **kwargs)
         self._setup_fieldvalidators()
         self._setup_formvalidators()
     
@@ -132,13 +752,73 @@ class SchemaValidator(Validator):
     # additional public API 
     
     def add(self, fieldname, validator):
-        self._fields[fieldname] = self._init_validator(validator)
+        validator = self._init_validator(validator)
+        self._check_cacheable(validator)
+        self._fields[fieldname] = validator
+        self._invalidate_plan()
+    
+    def field_cost(self, field_name):
+        """Return the (relative) cost of processing the given field. In 
+        fail-fast mode cheap fields are processed first. By default the cost 
+        is taken from the validator's ``cost`` attribute (0 if the validator 
+        has no such attribute)."""
+        return getattr(self._fields[field_name], 'cost', 0)
     
     def validator_for(self, field_name):
         return self._fields[field_name]
     
-    def add_formvalidator(self, formvalidator):
-        self._formvalidators.append(self._init_validator(formvalidator))
+    def validator_for_path(self, path):
+        """Return the validator for a field in a nested schema. ``path`` is 
+        either a tuple of field names or a dotted string 
+        (e.g. 'address.city')."""
+        if isinstance(path, basestring):
+            path = path.split('.')
+        validator = self
+        for name in path:
+            validator = validator.validator_for(name)
+        return validator
+    
+    def paths(self):
+        """Return the paths of all fields (including the fields of nested 
+        schemas), see ``ExecutionPlan.paths()``."""
+        return self.compile().paths()
+    
+    def instrumentation_name(self):
+        """Return the name which is used for the metrics of this schema (see
+        ``pycerberus.instrumentation``). Unless a name was set this is the 
+        module and class name so all instances of a class share their 
+        metrics."""
+        name = self._instrumentation_name
+        if name is None:
+            name = '%s.%s' % (self.__class__.__module__, self.__class__.__name__)
+        return name
+    
+    def set_instrumentation_name(self, name):
+        """Record the metrics of this schema under ``name`` (None restores the
+        default name)."""
+        self.__dict__['_instrumentation_name'] = name
+        # metrics are looked up when the plan is built
+        self.__dict__['_plan'] = None
+    
+    def add_formvalidator(self, formvalidator, depends_on=None):
+        """Add a form validator. ``depends_on`` is a list of the field names
+        which the form validator reads (default: the validator's 
+        ``depends_on`` attribute). Form validators without declared 
+        dependencies depend on all fields.
+        
+        Declared dependencies are used by ``check_incremental()`` and in
+        fail-fast mode: The form validator is run as soon as all its fields
+        were validated (it gets only the values validated so far then). Form
+        validators are always run in the order they were added."""
+        formvalidator = self._init_validator(formvalidator)
+        self._check_cacheable(formvalidator)
+        if depends_on is None:
+            depends_on = getattr(formvalidator, 'depends_on', None)
+        if depends_on is not None:
+            depends_on = tuple(depends_on)
+        self._formvalidators.append(formvalidator)
+        self._formvalidator_dependencies.append(depends_on)
+        self._invalidate_plan()
     
     def fieldvalidators(self):
         return self._fields.copy()
@@ -146,13 +826,30 @@ class SchemaValidator(Validator):
     def formvalidators(self):
         return tuple(self._formvalidators)
     
+    def formvalidator_dependencies(self):
+        """Return the declared dependencies (tuple of field names or None) 
+        for every form validator (same order as ``formvalidators()``)."""
+        return tuple(self._formvalidator_dependencies)
+    
+    def compile(self):
+        """Return the ``ExecutionPlan`` which is used to process input 
+        values. The plan is built on first use (and after every change of 
+        field or form validators) so calling this method is optional."""
+        plan = self._plan
+        if (plan is None) or (plan.registry is not instrumentation.active_registry()):
+            # The plan is also rebuilt if instrumentation was enabled or 
+            # disabled. Compiling twice in different threads is harmless.
+            plan = ExecutionPlan(self)
+            self.__dict__['_plan'] = plan
+        return plan
+    
     def add_missing_validators(self, schema):
         for name, validator in schema.fieldvalidators().items():
             if name in self.fieldvalidators():
                 continue
             self.add(name, validator)
-        for formvalidator in schema.formvalidators():
-            self.add_formvalidator(formvalidator)
+        for formvalidator, depends_on in zip(schema.formvalidators(), schema.formvalidator_dependencies()):
+            self.add_formvalidator(formvalidator, depends_on=depends_on)
     
     # -------------------------------------------------------------------------
     # overridden public methods
@@ -161,6 +858,7 @@ class SchemaValidator(Validator):
         return {
                 'invalid_type': _(u'Validator got unexpected input (expected "dict", got "%(classname)s").'),
                 'additional_items': _(u'Additional fields detected: %(additional_items)s.'),
+                'timeout': _(u'Validation did not finish in time.'),
                }
     
     def convert(self, fields, context):
@@ -168,18 +866,156 @@ class SchemaValidator(Validator):
             return self.empty_value(context)
         if not isinstance(fields, dict):
             self.error('invalid_type', fields, context, classname=fields.__class__)
+        if self._result_cache is not None:
+            return self._process_fields_cached(fields, context)
         return self._process_fields(fields, context)
     
     def is_empty(self, value, context):
         # Schemas have a different notion of being "empty"
         return False
     
+    def process_many(self, values, context=None):
+        if not self._uses_default_processing():
+            return self.super(values, context=context)
+        if context is None:
+            context = {}
+        plan = self.compile()
+        process_fields = plan.process
+        results = []
+        append = results.append
+        for fields in values:
+            try:
+                if isinstance(fields, dict):
+                    append(process_fields(fields, context))
+                else:
+                    append(self.convert(fields, context))
+            except InvalidDataError, e:
+                append(e)
+        return results
+    
+    def check(self, value, context=None):
+        plan = self.compile()
+        if not plan.uses_default_processing:
+            return self.super(value, context=context)
+        context = self._context_for_check(context)
+        if not isinstance(value, dict):
+            try:
+                return ValidationResult(self.convert(value, context))
+            except InvalidDataError, e:
+                return ValidationResult(error=e)
+        return plan.check(value, context)
+    
+    def check_incremental(self, fields, previous=None, changed=None, context=None):
+        """Validate ``fields`` like ``check()`` but reuse as much as possible
+        from the ``previous`` result (which must be returned by this method
+        as well). Only field validators for changed fields are run again, 
+        form validators are only run again if one of their declared 
+        dependencies changed (see ``add_formvalidator()``) or they have no
+        declared dependencies. The result (and all errors) are the same as 
+        for a full ``process()``/``check()``.
+        
+        Changed fields are detected by comparing ``fields`` with the input of
+        the previous call (so do not modify mutable values in place) unless
+        you pass the names of all changed fields as ``changed``. The previous
+        result is ignored if the context or the schema changed in between.
+        
+        Returns an ``IncrementalResult`` (a ``ValidationResult``)."""
+        plan = self.compile()
+        context = self._context_for_check(context)
+        if (not plan.uses_default_processing) or (not isinstance(fields, dict)):
+            return self.check(fields, context)
+        if not isinstance(previous, IncrementalResult):
+            previous = None
+        return plan.check_incremental(fields, previous, changed, context)
+    
+    def process_columns(self, columns, context=None):
+        """Validate column-oriented input (a dict which maps field names to 
+        sequences of equal length, e.g. lists or NumPy arrays) without 
+        building a dict for every row. Every field validator processes its
+        complete column at once (see ``Validator.process_column()``, 
+        validators without a column implementation process each cell 
+        separately), form validators are run only for rows without field 
+        errors.
+        
+        Returns a ``ColumnarResult`` with the validated columns and the 
+        invalid rows. This method raises an InvalidDataError only if the input
+        is not a dict or contains additional columns (if these are not 
+        allowed). Fail-fast mode is ignored."""
+        context = self._context_for_check(context)
+        if not isinstance(columns, dict):
+            self.error('invalid_type', columns, context, classname=columns.__class__)
+        length = self._column_length(columns)
+        plan = self.compile()
+        if not plan.uses_default_processing:
+            return self._process_columns_by_row(columns, length, context)
+        return plan.process_columns(columns, length, context)
+    
     def empty_value(self, context):
         return {}
     
     # -------------------------------------------------------------------------
     # private
     
+    def _column_length(self, columns):
+        length = None
+        for key, column in columns.items():
+            if length is None:
+                length = len(column)
+            elif len(column) != length:
+                message = 'all columns must have the same length (column %s has %d items, expected %d)' % (repr(key), len(column), length)
+                raise InvalidArgumentsError(message)
+        if length is None:
+            return 0
+        return length
+    
+    def _process_columns_by_row(self, columns, length, context):
+        # custom process() implementations must see every row as a dict
+        names = list(self.fieldvalidators().keys())
+        converted_columns = {}
+        for name in names:
+            converted_columns[name] = [None] * length
+        row_results = {}
+        for index in xrange(length):
+            fields = {}
+            for key, column in columns.items():
+                fields[key] = column[index]
+            result = self.check(fields, context)
+            if not result.is_valid():
+                row_results[index] = result
+                continue
+            for key, value in result.value().items():
+                if key not in converted_columns:
+                    converted_columns[key] = [None] * length
+                converted_columns[key][index] = value
+        return ColumnarResult(converted_columns, length, row_results=row_results, schema=self, context=context)
+    
+    def _uses_default_processing(self):
+        # The shortcuts in process_many() are only possible if process() does
+        # nothing else but calling the plan (so not if results are cached).
+        return (self._result_cache is None) and self._has_default_processing_methods()
+    
+    def _has_default_processing_methods(self):
+        return is_implemented_by(self.process, Validator, 'process') and \
+            is_implemented_by(super(Validator, self).process, BaseValidator, 'process') and \
+            is_implemented_by(self.is_empty, SchemaValidator, 'is_empty') and \
+            is_implemented_by(self.convert, SchemaValidator, 'convert') and \
+            is_implemented_by(self.validate, Validator, 'validate') and \
+            (not self._strip_input) and self._has_default_hooks()
+    
+    def _has_default_hooks(self):
+        # Subclasses of older versions might override the private helpers,
+        # these are only called if the plan is not used.
+        for name in ('_process_fields', '_process_field_validators', 
+                     '_process_form_validators', '_process_field', '_value_for_field'):
+            if not is_implemented_by(getattr(self, name), SchemaValidator, name):
+                return False
+        return True
+    
+    def _invalidate_plan(self):
+        self.__dict__['_plan'] = None
+        if self._result_cache is not None:
+            self._result_cache.clear()
+    
     def _value_for_field(self, field_name, validator, fields, context):
         if field_name in fields:
             return fields[field_name]
@@ -194,36 +1030,167 @@ class SchemaValidator(Validator):
             exceptions[key] = e
     
     def _process_field_validators(self, fields, context):
+        plan = self.compile()
+        if plan.uses_default_hooks:
+            return plan.process_field_validators(fields, context)
         validated_fields = {}
         exceptions = {}
-        for key, validator in self.fieldvalidators().items():
-            self._process_field(key, validator, fields, context, validated_fields, exceptions)
-        if len(exceptions) > 0:
-            self._raise_exception(exceptions, context)
-        if (not self.allow_additional_parameters) and (not set(fields).issubset(set(self.fieldvalidators()))):
-            additional_items = set(fields).difference(set(self.fieldvalidators()))
-            additional_arguments = ' '.join(["'%s'" % fields[key] for key in additional_items])
-            self.error('additional_items', None, context, additional_items=additional_arguments)
-        return validated_fields
+        steps = plan.fields
+        is_fail_fast = plan.is_fail_fast(context)
+        if is_fail_fast:
+            steps = plan.fields_by_cost
+        for step in steps:
+            key = step[0]
+            self._process_field(key, self._fields[key], fields, context, validated_fields, exceptions)
+            if is_fail_fast and (len(exceptions) > 0):
+                break
+        return plan.check_field_results(fields, validated_fields, exceptions, context)
     
     def _process_form_validators(self, validated_fields, context):
-        for formvalidator in self.formvalidators():
-            validated_fields = formvalidator.process(validated_fields, context=context)
-        return validated_fields
+        return self.compile().process_formvalidators(validated_fields, context)
     
     def _process_fields(self, fields, context):
+        plan = self.compile()
+        if plan.uses_default_hooks:
+            return plan.process(fields, context)
+        # at least one of the helpers above was overridden
         validated_fields = self._process_field_validators(fields, context)
         return self._process_form_validators(validated_fields, context)
     
     def _raise_exception(self, exceptions, context):
+        raise self._error_for_fields(exceptions, context)
+    
+    def _error_for_fields(self, exceptions, context):
         first_field_with_error = exceptions.keys()[0]
-        first_error = exceptions[first_field_with_error].details()
-        raise InvalidDataError(first_error.msg(), first_error.value(), first_error.key(), 
-                               context, error_dict=exceptions)
+        first_exception = exceptions[first_field_with_error]
+        first_error = first_exception.details()
+        return InvalidDataError(first_exception.raw_msg(), first_error.value(), first_error.key(), 
+                                context, error_dict=exceptions)
     
     def set_allow_additional_parameters(self, value):
         self.allow_additional_parameters = value
     
+    def set_fail_fast(self, value):
+        """If fail-fast mode is enabled the schema raises an exception for 
+        the first invalid field (skipping all remaining fields and form 
+        validators) instead of collecting errors for all fields. 
+        
+        You can also enable fail-fast mode with the constructor 
+        (``SchemaValidator(fail_fast=True)``), a class attribute for declarative
+        schemas or for a single call by setting 'fail_fast' in the context."""
+        self.fail_fast = value
+        self._invalidate_plan()
+    
+    def is_pure(self):
+        """Schemas are pure if they use the default processing and all field
+        and form validators are pure."""
+        if not self._has_default_processing_methods():
+            return False
+        for validator in self._fields.values():
+            if not is_pure(validator):
+                return False
+        for formvalidator in self._formvalidators:
+            if not is_pure(formvalidator):
+                return False
+        return True
+    
+    # -------------------------------------------------------------------------
+    # result cache
+    
+    def enable_result_cache(self, maxsize=1000, ttl=None, context_keys=('locale', 'fail_fast')):
+        """Cache the results of ``process()`` (the validated fields or the 
+        ``InvalidDataError``) in a size-bounded LRU cache so identical 
+        payloads (e.g. retries or duplicate webhook deliveries) are not 
+        validated again. The cache key consists of a canonical form of the
+        input (see ``canonical_key()``) and the values of the given 
+        ``context_keys``. Entries expire after ``ttl`` seconds (if set).
+        
+        Only pure schemas (see ``is_pure()``) can be cached, otherwise (also 
+        when adding validators later) an ``InvalidArgumentsError`` is raised.
+        Input with unhashable values is never cached. Every call gets its own
+        copy of the validated dict but nested values are shared so you 
+        should not modify them.
+        
+        The cache (including its statistics) is cleared whenever the schema 
+        changes."""
+        if not self.is_pure():
+            raise InvalidArgumentsError('%r contains validators which are not pure' % self)
+        self.__dict__['_result_cache_settings'] = (maxsize, ttl, tuple(context_keys))
+        self.__dict__['_result_cache'] = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._invalidate_plan()
+    
+    def disable_result_cache(self):
+        self.__dict__['_result_cache_settings'] = None
+        self.__dict__['_result_cache'] = None
+        self._invalidate_plan()
+    
+    def cache_stats(self):
+        """Return a dict with the number of cache hits, misses, evictions and
+        expirations, the current and maximum size and the hit rate (None if
+        the result cache is disabled)."""
+        cache = self._result_cache
+        if cache is None:
+            return None
+        stats = cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = 0.0
+        if lookups > 0:
+            stats['hit_rate'] = float(stats['hits']) / lookups
+        return stats
+    
+    def clear_cache(self):
+        if self._result_cache is not None:
+            self._result_cache.clear()
+    
+    def _check_cacheable(self, validator):
+        if (self._result_cache is not None) and (not is_pure(validator)):
+            raise InvalidArgumentsError('can not cache results: %r is not a pure validator' % validator)
+    
+    def _process_fields_cached(self, fields, context):
+        cache = self._result_cache
+        try:
+            key = [canonical_key(fields)]
+            for name in self._result_cache_settings[2]:
+                key.append(context.get(name))
+            key = tuple(key)
+            result = cache.get(key, _not_cached)
+        except TypeError:
+            # unhashable value
+            return self._process_fields(fields, context)
+        
+        if result is _not_cached:
+            try:
+                result = (True, self._process_fields(fields, context))
+            except InvalidDataError, e:
+                result = (False, e)
+            cache.set(key, result)
+        is_valid, value_or_error = result
+        if is_valid:
+            if isinstance(value_or_error, dict):
+                value_or_error = value_or_error.copy()
+            return value_or_error
+        raise self._copy_error(value_or_error, context)
+    
+    def _copy_error(self, error, context):
+        # a new exception for every call (same as MemoizingValidator)
+        return error.__class__(error.raw_msg(), error.value(), key=error.key(), 
+                               context=context, error_dict=error.error_dict() or None)
+    
+    def __getstate__(self):
+        state = self.super()
+        # the plan contains bound methods, just build it again when needed
+        state['_plan'] = None
+        # the cache contains a lock which can not be pickled
+        state['_result_cache'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.super()
+        settings = state.get('_result_cache_settings')
+        if settings is not None:
+            maxsize, ttl, context_keys = settings
+            self.__dict__['_result_cache'] = LRUCache(maxsize=maxsize, ttl=ttl)
+    
     # -------------------------------------------------------------------------
 
 
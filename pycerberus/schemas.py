@@ -95,7 +95,6 @@ class PositionalArgumentsParsingSchema(SchemaValidator):
         if value is None:
             value = {}
         fields = self._map_arguments_to_named_fields(value, context or {})
-        print 'fields', fields
         return self.super(fields, context=context)
 
 
@@ -0,0 +1,96 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.errors import InvalidDataError
+
+__all__ = ['StreamStatistics', 'validate_stream']
+
+
+class StreamStatistics(object):
+    """Counters which are updated while ``validate_stream()`` consumes its 
+    input. You can read them at any time (e.g. from a progress callback)."""
+    
+    def __init__(self):
+        self.processed = 0
+        self.valid = 0
+        self.invalid = 0
+        self.aborted = False
+    
+    def __repr__(self):
+        values = (self.__class__.__name__, self.processed, self.valid, self.invalid, self.aborted)
+        return '%s(processed=%d, valid=%d, invalid=%d, aborted=%s)' % values
+
+
+def validate_stream(validator, values, context=None, error_sink=None, 
+                    max_errors=None, statistics=None, progress=None, 
+                    progress_interval=10000):
+    """Process all items from the iterable ``values`` lazily and yield a tuple
+    ``(index, result)`` for each item where ``result`` is either the (Python)
+    value returned by the validator or the ``InvalidDataError``.
+    
+    Only one item is processed at a time and no references to previous items
+    are kept so you can validate unbounded inputs (e.g. lines of a log file) 
+    with constant memory.
+    
+    Options:
+     - ``error_sink``: callable which is called with ``(index, error)`` for 
+       every invalid item. Invalid items are not yielded if a sink is given.
+     - ``max_errors``: stop after that many invalid items
+     - ``statistics``: a ``StreamStatistics`` instance which is updated for 
+       every item (so you can retrieve the counters after the stream ended)
+     - ``progress``: callable which is called with the statistics after every
+       ``progress_interval`` items and at the end (also if the stream is 
+       aborted) unless the last call reported the final statistics already.
+    
+    All items are processed with the same ``context``."""
+    if context is None:
+        context = {}
+    if statistics is None:
+        statistics = StreamStatistics()
+    process = validator.process
+    reported = None
+    for index, value in enumerate(values):
+        try:
+            result = process(value, context)
+        except InvalidDataError, e:
+            statistics.processed += 1
+            statistics.invalid += 1
+            if error_sink is None:
+                yield (index, e)
+            else:
+                error_sink(index, e)
+            del e
+            if (max_errors is not None) and (statistics.invalid >= max_errors):
+                statistics.aborted = True
+        else:
+            statistics.processed += 1
+            statistics.valid += 1
+            yield (index, result)
+        if (progress is not None) and (statistics.processed % progress_interval == 0):
+            progress(statistics)
+            reported = statistics.processed
+        if statistics.aborted:
+            break
+    if (progress is not None) and (reported != statistics.processed):
+        progress(statistics)
@@ -0,0 +1,271 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Process the fields of a schema which wait for I/O (e.g. a validator which
+queries a local cache daemon or reads files) concurrently in a thread pool.
+
+Mark these validators with a ``blocking`` attribute (like ``cost``)::
+
+    class UsernameAvailable(StringValidator):
+        blocking = True
+        # ...
+
+``ThreadedProcessor`` submits all blocking fields to a (shared) 
+``ThreadPoolExecutor`` and processes the other fields inline (in the calling
+thread) in the meantime. Results and errors are merged in the same order as 
+``process()`` does so the outcome does not depend on the order in which the 
+threads finish. Form validators are run inline after all fields.
+
+Blocking fields which did not finish before the per-call ``timeout`` (in 
+seconds) fail with a 'timeout' error. ``max_concurrency`` limits the number
+of blocking fields which run at the same time for one processor (across all
+threads using it), e.g. to protect the service your validators talk to.
+
+In fail-fast mode the inline fields are processed first (cheapest first), an
+invalid inline field cancels all blocking fields which did not start yet.
+
+This module requires ``concurrent.futures`` (Python 3.2+)."""
+
+import time
+import weakref
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
+try:
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError
+except ImportError:
+    ThreadPoolExecutor = None
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.schema import SchemaValidator
+
+__all__ = ['is_blocking', 'shared_executor', 'ThreadedProcessor']
+
+
+def is_blocking(validator):
+    """Return True if the validator (or for schemas: any field validator) 
+    is marked as ``blocking``."""
+    if isinstance(validator, SchemaValidator):
+        for field_validator in validator.fieldvalidators().values():
+            if is_blocking(field_validator):
+                return True
+        return False
+    return bool(getattr(validator, 'blocking', False))
+
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+def shared_executor(max_workers=16):
+    """Return the thread pool which is used by all processors without an 
+    explicit executor (created on first use, ``max_workers`` is ignored 
+    after that)."""
+    global _shared_executor
+    _shared_executor_lock.acquire()
+    try:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=max_workers)
+        return _shared_executor
+    finally:
+        _shared_executor_lock.release()
+
+
+class ThreadedPlan(object):
+    """Splits the execution plan of a schema in blocking fields (processed in
+    the thread pool) and inline fields."""
+    
+    def __init__(self, schema, plan):
+        self.plan = plan
+        blocking_names = set()
+        for name, validator in schema.fieldvalidators().items():
+            if is_blocking(validator):
+                blocking_names.add(name)
+        self.blocking_fields = [step for step in plan.fields if step[0] in blocking_names]
+        self.inline_fields = [step for step in plan.fields if step[0] not in blocking_names]
+        self.inline_fields_by_cost = [step for step in plan.fields_by_cost if step[0] not in blocking_names]
+
+# ThreadedPlan for each ExecutionPlan (a new plan is compiled whenever the 
+# schema changes so this can never contain outdated information)
+_threaded_plans = weakref.WeakKeyDictionary()
+
+def _threaded_plan(schema):
+    plan = schema.compile()
+    threaded_plan = _threaded_plans.get(plan)
+    if threaded_plan is None:
+        threaded_plan = ThreadedPlan(schema, plan)
+        _threaded_plans[plan] = threaded_plan
+    return threaded_plan
+
+
+def _process_field(process, value, context):
+    # runs in a worker thread: InvalidDataErrors are returned (not raised) 
+    # so they are merged like the results of inline fields
+    try:
+        return process(value, context)
+    except InvalidDataError, e:
+        return e
+
+
+class ThreadedProcessor(object):
+    """Process values with ``schema`` like ``schema.process()`` but run the
+    blocking fields concurrently in a thread pool (see module documentation).
+    
+    Reuse the processor for all calls: The concurrency limit is enforced per
+    processor."""
+    
+    def __init__(self, schema, executor=None, max_concurrency=None, timeout=None):
+        if ThreadPoolExecutor is None:
+            raise ImportError('Threaded processing requires the "concurrent.futures" module.')
+        if executor is None:
+            executor = shared_executor()
+        self.schema = schema
+        self.executor = executor
+        self.timeout = timeout
+        self._slots = None
+        if max_concurrency is not None:
+            self._slots = threading.BoundedSemaphore(max_concurrency)
+    
+    def process(self, value, context=None, timeout=None):
+        """Return the validated fields or raise an ``InvalidDataError`` (same
+        as ``schema.process()``). ``timeout`` overrides the processor's 
+        timeout for this call."""
+        if context is None:
+            context = {}
+        if timeout is None:
+            timeout = self.timeout
+        schema = self.schema
+        if not schema._uses_default_processing():
+            return schema.process(value, context)
+        threaded_plan = _threaded_plan(schema)
+        if not threaded_plan.blocking_fields:
+            return schema.process(value, context)
+        
+        # same steps as SchemaValidator.convert()
+        fields = value
+        if fields is None:
+            return schema.empty_value(context)
+        if not isinstance(fields, dict):
+            schema.error('invalid_type', fields, context, classname=fields.__class__)
+        
+        plan = threaded_plan.plan
+        fail_fast = plan.is_fail_fast(context)
+        if fail_fast:
+            plan.check_additional_items(fields, context)
+            inline_fields = threaded_plan.inline_fields_by_cost
+        else:
+            inline_fields = threaded_plan.inline_fields
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+        
+        results = {}
+        submitted = self._submit(threaded_plan.blocking_fields, fields, context, deadline)
+        try:
+            for key, process, empty_value in inline_fields:
+                try:
+                    if key in fields:
+                        original_value = fields[key]
+                    else:
+                        original_value = empty_value(context)
+                    results[key] = process(original_value, context)
+                except InvalidDataError, e:
+                    if fail_fast:
+                        plan.record_skipped(len(plan.formvalidators))
+                        schema._raise_exception({key: e}, context)
+                    results[key] = e
+            self._collect(submitted, results, deadline, context)
+        finally:
+            for key, original_value, future in submitted:
+                if future is not None:
+                    future.cancel()
+        
+        # aggregate results in the same order as the synchronous plan
+        steps = plan.fields
+        if fail_fast:
+            steps = plan.fields_by_cost
+        validated_fields = {}
+        exceptions = {}
+        for key, process, empty_value in steps:
+            result = results[key]
+            if isinstance(result, InvalidDataError):
+                exceptions[key] = result
+                if fail_fast:
+                    break
+            else:
+                validated_fields[key] = result
+        validated_fields = plan.check_field_results(fields, validated_fields, exceptions, context)
+        return plan.process_formvalidators(validated_fields, context)
+    
+    def _submit(self, steps, fields, context, deadline):
+        """Submit all blocking fields to the executor, return a list of
+        (key, original value, future) tuples. The future is None if there was
+        no free slot before the deadline."""
+        submitted = []
+        for key, process, empty_value in steps:
+            if key in fields:
+                original_value = fields[key]
+            else:
+                original_value = empty_value(context)
+            future = None
+            if self._acquire_slot(deadline):
+                try:
+                    future = self.executor.submit(_process_field, process, original_value, context)
+                except:
+                    self._release_slot()
+                    raise
+                if self._slots is not None:
+                    future.add_done_callback(self._release_slot)
+            submitted.append((key, original_value, future))
+        return submitted
+    
+    def _collect(self, submitted, results, deadline, context):
+        for key, original_value, future in submitted:
+            if future is None:
+                results[key] = self._timeout_error(original_value, context)
+                continue
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.time())
+            try:
+                results[key] = future.result(remaining)
+            except TimeoutError:
+                results[key] = self._timeout_error(original_value, context)
+    
+    def _timeout_error(self, value, context):
+        try:
+            self.schema.error('timeout', value, context)
+        except InvalidDataError, e:
+            return e
+    
+    def _acquire_slot(self, deadline):
+        if self._slots is None:
+            return True
+        if deadline is None:
+            return self._slots.acquire()
+        return self._slots.acquire(True, max(0, deadline - time.time()))
+    
+    def _release_slot(self, future=None):
+        if self._slots is not None:
+            self._slots.release()
@@ -10,5 +10,7 @@ of all included validators.
 from pycerberus.validators.basic_numbers import *
 from pycerberus.validators.domain import *
 from pycerberus.validators.email import *
+from pycerberus.validators.foreach import *
+from pycerberus.validators.memoizing import *
 from pycerberus.validators.string import *
 
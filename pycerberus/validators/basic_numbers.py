@@ -22,9 +22,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from pycerberus.api import Validator
+import sys
+
+from pycerberus.api import is_implemented_by, BaseValidator, Validator
 from pycerberus.errors import InvalidArgumentsError
 from pycerberus.i18n import _
+from pycerberus.result import ColumnResult
 
 __all__ = ['IntegerValidator']
 
@@ -47,6 +50,9 @@ class IntegerValidator(Validator):
                 'too_big': _(u'Number must be %(max)d or smaller.'),
                }
     
+    def is_pure(self):
+        return self.__class__ is IntegerValidator
+    
     def convert(self, value, context):
         if not isinstance(value, (int, basestring)):
             classname = value.__class__.__name__
@@ -61,5 +67,111 @@ class IntegerValidator(Validator):
             self.error('too_low', value, context, min=self.min)
         if (self.max is not None) and (value > self.max):
             self.error('too_big', value, context, max=self.max)
+    
+    def process_column(self, column, context=None):
+        """Convert and range-check a whole column at once. Returns a 
+        ``ColumnResult``, error instances are only created on demand.
+        
+        NumPy arrays with an integer dtype are checked with vectorized 
+        comparisons (no Python code per cell), the result contains a NumPy
+        array as well. All other inputs are converted with a single tight loop 
+        which does exactly the same checks as ``process()``."""
+        if not self._has_default_column_processing():
+            return self.super(column, context=context)
+        context = self._context_for_check(context)
+        # NumPy arrays can only be passed if NumPy was imported already - no 
+        # need to slow down the import of pycerberus with an optional import.
+        numpy = sys.modules.get('numpy')
+        is_array = (numpy is not None) and isinstance(column, numpy.ndarray)
+        if is_array and (column.dtype.kind in 'iu'):
+            return self._process_integer_array(numpy, column, context)
+        if is_array:
+            values, failures = self._process_cells(column.tolist(), context)
+            values, mask = self._as_array(numpy, values, failures)
+            return ColumnResult(values, failures, mask=mask, validator=self, context=context)
+        values, failures = self._process_cells(column, context)
+        return ColumnResult(values, failures, validator=self, context=context)
+    
+    # --------------------------------------------------------------------------
+    # private helpers
+    
+    def _has_default_column_processing(self):
+        # process_column() inlines process(), is_empty(), convert() and 
+        # validate() so subclasses which override any of these must use the
+        # generic (per-cell) implementation.
+        return is_implemented_by(self.process, Validator, 'process') and \
+            is_implemented_by(super(Validator, self).process, BaseValidator, 'process') and \
+            is_implemented_by(self.is_empty, Validator, 'is_empty') and \
+            is_implemented_by(self.convert, IntegerValidator, 'convert') and \
+            is_implemented_by(self.validate, IntegerValidator, 'validate')
+    
+    def _process_cells(self, cells, context):
+        min_ = self.min
+        max_ = self.max
+        strip_input = self._strip_input
+        is_required = (self.is_required() == True)
+        empty_value = self.empty_value(context)
+        values = []
+        append = values.append
+        failures = {}
+        for index, value in enumerate(cells):
+            original_value = value
+            if strip_input and hasattr(value, 'strip'):
+                value = value.strip()
+            if value is None:
+                if is_required:
+                    failures[index] = ('empty', original_value)
+                    append(None)
+                else:
+                    append(empty_value)
+                continue
+            if not isinstance(value, (int, basestring)):
+                failures[index] = ('invalid_type', original_value)
+                append(None)
+                continue
+            try:
+                number = int(value)
+            except ValueError:
+                failures[index] = ('invalid_number', original_value)
+                append(None)
+                continue
+            if (min_ is not None) and (number < min_):
+                failures[index] = ('too_low', original_value)
+                append(None)
+            elif (max_ is not None) and (number > max_):
+                failures[index] = ('too_big', original_value)
+                append(None)
+            else:
+                append(number)
+        return values, failures
+    
+    def _process_integer_array(self, numpy, column, context):
+        mask = numpy.zeros(len(column), dtype=bool)
+        failures = {}
+        if self.min is not None:
+            too_low = column < self.min
+            for index in numpy.flatnonzero(too_low).tolist():
+                failures[index] = ('too_low', int(column[index]))
+            mask |= too_low
+        if self.max is not None:
+            too_big = column > self.max
+            for index in numpy.flatnonzero(too_big).tolist():
+                failures[index] = ('too_big', int(column[index]))
+            mask |= too_big
+        values = column
+        if failures:
+            values = numpy.where(mask, 0, column)
+        return ColumnResult(values, failures, mask=mask, validator=self, context=context)
+    
+    def _as_array(self, numpy, values, failures):
+        mask = numpy.zeros(len(values), dtype=bool)
+        for index in failures:
+            mask[index] = True
+            values[index] = 0
+        try:
+            return numpy.array(values, dtype=numpy.int64), mask
+        except OverflowError:
+            # Python ints which do not fit into 64 bit
+            return numpy.array(values, dtype=object), mask
 
 
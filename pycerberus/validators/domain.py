@@ -23,15 +23,43 @@
 # THE SOFTWARE.
 
 import re
+from encodings import idna as idna_codec
 
+from pycerberus.errors import InvalidArgumentsError
 from pycerberus.i18n import _
+from pycerberus.lib import LRUCache
 from pycerberus.validators.string import StringValidator
 
 __all__ = ['DomainNameValidator']
 
 
 class DomainNameValidator(StringValidator):
-    """A validator to check if an domain name is syntactically correct."""
+    """A validator to check if an domain name is syntactically correct.
+    
+    By default only ASCII domain names are accepted. If you specify 
+    ``idna=True`` internationalized domain names (e.g. u'bücher.example') are
+    accepted as well and the length restrictions of DNS (63 characters per 
+    label, 253 characters in total - both measured for the ASCII/punycode form)
+    are enforced. ``idna_output`` controls the returned value: 'ascii' returns
+    the punycode form (u'xn--bcher-kva.example'), 'unicode' the decoded form 
+    (u'bücher.example'), None the input as given. Specifying an 
+    ``idna_output`` implies ``idna=True``. Both options must be given as 
+    keyword arguments.
+    
+    Encoding/decoding is done with the 'idna' codec of the standard library.
+    Results are kept in a shared, size-bounded cache (``domain_cache``) so 
+    repeated domains are only converted once."""
+    
+    def __init__(self, *args, **kwargs):
+        # keyword-only so positional arguments of Validator keep working
+        idna = kwargs.pop('idna', False)
+        idna_output = kwargs.pop('idna_output', None)
+        if idna_output not in (None, 'ascii', 'unicode'):
+            message = "idna_output must be None, 'ascii' or 'unicode' (not %s)" % repr(idna_output)
+            raise InvalidArgumentsError(message)
+        self.idna = idna or (idna_output is not None)
+        self.idna_output = idna_output
+        self.super(*args, **kwargs)
     
     def messages(self):
         return {
@@ -39,20 +67,132 @@ class DomainNameValidator(StringValidator):
             'leading_dot':       _('Invalid domain: %(domain)s must not start with a dot.'),
             'trailing_dot':      _('Invalid domain: %(domain)s must not end with a dot.'),
             'double_dot':        _('Invalid domain: %(domain)s must not contain consecutive dots.'),
+            'invalid_idna':      _('Invalid domain: %(domain)s is not a valid internationalized domain name.'),
+            'label_too_long':    _('Invalid domain: label %(label)s in %(domain)s is longer than 63 characters.'),
+            'domain_too_long':   _('Invalid domain: %(domain)s is longer than 253 characters.'),
         }
     
+    def is_pure(self):
+        return self.__class__ is DomainNameValidator
+    
+    def convert(self, value, context):
+        value = super(DomainNameValidator, self).convert(value, context)
+        if not self.idna:
+            return value
+        return self._convert_idna_domain(value, context)
+    
     def validate(self, value, context):
-        self.super()
+        super(DomainNameValidator, self).validate(value, context)
+        if self.idna:
+            # all checks were done by convert() already
+            return
+        self._validate_dots(value, context)
+        # precompiled character class without any backtracking: linear time
+        # even for very long inputs
+        match = _invalid_character.search(value)
+        if match is not None:
+            self.error('invalid_domain_character', value, context, invalid_character=repr(match.group()), domain=repr(value))
+    
+    # --------------------------------------------------------------------------
+    # private helpers
+    
+    def _validate_dots(self, value, context):
         if value.startswith('.'):
             self.error('leading_dot', value, context, domain=repr(value))
         if value.endswith('.'):
             self.error('trailing_dot', value, context, domain=repr(value))
         if '..' in value:
             self.error('double_dot', value, context, domain=repr(value))
-        
-        match = re.search('([^a-zA-Z0-9\.\-])', value)
+    
+    def _convert_idna_domain(self, value, context):
+        self._validate_dots(value, context)
+        forms = normalize_domain(value)
+        if forms is None:
+            self.error('invalid_idna', value, context, domain=repr(value))
+        ascii_domain, unicode_domain = forms
+        if '' in ascii_domain.split('.'):
+            # nameprep maps some characters to nothing (e.g. u'\u200b') so 
+            # labels can become empty
+            self.error('invalid_idna', value, context, domain=repr(value))
+        match = _invalid_character.search(ascii_domain)
         if match is not None:
-            self.error('invalid_domain_character', value, context, invalid_character=repr(match.group(1)), domain=repr(value))
+            self.error('invalid_domain_character', value, context, invalid_character=repr(match.group()), domain=repr(value))
+        for label in ascii_domain.split('.'):
+            if len(label) > 63:
+                self.error('label_too_long', value, context, label=repr(label), domain=repr(value))
+        if len(ascii_domain) > 253:
+            self.error('domain_too_long', value, context, domain=repr(value))
+        
+        if self.idna_output == 'ascii':
+            return ascii_domain
+        elif self.idna_output == 'unicode':
+            return unicode_domain
+        return value
+
+
+_invalid_character = re.compile('[^a-zA-Z0-9\\.\\-]')
+
+#: Cache for normalized domain names (shared by all validators), maps the 
+#: input to (ascii form, unicode form) or None for invalid IDNs.
+domain_cache = LRUCache(maxsize=10000)
+_not_cached = object()
+
+
+def _is_ascii(value):
+    try:
+        value.encode('ascii')
+    except UnicodeError:
+        return False
+    return True
+
+
+def _label_to_ascii(label):
+    if _is_ascii(label):
+        return label
+    # Same as encodings.idna.ToASCII() but without the length check so the 
+    # validator can return a specific error message.
+    label = idna_codec.nameprep(label)
+    if _is_ascii(label):
+        return label
+    return 'xn--' + label.encode('punycode').decode('ascii')
+
+
+def _label_to_unicode(label):
+    if label[:4].lower() != 'xn--':
+        return label
+    return idna_codec.ToUnicode(label)
+
 
+def _normalize_uncached(value):
+    if not isinstance(value, unicode):
+        if not _is_ascii(value):
+            # non-ASCII byte strings (Python 2): the validator will complain 
+            # about the invalid characters.
+            return (value, value)
+        value = value.decode('ascii')
+    try:
+        ascii_labels = [_label_to_ascii(label) for label in value.split('.')]
+        ascii_domain = '.'.join(ascii_labels)
+        for label in ascii_labels:
+            if len(label) > 63:
+                # ToUnicode() would fail, the validator rejects the label anyway
+                return (ascii_domain, ascii_domain)
+        unicode_labels = [_label_to_unicode(label) for label in ascii_labels]
+    except UnicodeError:
+        return None
+    return (ascii_domain, '.'.join(unicode_labels))
 
 
+def normalize_domain(value):
+    """Return a tuple (ascii form, unicode form) for the given domain name or 
+    None if the domain is not a valid IDN. Results are cached in 
+    ``domain_cache``."""
+    if _is_ascii(value) and ('xn--' not in value.lower()):
+        # plain ASCII domains don't need any conversion (and should not evict
+        # IDNs from the cache)
+        return (value, value)
+    forms = domain_cache.get(value, _not_cached)
+    if forms is _not_cached:
+        forms = _normalize_uncached(value)
+        domain_cache.set(value, forms)
+    return forms
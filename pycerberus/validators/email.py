@@ -39,11 +39,11 @@ class EmailAddressValidator(DomainNameValidator):
     an email address should be about.
     
     Therefore this validator is currently extremly simple and does not handle
-    internationalized local parts/domains.
+    internationalized local parts. Internationalized domains are accepted if 
+    you specify ``idna=True`` (see the DomainNameValidator for details, 
+    ``idna_output`` converts only the domain part of the address).
     
     For the future I envision some extensions here:
-     - support internationalized domain names (possibly also encode to/
-       decode from idna) if specified by flag
      - More flexible structure if there must be a second-level domain
     
     Something that should not happen in this validator:
@@ -59,17 +59,37 @@ class EmailAddressValidator(DomainNameValidator):
             'invalid_email_character': _(u'Invalid character %(invalid_character)s in email address %(emailaddress)s.'),
         }
     
+    def is_pure(self):
+        return self.__class__ is EmailAddressValidator
+    
+    def convert(self, emailaddress, context):
+        # skip DomainNameValidator.convert(), only the domain part must be 
+        # converted
+        emailaddress = super(DomainNameValidator, self).convert(emailaddress, context)
+        if not self.idna:
+            return emailaddress
+        localpart, domain = self._split_emailaddress(emailaddress, context)
+        domain = self._convert_idna_domain(domain, context)
+        self._validate_localpart(localpart, emailaddress, context)
+        return localpart + '@' + domain
+    
     def validate(self, emailaddress, context):
-        parts = emailaddress.split('@')
-        if len(parts) != 2:
-            self.error('single_at', emailaddress, context)
-        localpart, domain = parts
+        if self.idna:
+            # all checks were done by convert() already
+            return
+        localpart, domain = self._split_emailaddress(emailaddress, context)
         self.super(domain, context)
         self._validate_localpart(localpart, emailaddress, context)
     
     # --------------------------------------------------------------------------
     # private helpers
     
+    def _split_emailaddress(self, emailaddress, context):
+        parts = emailaddress.split('@')
+        if len(parts) != 2:
+            self.error('single_at', emailaddress, context)
+        return parts
+    
     def _validate_localpart(self, localpart, emailaddress, context):
         match = re.search('([^a-zA-Z0-9\.\_])', localpart)
         if match is not None:
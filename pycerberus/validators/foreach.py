@@ -0,0 +1,165 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.i18n import _
+
+__all__ = ['ForEachValidator']
+
+
+class ForEachValidator(Validator):
+    """Validate every item of a list with the given validator (which may also 
+    be a schema) and return a list of the converted items::
+    
+        ids = ForEachValidator(IntegerValidator(min=1), min_length=1)
+        ids.process(['1', '2']) # [1, 2]
+    
+    Items are processed in one loop with the same context. If any items are 
+    invalid, an InvalidDataError is raised which contains the errors for all 
+    invalid items in its ``error_dict()`` (keyed by position, message and key 
+    are taken from the first invalid item). Specify ``max_errors`` to stop 
+    after that many invalid items.
+    
+    Iterators (e.g. generators) are processed lazily: ``process()`` returns a
+    generator which yields the converted items so you can validate very large
+    inputs without keeping all items in memory. Invalid items are skipped, 
+    the generator raises the InvalidDataError (with all item errors seen so 
+    far) after the input is exhausted (or after ``max_errors`` invalid items).
+    ``max_length`` is checked as soon as the generator gets too many items, 
+    ``min_length`` after the input is exhausted."""
+    
+    def __init__(self, validator, min_length=None, max_length=None, max_errors=None, *args, **kwargs):
+        if isinstance(validator, type):
+            validator = validator()
+        if (min_length is not None) and (max_length is not None) and (min_length > max_length):
+            message = 'min_length must be smaller or equal to max_length (%s > %s)' % (repr(min_length), repr(max_length))
+            raise InvalidArgumentsError(message)
+        if (max_errors is not None) and (max_errors < 1):
+            raise InvalidArgumentsError('max_errors must be at least 1 (not %s)' % repr(max_errors))
+        self._validator = validator
+        self.min_length = min_length
+        self.max_length = max_length
+        self.max_errors = max_errors
+        self.super(*args, **kwargs)
+    
+    def messages(self):
+        return {
+                'invalid_type': _(u'Validator got unexpected input (expected list, got "%(classname)s").'),
+                'too_short': _(u'Please enter at least %(min_length)d items.'),
+                'too_long': _(u'Please enter at most %(max_length)d items.'),
+               }
+    
+    def validator(self):
+        "Return the validator for the items."
+        return self._validator
+    
+    def is_pure(self):
+        return (self.__class__ is ForEachValidator) and self._validator.is_pure()
+    
+    def convert(self, value, context):
+        if self._is_iterator(value, context):
+            return self._process_lazily(value, context)
+        self._check_length(value, len(value), context)
+        return self._process_items(value, context)
+    
+    # --------------------------------------------------------------------------
+    # private helpers
+    
+    def _is_iterator(self, value, context):
+        """Return True if ``value`` is an iterator (which is processed lazily)
+        or False for sequences. Raises an InvalidDataError otherwise."""
+        if isinstance(value, (basestring, dict)):
+            self.error('invalid_type', value, context, classname=value.__class__.__name__)
+        try:
+            iterator = iter(value)
+        except TypeError:
+            self.error('invalid_type', value, context, classname=value.__class__.__name__)
+        if iterator is value:
+            return True
+        if not hasattr(value, '__len__'):
+            self.error('invalid_type', value, context, classname=value.__class__.__name__)
+        return False
+    
+    def _check_length(self, value, length, context):
+        if (self.min_length is not None) and (length < self.min_length):
+            self.error('too_short', value, context, min_length=self.min_length)
+        if (self.max_length is not None) and (length > self.max_length):
+            self.error('too_long', value, context, max_length=self.max_length)
+    
+    def _process_items(self, items, context):
+        if self.max_errors is None:
+            # process_many() does all lookups only once
+            results = self._validator.process_many(items, context)
+            errors = {}
+            for index, result in enumerate(results):
+                if isinstance(result, InvalidDataError):
+                    errors[index] = result
+            if len(errors) > 0:
+                self._raise_item_errors(errors, context)
+            return results
+        
+        process = self._validator.process
+        max_errors = self.max_errors
+        results = []
+        append = results.append
+        errors = {}
+        for index, item in enumerate(items):
+            try:
+                append(process(item, context))
+            except InvalidDataError, e:
+                errors[index] = e
+                if len(errors) >= max_errors:
+                    break
+        if len(errors) > 0:
+            self._raise_item_errors(errors, context)
+        return results
+    
+    def _process_lazily(self, items, context):
+        process = self._validator.process
+        max_length = self.max_length
+        max_errors = self.max_errors
+        errors = {}
+        length = 0
+        for item in items:
+            index = length
+            length += 1
+            if (max_length is not None) and (length > max_length):
+                self.error('too_long', items, context, max_length=max_length)
+            try:
+                result = process(item, context)
+            except InvalidDataError, e:
+                errors[index] = e
+                if (max_errors is not None) and (len(errors) >= max_errors):
+                    self._raise_item_errors(errors, context)
+                continue
+            yield result
+        self._check_length(items, length, context)
+        if len(errors) > 0:
+            self._raise_item_errors(errors, context)
+    
+    def _raise_item_errors(self, errors, context):
+        first_error = errors[min(errors)]
+        raise InvalidDataError(first_error.raw_msg(), first_error.value(), first_error.key(), 
+                               context, error_dict=errors)
@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.lib import LRUCache
+
+__all__ = ['MemoizingValidator']
+
+_not_cached = object()
+
+
+class MemoizingValidator(Validator):
+    """Wraps a *pure* validator (see ``is_pure()``) and caches its results 
+    (converted values as well as validation errors) in a size-bounded LRU 
+    cache. The cache key consists of the input value (and its type so e.g. 1
+    and 1.0 are different) and the values of the given ``context_keys`` (by 
+    default only the locale)::
+    
+        domain = MemoizingValidator(DomainNameValidator(), maxsize=10000)
+    
+    This is useful if the same input values occur very often (e.g. country
+    codes or domain names). Unhashable values are never cached. The converted
+    values are shared by all callers so you should not modify them.
+    
+    The cache is thread-safe."""
+    
+    def __init__(self, validator, maxsize=1000, context_keys=('locale',)):
+        if isinstance(validator, type):
+            validator = validator()
+        if not validator.is_pure():
+            raise InvalidArgumentsError('%r is not a pure validator' % validator)
+        self._validator = validator
+        self._maxsize = maxsize
+        self._context_keys = tuple(context_keys)
+        self._cache = LRUCache(maxsize=maxsize)
+        super(MemoizingValidator, self).__init__()
+    
+    def validator(self):
+        "Return the wrapped validator."
+        return self._validator
+    
+    def is_pure(self):
+        return True
+    
+    def process(self, value, context=None):
+        if context is None:
+            context = {}
+        key = [value.__class__, value]
+        for name in self._context_keys:
+            key.append(context.get(name))
+        key = tuple(key)
+        try:
+            result = self._cache.get(key, _not_cached)
+        except TypeError:
+            # unhashable value
+            return self._validator.process(value, context)
+        
+        if result is _not_cached:
+            try:
+                result = (True, self._validator.process(value, context))
+            except InvalidDataError, e:
+                result = (False, e)
+            self._cache.set(key, result)
+        is_valid, value_or_error = result
+        if is_valid:
+            return value_or_error
+        raise self._copy_error(value_or_error, context)
+    
+    def _copy_error(self, error, context):
+        # a new exception for every call so tracebacks are not shared between
+        # threads, also it must contain the context of the caller.
+        return error.__class__(error.raw_msg(), error.value(), key=error.key(), 
+                               context=context, error_dict=error.error_dict() or None)
+    
+    def empty_value(self, context):
+        return self._validator.empty_value(context)
+    
+    def as_string(self, value, context=None):
+        return self._validator.as_string(value, context)
+    
+    def cache_stats(self):
+        """Return a dict with the number of cache hits, misses and evictions as
+        well as the current and maximum size."""
+        return self._cache.stats()
+    
+    def clear_cache(self):
+        self._cache.clear()
+    
+    def __getstate__(self):
+        state = self.super()
+        # the cache contains a lock which can not be pickled
+        del state['_cache']
+        return state
+    
+    def __setstate__(self, state):
+        self.super()
+        self.__dict__['_cache'] = LRUCache(maxsize=self._maxsize)
+
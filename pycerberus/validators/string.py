@@ -44,5 +44,8 @@ class StringValidator(Validator):
     
     def is_empty(self, value, context):
         return value in (None, '')
+    
+    def is_pure(self):
+        return self.__class__ is StringValidator
 
 
@@ -0,0 +1,251 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import time
+
+try:
+    import asyncio
+    from async_validators import add_marker, AsyncFormValidator, \
+        AsyncIntegerValidator, UniqueNameValidator
+    from pycerberus.aio import is_async
+except (ImportError, SyntaxError):
+    asyncio = None
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import AttrDict, PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import ForEachValidator, IntegerValidator, \
+    StringValidator
+
+
+class AsyncValidationTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        if asyncio is None:
+            self.skipTest('asyncio is not available')
+        self.loop = asyncio.new_event_loop()
+    
+    def tearDown(self):
+        self.loop.close()
+        self.super()
+    
+    def aprocess(self, validator, value, context=None):
+        return self.loop.run_until_complete(validator.aprocess(value, context))
+    
+    def assert_async_error(self, validator, value, context=None):
+        return self.assert_raises(InvalidDataError, self.aprocess, validator, value, context)
+    
+    def _schema(self, *formvalidators):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        schema.add('name', UniqueNameValidator(taken=('admin', )))
+        schema.add('amount', AsyncIntegerValidator(required=False))
+        for formvalidator in formvalidators:
+            schema.add_formvalidator(formvalidator)
+        return schema
+    
+    # -------------------------------------------------------------------------
+    # single validators
+    
+    def test_sync_validators_can_be_used_with_aprocess(self):
+        self.assert_false(is_async(IntegerValidator()))
+        self.assert_equals(42, self.aprocess(IntegerValidator(), '42'))
+        error = self.assert_async_error(IntegerValidator(), 'foo')
+        self.assert_equals('invalid_number', error.details().key())
+    
+    def test_can_await_validate(self):
+        validator = UniqueNameValidator(taken=('admin', ))
+        self.assert_true(is_async(validator))
+        self.assert_equals('foo', self.aprocess(validator, 'foo'))
+        error = self.assert_async_error(validator, 'admin')
+        self.assert_equals('not_unique', error.details().key())
+    
+    def test_can_await_convert(self):
+        self.assert_equals(42, self.aprocess(AsyncIntegerValidator(), '42'))
+        error = self.assert_async_error(AsyncIntegerValidator(), 'foo')
+        self.assert_equals('invalid_number', error.details().key())
+    
+    def test_empty_values_are_handled_before_awaiting(self):
+        self.assert_none(self.aprocess(AsyncIntegerValidator(required=False), None))
+        error = self.assert_async_error(AsyncIntegerValidator(), None)
+        self.assert_equals('empty', error.details().key())
+    
+    # -------------------------------------------------------------------------
+    # schemas
+    
+    def test_sync_schema_is_processed_synchronously(self):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        self.assert_false(is_async(schema))
+        self.assert_equals({'id': 42}, self.aprocess(schema, {'id': '42'}))
+    
+    def test_can_process_schema_with_async_fields(self):
+        schema = self._schema()
+        self.assert_true(is_async(schema))
+        self.assert_equals({'id': 1, 'name': 'foo', 'amount': 21}, 
+                           self.aprocess(schema, {'id': '1', 'name': 'foo', 'amount': '21'}))
+        self.assert_equals({'id': 1, 'name': 'foo', 'amount': None}, 
+                           self.aprocess(schema, {'id': '1', 'name': 'foo'}))
+    
+    def test_errors_are_aggregated_like_in_sync_path(self):
+        schema = self._schema()
+        values = {'id': 'foo', 'name': 'admin', 'amount': 'bar'}
+        error = self.assert_async_error(schema, values)
+        self.assert_equals(['amount', 'id', 'name'], sorted(error.error_dict().keys()))
+        self.assert_equals('not_unique', error.error_for('name').details().key())
+        self.assert_equals('invalid_number', error.error_for('amount').details().key())
+        
+        first_key = list(error.error_dict().keys())[0]
+        self.assert_equals(error.error_for(first_key).details().key(), error.details().key())
+    
+    def test_invalid_input_types_are_rejected(self):
+        error = self.assert_async_error(self._schema(), 'foo')
+        self.assert_equals('invalid_type', error.details().key())
+        self.assert_equals({}, self.aprocess(self._schema(), None))
+    
+    def test_async_fields_are_processed_concurrently(self):
+        schema = SchemaValidator()
+        for name in ('first', 'second', 'third'):
+            schema.add(name, UniqueNameValidator(delay=0.1))
+        start = time.time()
+        self.aprocess(schema, {'first': 'a', 'second': 'b', 'third': 'c'})
+        self.assert_true(time.time() - start < 0.25)
+    
+    def test_can_use_async_form_validators(self):
+        schema = SchemaValidator()
+        schema.add('name', StringValidator())
+        schema.add('repeated_name', StringValidator())
+        schema.add_formvalidator(AsyncFormValidator())
+        schema.add_formvalidator(AttrDict(process=add_marker))
+        self.assert_true(is_async(schema))
+        
+        result = self.aprocess(schema, {'name': 'foo', 'repeated_name': 'foo'})
+        self.assert_equals({'name': 'foo', 'repeated_name': 'foo', 'marker': True}, result)
+        error = self.assert_async_error(schema, {'name': 'foo', 'repeated_name': 'bar'})
+        self.assert_equals('mismatch', error.details().key())
+    
+    def test_form_validators_are_skipped_if_field_validation_failed(self):
+        schema = self._schema(AttrDict(process=add_marker))
+        error = self.assert_async_error(schema, {'id': 'foo', 'name': 'bar'})
+        self.assert_equals(['id'], list(error.error_dict().keys()))
+    
+    def test_nested_schemas_can_contain_async_validators(self):
+        schema = SchemaValidator()
+        schema.add('nested', self._schema())
+        self.assert_true(is_async(schema))
+        result = self.aprocess(schema, {'nested': {'id': '1', 'name': 'foo'}})
+        self.assert_equals({'nested': {'id': 1, 'name': 'foo', 'amount': None}}, result)
+        error = self.assert_async_error(schema, {'nested': {'id': '1', 'name': 'admin'}})
+        self.assert_equals('not_unique', error.error_for('nested').error_for('name').details().key())
+    
+    def test_fail_fast_raises_sync_errors_without_awaiting(self):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        schema.add('name', UniqueNameValidator(delay=1.0))
+        start = time.time()
+        error = self.assert_async_error(schema, {'id': 'foo', 'name': 'bar'}, {'fail_fast': True})
+        self.assert_true(time.time() - start < 0.5)
+        self.assert_equals(['id'], list(error.error_dict().keys()))
+    
+    def test_fail_fast_cancels_remaining_async_fields(self):
+        schema = SchemaValidator(fail_fast=True)
+        schema.add('slow', UniqueNameValidator(delay=1.0))
+        schema.add('fast', UniqueNameValidator(taken=('admin', )))
+        start = time.time()
+        error = self.assert_async_error(schema, {'slow': 'foo', 'fast': 'admin'})
+        self.assert_true(time.time() - start < 0.5)
+        self.assert_equals(['fast'], list(error.error_dict().keys()))
+        self.assert_equals('not_unique', error.details().key())
+    
+    def test_fail_fast_returns_same_result_for_valid_input(self):
+        schema = self._schema(AttrDict(process=add_marker))
+        values = {'id': '1', 'name': 'foo', 'amount': '21'}
+        self.assert_equals({'id': 1, 'name': 'foo', 'amount': 21, 'marker': True}, 
+                           self.aprocess(schema, values, {'fail_fast': True}))
+    
+    def test_schemas_with_custom_processing_reject_async_validators(self):
+        class CustomSchema(SchemaValidator):
+            name = UniqueNameValidator()
+            def convert(self, fields, context):
+                return self.super()
+        schema = CustomSchema()
+        self.assert_raises(NotImplementedError, self.aprocess, schema, {'name': 'foo'})
+        
+        schema = SchemaValidator(strip=True)
+        schema.add('name', UniqueNameValidator())
+        self.assert_raises(NotImplementedError, self.aprocess, schema, {'name': 'foo'})
+    
+    def test_schemas_with_custom_processing_work_without_async_validators(self):
+        class CustomSchema(SchemaValidator):
+            id = IntegerValidator()
+            def convert(self, fields, context):
+                fields = self.super()
+                fields['marker'] = True
+                return fields
+        self.assert_equals({'id': 1, 'marker': True}, self.aprocess(CustomSchema(), {'id': '1'}))
+    
+    # -------------------------------------------------------------------------
+    # lists
+    
+    def test_can_process_list_with_async_validator(self):
+        validator = ForEachValidator(UniqueNameValidator(taken=('admin', )))
+        self.assert_true(is_async(validator))
+        self.assert_false(is_async(ForEachValidator(IntegerValidator())))
+        self.assert_equals(['foo', 'bar'], self.aprocess(validator, ['foo', 'bar']))
+        self.assert_equals([1, 2], self.aprocess(ForEachValidator(AsyncIntegerValidator()), ['1', '2']))
+    
+    def test_item_errors_are_aggregated_for_async_validator(self):
+        validator = ForEachValidator(AsyncIntegerValidator())
+        error = self.assert_async_error(validator, ['1', 'foo', '3', 'bar'])
+        self.assert_equals([1, 3], sorted(error.error_dict().keys()))
+        self.assert_equals('invalid_number', error.details().key())
+        
+        validator = ForEachValidator(AsyncIntegerValidator(), max_errors=1)
+        error = self.assert_async_error(validator, ['1', 'foo', '3', 'bar'])
+        self.assert_equals([1], list(error.error_dict().keys()))
+        
+        error = self.assert_async_error(ForEachValidator(AsyncIntegerValidator(), max_length=1), ['1', '2'])
+        self.assert_equals('too_long', error.details().key())
+    
+    def test_iterators_are_not_supported_for_async_validator(self):
+        validator = ForEachValidator(AsyncIntegerValidator())
+        self.assert_raises(NotImplementedError, self.aprocess, validator, iter(['1']))
+    
+    def test_schema_can_contain_list_with_async_validator(self):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        schema.add('names', ForEachValidator(UniqueNameValidator(taken=('admin', ))))
+        self.assert_true(is_async(schema))
+        self.assert_equals({'id': 1, 'names': ['foo']}, self.aprocess(schema, {'id': '1', 'names': ['foo']}))
+        error = self.assert_async_error(schema, {'id': '1', 'names': ['foo', 'admin']})
+        self.assert_equals('not_unique', error.error_for('names').error_for(1).details().key())
+
+
+class AprocessWithoutAsyncioTest(PythonicTestCase):
+    
+    def test_aprocess_raises_error_on_old_python_versions(self):
+        if asyncio is not None:
+            self.skipTest('asyncio is available')
+        self.assert_raises(NotImplementedError, IntegerValidator().aprocess, '42')
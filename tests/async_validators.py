@@ -0,0 +1,74 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""Asynchronous validators for async_validation_test (this module needs 
+Python 3.5+ because of the ``async`` syntax)."""
+
+import asyncio
+
+from pycerberus.api import Validator
+
+
+class UniqueNameValidator(Validator):
+    "Simulates a lookup in an external service."
+    
+    messages = {'not_unique': 'Name is already taken.'}
+    
+    def __init__(self, taken=(), delay=0.0, *args, **kwargs):
+        self.taken = taken
+        self.delay = delay
+        self.super(*args, **kwargs)
+    
+    async def validate(self, value, context):
+        await asyncio.sleep(self.delay)
+        if value in self.taken:
+            self.error('not_unique', value, context)
+
+
+class AsyncIntegerValidator(Validator):
+    
+    messages = {'invalid_number': 'Please enter a number.'}
+    
+    async def convert(self, value, context):
+        await asyncio.sleep(0)
+        try:
+            return int(value)
+        except ValueError:
+            self.error('invalid_number', value, context)
+
+
+class AsyncFormValidator(Validator):
+    
+    messages = {'mismatch': 'Names do not match.'}
+    
+    async def validate(self, fields, context):
+        await asyncio.sleep(0)
+        if fields['name'] != fields['repeated_name']:
+            self.error('mismatch', fields, context)
+
+
+async def add_marker(fields, context=None):
+    await asyncio.sleep(0)
+    fields = dict(fields)
+    fields['marker'] = True
+    return fields
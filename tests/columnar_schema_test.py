@@ -0,0 +1,189 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import random
+
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.result import ColumnarResult
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PositiveSum(Validator):
+    
+    def messages(self):
+        return {'negative_sum': 'The sum must be positive.'}
+    
+    def validate(self, fields, context):
+        if fields['a'] + fields['b'] < 0:
+            self.error('negative_sum', fields, context)
+
+
+class ColumnarSchemaTest(PythonicTestCase):
+    
+    def schema(self, *formvalidators):
+        schema = SchemaValidator()
+        schema.add('a', IntegerValidator())
+        schema.add('b', IntegerValidator(min=-10))
+        schema.add('name', StringValidator(required=False))
+        for formvalidator in formvalidators:
+            schema.add_formvalidator(formvalidator)
+        return schema
+    
+    def test_validates_columns(self):
+        columns = {'a': ['1', '2'], 'b': ['3', '-4'], 'name': ['foo', None]}
+        result = self.schema().process_columns(columns)
+        self.assert_isinstance(result, ColumnarResult)
+        self.assert_true(result.is_valid())
+        self.assert_length(2, result)
+        expected = {'a': [1, 2], 'b': [3, -4], 'name': ['foo', None]}
+        self.assert_equals(expected, result.columns())
+        self.assert_equals([], result.failed_rows())
+        self.assert_equals({}, result.error_dicts())
+        self.assert_equals({'a': 2, 'b': -4, 'name': None}, result.row(1).value())
+    
+    def test_returns_sparse_error_dicts(self):
+        columns = {'a': ['1', 'x', '3', None], 'b': ['3', '-40', '5', '6'], 'name': ['a', 'b', 'c', 'd']}
+        result = self.schema().process_columns(columns)
+        self.assert_false(result.is_valid())
+        self.assert_equals([1, 3], result.failed_rows())
+        error_dicts = result.error_dicts()
+        self.assert_equals([1, 3], sorted(error_dicts))
+        self.assert_equals(['a', 'b'], sorted(error_dicts[1]))
+        self.assert_equals('invalid_number', error_dicts[1]['a'].key())
+        self.assert_equals('too_low', error_dicts[1]['b'].key())
+        self.assert_equals(['a'], list(error_dicts[3]))
+        self.assert_equals('empty', error_dicts[3]['a'].key())
+        # valid cells of invalid rows are converted nevertheless
+        self.assert_equals([1, None, 3, None], result.columns()['a'])
+        self.assert_equals([3, None, 5, 6], result.columns()['b'])
+    
+    def test_behaves_like_check_for_each_row(self):
+        randomizer = random.Random(42)
+        cells = ['1', '-20', 'x', None, ' 5 ']
+        columns = {'a': [], 'b': [], 'name': []}
+        for i in range(200):
+            columns['a'].append(randomizer.choice(cells))
+            columns['b'].append(randomizer.choice(cells))
+            columns['name'].append(randomizer.choice(['foo', None, 42]))
+        schema = self.schema(PositiveSum())
+        result = schema.process_columns(columns)
+        for index in range(200):
+            row = dict([(key, column[index]) for key, column in columns.items()])
+            expected = schema.check(row)
+            actual = result.row(index)
+            self.assert_equals(expected.is_valid(), actual.is_valid(), repr(row))
+            self.assert_equals(expected.is_valid(), index not in result.failed_rows())
+            if expected.is_valid():
+                self.assert_equals(expected.value(), actual.value())
+            else:
+                self.assert_equals(expected.error().key(), actual.error().key())
+                self.assert_equals(sorted(expected.error_dict()), sorted(actual.error_dict()))
+    
+    def test_runs_formvalidators_only_for_rows_without_field_errors(self):
+        seen_rows = []
+        class RecordingValidator(PositiveSum):
+            def validate(self, fields, context):
+                seen_rows.append(fields['a'])
+                self.super()
+        columns = {'a': ['1', 'x', '-5', '4'], 'b': ['1', '1', '1', '-10']}
+        result = self.schema(RecordingValidator()).process_columns(columns)
+        self.assert_equals([1, -5, 4], seen_rows)
+        self.assert_equals([1, 2, 3], result.failed_rows())
+        self.assert_equals({1: ['a'], 2: [], 3: []}, 
+            dict([(row, list(errors)) for row, errors in result.error_dicts().items()]))
+        self.assert_equals('negative_sum', result.row(2).error().key())
+    
+    def test_stores_values_modified_by_formvalidators(self):
+        class Swap(Validator):
+            def convert(self, fields, context):
+                return {'a': fields['b'], 'b': fields['a'], 'name': 'swapped'}
+        columns = {'a': ['1', 'x'], 'b': ['2', '3']}
+        result = self.schema(Swap()).process_columns(columns)
+        self.assert_equals([2, None], result.columns()['a'])
+        self.assert_equals([1, 3], result.columns()['b'])
+        self.assert_equals(['swapped', None], result.columns()['name'])
+        self.assert_equals({'a': ['1', 'x'], 'b': ['2', '3']}, columns)
+    
+    def test_uses_empty_value_for_missing_columns(self):
+        result = self.schema().process_columns({'a': ['1', '2']})
+        self.assert_equals([0, 1], result.failed_rows())
+        self.assert_equals('empty', result.error_dicts()[0]['b'].key())
+        self.assert_equals([None, None], result.columns()['name'])
+    
+    def test_rejects_columns_with_different_lengths(self):
+        self.assert_raises(InvalidArgumentsError, 
+            lambda: self.schema().process_columns({'a': ['1', '2'], 'b': ['1']}))
+    
+    def test_rejects_invalid_input(self):
+        error = self.assert_raises(InvalidDataError, lambda: self.schema().process_columns([1, 2]))
+        self.assert_equals('invalid_type', error.key())
+        
+        schema = self.schema()
+        schema.set_internal_state_freeze(False)
+        schema.set_allow_additional_parameters(False)
+        schema.set_internal_state_freeze(True)
+        error = self.assert_raises(InvalidDataError, 
+            lambda: schema.process_columns({'a': ['1'], 'b': ['1'], 'foo': ['bar']}))
+        self.assert_equals('additional_items', error.key())
+        self.assert_equals("Additional fields detected: 'foo'.", error.msg())
+        # additional columns are dropped otherwise
+        result = self.schema().process_columns({'a': ['1'], 'b': ['1'], 'foo': ['bar']})
+        self.assert_equals(['a', 'b', 'name'], sorted(result.columns()))
+    
+    def test_handles_empty_input(self):
+        result = self.schema().process_columns({})
+        self.assert_length(0, result)
+        self.assert_true(result.is_valid())
+    
+    def test_processes_custom_schemas_row_by_row(self):
+        class CustomSchema(SchemaValidator):
+            a = IntegerValidator()
+            def process(self, fields, context=None):
+                fields = self.super()
+                fields['double'] = 2 * fields['a']
+                return fields
+        result = CustomSchema().process_columns({'a': ['1', 'x', '3']})
+        self.assert_equals([1, None, 3], result.columns()['a'])
+        self.assert_equals([2, None, 6], result.columns()['double'])
+        self.assert_equals([1], result.failed_rows())
+        self.assert_equals('invalid_number', result.error_dicts()[1]['a'].key())
+    
+    def test_accepts_numpy_columns(self):
+        if numpy is None:
+            self.skipTest('NumPy not available')
+        columns = {'a': numpy.array([1, 2, -3]), 'b': numpy.array([5, -20, 1])}
+        result = self.schema(PositiveSum()).process_columns(columns)
+        self.assert_equals([1, 2], result.failed_rows())
+        self.assert_equals('too_low', result.error_dicts()[1]['b'].key())
+        self.assert_equals('negative_sum', result.row(2).error().key())
+        self.assert_equals([1, 2, -3], result.columns()['a'].tolist())
+
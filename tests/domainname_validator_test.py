@@ -22,10 +22,28 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import random
+import re
+
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
 from pycerberus.test_util import ValidationTest
 from pycerberus.validators import DomainNameValidator
 
 
+def reference_error(value):
+    # the checks (and their order) of the original multi-pass implementation
+    if value.startswith('.'):
+        return ('leading_dot', None)
+    if value.endswith('.'):
+        return ('trailing_dot', None)
+    if '..' in value:
+        return ('double_dot', None)
+    match = re.search('([^a-zA-Z0-9\.\-])', value)
+    if match is not None:
+        return ('invalid_domain_character', match.group(1))
+    return None
+
+
 class DomainNameValidatorTest(ValidationTest):
     
     validator_class = DomainNameValidator
@@ -52,5 +70,126 @@ class DomainNameValidatorTest(ValidationTest):
     def test_reject_domain_with_invalid_characters(self):
         msg = self.assert_error('foo_bar.example').msg()
         self.assert_equals("Invalid character '_' in domain 'foo_bar.example'.", msg)
-
+    
+    def test_reports_first_invalid_character(self):
+        msg = self.assert_error('foo bar_baz.example').msg()
+        self.assert_equals("Invalid character ' ' in domain 'foo bar_baz.example'.", msg)
+    
+    def test_reject_trailing_newline(self):
+        msg = self.assert_error('example.com\n').msg()
+        self.assert_equals("Invalid character '\\n' in domain 'example.com\\n'.", msg)
+    
+    def test_precedence_of_errors(self):
+        self.assert_equals('leading_dot', self.assert_error('.foo_bar.').details().key())
+        self.assert_equals('trailing_dot', self.assert_error('foo_bar..com.').details().key())
+        self.assert_equals('double_dot', self.assert_error('foo_bar..com').details().key())
+    
+    def test_behaves_like_reference_implementation(self):
+        randomizer = random.Random(42)
+        alphabet = 'ab1-._ \xe4'
+        for i in range(2000):
+            value = ''.join([randomizer.choice(alphabet) for j in range(randomizer.randint(1, 8))])
+            expected = reference_error(value)
+            try:
+                self.process(value)
+            except InvalidDataError, e:
+                self.assert_not_none(expected, repr(value))
+                self.assert_equals(expected[0], e.details().key(), repr(value))
+                if expected[1] is not None:
+                    self.assert_contains(repr(expected[1]), e.details().msg())
+            else:
+                self.assert_none(expected, repr(value))
+    
+    def test_handles_long_inputs(self):
+        long_label = 'a' * 100000
+        self.assert_equals(long_label, self.process(long_label))
+        self.assert_equals('invalid_domain_character', self.assert_error(long_label + '!').details().key())
+        self.assert_equals('invalid_domain_character', self.assert_error('a.' * 50000 + '!').details().key())
+        self.assert_equals('double_dot', self.assert_error('a-' * 50000 + '..a').details().key())
+    
+    # --------------------------------------------------------------------------
+    # internationalized domain names
+    
+    def test_rejects_idn_by_default(self):
+        self.assert_equals('invalid_domain_character', self.assert_error(u'b\xfccher.example').details().key())
+    
+    def test_accepts_idn_if_enabled(self):
+        self.init_validator(None, idna=True)
+        self.assert_equals(u'b\xfccher.example', self.process(u'b\xfccher.example'))
+        self.assert_equals('xn--bcher-kva.example', self.process('xn--bcher-kva.example'))
+        self.assert_equals('example.com', self.process('example.com'))
+    
+    def test_can_convert_idn_to_ascii(self):
+        self.init_validator(None, idna_output='ascii')
+        self.assert_true(self.validator().idna)
+        self.assert_equals('xn--bcher-kva.example', self.process(u'b\xfccher.example'))
+        self.assert_equals('xn--bcher-kva.example', self.process(u'B\xfcCHER.example'))
+        self.assert_equals('xn--bcher-kva.example', self.process('xn--bcher-kva.example'))
+    
+    def test_can_convert_punycode_to_unicode(self):
+        self.init_validator(None, idna_output='unicode')
+        self.assert_equals(u'b\xfccher.example', self.process('xn--bcher-kva.example'))
+        self.assert_equals(u'b\xfccher.example', self.process(u'b\xfccher.example'))
+        self.assert_equals('www.example.com', self.process('www.example.com'))
+    
+    def test_rejects_invalid_punycode(self):
+        self.init_validator(None, idna=True)
+        self.assert_equals('invalid_idna', self.assert_error('xn--zzzz.example').details().key())
+    
+    def test_idna_mode_still_rejects_invalid_ascii_characters(self):
+        self.init_validator(None, idna=True)
+        error = self.assert_error(u'b\xfccher_shop.example')
+        self.assert_equals('invalid_domain_character', error.details().key())
+        self.assert_equals('leading_dot', self.assert_error(u'.b\xfccher.example').details().key())
+        self.assert_equals('double_dot', self.assert_error(u'b\xfccher..example').details().key())
+    
+    def test_idna_mode_rejects_labels_which_are_empty_after_nameprep(self):
+        # nameprep maps zero width space and soft hyphen to nothing
+        for output in (None, 'ascii', 'unicode'):
+            self.init_validator(None, idna=True, idna_output=output)
+            for domain in (u'\u200b.com', u'foo.\xad', u'\u200b', u'foo.\u200b\xad.com'):
+                self.assert_equals('invalid_idna', self.assert_error(domain).details().key())
+        self.assert_equals(u'foo.com', self.process(u'fo\xado.com'))
+    
+    def test_idna_options_do_not_shift_positional_arguments(self):
+        validator = DomainNameValidator('example.com', False, idna_output='ascii')
+        self.assert_equals('example.com', validator.process(None))
+        self.assert_equals('xn--bcher-kva.example', validator.process(u'b\xfccher.example'))
+        self.assert_false(DomainNameValidator(None, False).idna)
+    
+    def test_idna_mode_checks_label_length(self):
+        self.init_validator(None, idna=True)
+        self.assert_equals('a' * 63 + '.example', self.process('a' * 63 + '.example'))
+        error = self.assert_error('a' * 64 + '.example')
+        self.assert_equals('label_too_long', error.details().key())
+        self.assert_contains(repr('a' * 64), error.details().msg())
+        # the length is checked for the encoded form
+        self.assert_equals('label_too_long', self.assert_error(u'\xe4' * 60 + '.example').details().key())
+    
+    def test_idna_mode_checks_total_length(self):
+        self.init_validator(None, idna=True)
+        domain = '.'.join(['a' * 63] * 4)
+        self.assert_equals(255, len(domain))
+        self.assert_equals('domain_too_long', self.assert_error(domain).details().key())
+        self.assert_equals(domain[2:], self.process(domain[2:]))
+    
+    def test_idna_conversion_is_cached(self):
+        from pycerberus.validators.domain import domain_cache
+        self.init_validator(None, idna_output='ascii')
+        domain_cache.clear()
+        self.process(u'b\xfccher.example')
+        self.process(u'b\xfccher.example')
+        self.assert_equals(1, domain_cache.stats()['misses'])
+        self.assert_equals(1, domain_cache.stats()['hits'])
+        # plain ASCII domains don't need a cache entry
+        self.process('example.com')
+        self.assert_equals([u'b\xfccher.example'], domain_cache.keys())
+    
+    def test_rejects_invalid_idna_output(self):
+        self.assert_raises(InvalidArgumentsError, lambda: DomainNameValidator(idna_output='utf-8'))
+    
+    def test_can_translate_idna_messages(self):
+        self.init_validator(None, idna=True)
+        msg = self.assert_error_with_locale('a' * 64 + '.example', locale='de').details().msg()
+        self.assert_true(msg.startswith(u'Ung\xfcltige Domain: Das Label'), msg)
 
@@ -60,3 +60,28 @@ class EmailAddressValidatorTest(ValidationTest):
         self.assert_equals("Invalid character ' ' in domain 'ex ample.com'.", e.msg())
 
 
+    
+    def test_accepts_idn_domain_if_enabled(self):
+        self.assert_equals('invalid_domain_character', self.get_error(u'foo@b\xfccher.example').details().key())
+        self.init_validator(None, idna=True)
+        self.assert_equals(u'foo@b\xfccher.example', self.process(u'foo@b\xfccher.example'))
+        self.assert_equals('foo@example.com', self.process('foo@example.com'))
+    
+    def test_converts_only_domain_part(self):
+        self.init_validator(None, idna_output='ascii')
+        self.assert_equals('Foo@xn--bcher-kva.example', self.process(u'Foo@b\xfccher.example'))
+        self.init_validator(None, idna_output='unicode')
+        self.assert_equals(u'foo@b\xfccher.example', self.process('foo@xn--bcher-kva.example'))
+    
+    def test_idna_mode_reports_original_address(self):
+        self.init_validator(None, idna_output='ascii')
+        e = self.get_error(u'foo-bar@b\xfccher.example')
+        self.assert_equals(u"Invalid character %s in email address %s." % (repr(u'-'), repr(u'foo-bar@b\xfccher.example')), e.msg())
+        self.assert_equals('single_at', self.get_error(u'foo@@b\xfccher.example').details().key())
+        self.assert_equals('label_too_long', self.get_error('foo@' + 'a' * 64 + '.example').details().key())
+    
+    def test_idna_mode_rejects_domain_labels_which_are_empty_after_nameprep(self):
+        self.init_validator(None, idna_output='ascii')
+        self.assert_equals('invalid_idna', self.get_error(u'foo@\u200b.com').details().key())
+        self.assert_equals('invalid_idna', self.get_error(u'foo@bar.\xad').details().key())
+
@@ -0,0 +1,241 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class RecordingValidator(IntegerValidator):
+    
+    def __init__(self, calls, cost=None, *args, **kwargs):
+        self.calls = calls
+        if cost is not None:
+            self.cost = cost
+        self.super(*args, **kwargs)
+    
+    def convert(self, value, context):
+        self.calls.append(value)
+        return self.super()
+
+
+class FailFastTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        self.calls = []
+    
+    def _schema(self, *names, **kwargs):
+        schema = SchemaValidator(**kwargs)
+        for name in names:
+            schema.add(name, RecordingValidator(self.calls))
+        return schema
+    
+    def assert_error(self, schema, values, context=None):
+        return self.assert_raises(InvalidDataError, schema.process, values, context)
+    
+    def test_fail_fast_is_disabled_by_default(self):
+        schema = self._schema('first', 'second')
+        self.assert_false(schema.fail_fast)
+        error = self.assert_error(schema, {'first': 'foo', 'second': 'bar'})
+        self.assert_length(2, error.error_dict())
+        self.assert_length(2, self.calls)
+    
+    def test_stops_at_first_invalid_field(self):
+        schema = self._schema('first', 'second', 'third', fail_fast=True)
+        error = self.assert_error(schema, {'first': 'foo', 'second': 'bar', 'third': 'baz'})
+        self.assert_length(1, self.calls)
+        self.assert_length(1, error.error_dict())
+        
+        field_name = list(error.error_dict().keys())[0]
+        self.assert_equals('invalid_number', error.details().key())
+        self.assert_equals(error.error_for(field_name).details().msg(), error.details().msg())
+    
+    def test_can_enable_fail_fast_in_context(self):
+        schema = self._schema('first', 'second')
+        self.assert_error(schema, {'first': 'foo', 'second': 'bar'}, {'fail_fast': True})
+        self.assert_length(1, self.calls)
+    
+    def test_context_can_disable_fail_fast(self):
+        schema = self._schema('first', 'second', fail_fast=True)
+        error = self.assert_error(schema, {'first': 'foo', 'second': 'bar'}, {'fail_fast': False})
+        self.assert_length(2, error.error_dict())
+    
+    def test_can_enable_fail_fast_for_declarative_schemas(self):
+        class FailFastSchema(SchemaValidator):
+            fail_fast = True
+            first = IntegerValidator()
+            second = IntegerValidator()
+        error = self.assert_error(FailFastSchema(), {'first': 'foo', 'second': 'bar'})
+        self.assert_length(1, error.error_dict())
+        self.assert_false(SchemaValidator().fail_fast)
+    
+    def test_can_change_fail_fast_setting(self):
+        schema = self._schema('first', 'second')
+        schema.set_internal_state_freeze(False)
+        schema.set_fail_fast(True)
+        schema.set_internal_state_freeze(True)
+        error = self.assert_error(schema, {'first': 'foo', 'second': 'bar'})
+        self.assert_length(1, error.error_dict())
+    
+    def test_returns_same_result_for_valid_input(self):
+        schema = self._schema('first', 'second')
+        values = {'first': '1', 'second': '2'}
+        self.assert_equals({'first': 1, 'second': 2}, schema.process(values, {'fail_fast': True}))
+    
+    def test_skips_form_validators(self):
+        formvalidator_calls = []
+        class FormValidator(Validator):
+            def validate(self, fields, context):
+                formvalidator_calls.append(fields)
+        schema = self._schema('first')
+        schema.add_formvalidator(FormValidator())
+        self.assert_error(schema, {'first': 'foo'}, {'fail_fast': True})
+        self.assert_equals([], formvalidator_calls)
+    
+    def _recording_formvalidator(self, calls, depends_on=None, fail=False):
+        class FormValidator(Validator):
+            def validate(self, fields, context):
+                calls.append(fields.copy())
+                if fail:
+                    self.error('invalid', fields, context)
+            def messages(self):
+                return {'invalid': 'invalid'}
+        formvalidator = FormValidator()
+        if depends_on is not None:
+            formvalidator.depends_on = depends_on
+        return formvalidator
+    
+    def test_runs_form_validators_as_soon_as_their_fields_are_valid(self):
+        schema = SchemaValidator()
+        schema.add('cheap', RecordingValidator(self.calls, cost=1))
+        schema.add('expensive', RecordingValidator(self.calls, cost=100))
+        formvalidator_calls = []
+        schema.add_formvalidator(self._recording_formvalidator(formvalidator_calls, fail=True), depends_on=('cheap', ))
+        
+        error = self.assert_error(schema, {'cheap': '1', 'expensive': '2'}, {'fail_fast': True})
+        self.assert_equals('invalid', error.details().key())
+        self.assert_equals(['1'], self.calls)
+        self.assert_equals([{'cheap': 1}], formvalidator_calls)
+        
+        result = schema.check({'cheap': '1', 'expensive': '2'}, {'fail_fast': True})
+        self.assert_equals('invalid', result.error().details().key())
+    
+    def test_runs_form_validators_in_the_declared_order(self):
+        schema = SchemaValidator()
+        schema.add('first', RecordingValidator(self.calls, cost=1))
+        schema.add('second', RecordingValidator(self.calls, cost=2))
+        formvalidator_calls = []
+        schema.add_formvalidator(self._recording_formvalidator(formvalidator_calls), depends_on=('second', ))
+        schema.add_formvalidator(self._recording_formvalidator(formvalidator_calls), depends_on=('first', ))
+        schema.add_formvalidator(self._recording_formvalidator(formvalidator_calls))
+        
+        values = {'first': '1', 'second': '2'}
+        self.assert_equals({'first': 1, 'second': 2}, schema.process(values, {'fail_fast': True}))
+        # The second form validator depends only on "first" but must not be 
+        # run before the first form validator.
+        self.assert_equals([{'first': 1, 'second': 2}] * 3, formvalidator_calls)
+    
+    def test_validates_dependencies_of_form_validators_first(self):
+        schema = self._schema('a', 'b', 'c', 'd')
+        formvalidator_calls = []
+        schema.add_formvalidator(self._recording_formvalidator(formvalidator_calls, fail=True), depends_on=('c', ))
+        self.assert_error(schema, {'a': '1', 'b': '2', 'c': '3', 'd': '4'}, {'fail_fast': True})
+        self.assert_equals(['3'], self.calls)
+        self.assert_equals([{'c': 3}], formvalidator_calls)
+    
+    def test_reruns_early_form_validators_which_modify_values(self):
+        schema = SchemaValidator()
+        schema.add('cheap', RecordingValidator(self.calls, cost=1))
+        schema.add('expensive', RecordingValidator(self.calls, cost=100))
+        class Doubler(Validator):
+            depends_on = ('cheap', )
+            def convert(self, fields, context):
+                fields = fields.copy()
+                fields['cheap'] *= 2
+                return fields
+        schema.add_formvalidator(Doubler())
+        result = schema.process({'cheap': '1', 'expensive': '2'}, {'fail_fast': True})
+        self.assert_equals({'cheap': 2, 'expensive': 2}, result)
+    
+    def test_reruns_early_form_validators_which_modify_values_in_place(self):
+        class CityValidator(StringValidator):
+            cost = 100
+        schema = SchemaValidator()
+        schema.add('zip', RecordingValidator(self.calls, cost=1))
+        schema.add('city', CityValidator())
+        class CityFromZip(Validator):
+            depends_on = ('zip', )
+            def convert(self, fields, context):
+                fields['city'] = 'Berlin'
+                return fields
+        schema.add_formvalidator(CityFromZip())
+        values = {'zip': '1', 'city': 'Paris'}
+        self.assert_equals({'zip': 1, 'city': 'Berlin'}, schema.process(values))
+        self.assert_equals({'zip': 1, 'city': 'Berlin'}, schema.process(values, {'fail_fast': True}))
+        result = schema.check(values, {'fail_fast': True})
+        self.assert_equals({'zip': 1, 'city': 'Berlin'}, result.value())
+        result = schema.check_incremental(values, context={'fail_fast': True})
+        self.assert_equals({'zip': 1, 'city': 'Berlin'}, result.value())
+    
+    def test_checks_additional_items_before_processing_fields(self):
+        schema = self._schema('first')
+        schema.set_internal_state_freeze(False)
+        schema.set_allow_additional_parameters(False)
+        schema.set_internal_state_freeze(True)
+        error = self.assert_error(schema, {'first': '1', 'foo': 'bar'}, {'fail_fast': True})
+        self.assert_equals('additional_items', error.details().key())
+        self.assert_equals([], self.calls)
+    
+    def test_processes_cheap_fields_first(self):
+        schema = SchemaValidator()
+        schema.add('expensive', RecordingValidator(self.calls, cost=100))
+        schema.add('cheap', RecordingValidator(self.calls, cost=1))
+        schema.add('medium', RecordingValidator(self.calls, cost=10))
+        self.assert_equals(1, schema.field_cost('cheap'))
+        
+        error = self.assert_error(schema, {'expensive': 'a', 'cheap': 'b', 'medium': 'c'}, {'fail_fast': True})
+        self.assert_equals(['b'], self.calls)
+        self.assert_equals(['cheap'], list(error.error_dict().keys()))
+        schema.process({'expensive': '1', 'cheap': '2', 'medium': '3'}, {'fail_fast': True})
+        self.assert_equals(['b', '2', '3', '1'], self.calls)
+    
+    def test_fields_without_cost_are_free(self):
+        self.assert_equals(0, self._schema('first').field_cost('first'))
+    
+    def test_nested_schemas_use_fail_fast_from_context(self):
+        schema = SchemaValidator()
+        schema.add('nested', self._schema('first', 'second'))
+        error = self.assert_error(schema, {'nested': {'first': 'foo', 'second': 'bar'}}, {'fail_fast': True})
+        self.assert_length(1, error.error_for('nested').error_dict())
+    
+    def test_process_many_supports_fail_fast(self):
+        schema = self._schema('first', 'second')
+        results = schema.process_many([{'first': 'foo', 'second': 'bar'}, {'first': '1', 'second': '2'}], 
+                                      {'fail_fast': True})
+        self.assert_length(1, results[0].error_dict())
+        self.assert_equals({'first': 1, 'second': 2}, results[1])
+
@@ -0,0 +1,137 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import types
+
+from pycerberus.errors import EmptyError, InvalidArgumentsError, InvalidDataError
+from pycerberus.schema import SchemaValidator
+from pycerberus.test_util import ValidationTest
+from pycerberus.validators import ForEachValidator, IntegerValidator, StringValidator
+
+
+class ForEachValidatorTest(ValidationTest):
+    
+    def setUp(self):
+        self.super()
+        self.init_validator(ForEachValidator(IntegerValidator(min=0)))
+    
+    def test_processes_all_items(self):
+        self.assert_equals([1, 2, 3], self.process(['1', '2', 3]))
+        self.assert_equals([1, 2], self.process(('1', '2')))
+        self.assert_equals([], self.process([]))
+    
+    def test_reports_errors_by_position(self):
+        e = self.assert_error(['1', 'foo', '2', '-1'])
+        self.assert_equals([1, 3], sorted(e.error_dict()))
+        self.assert_equals('invalid_number', e.error_for(1).key())
+        self.assert_equals('too_low', e.error_for(3).key())
+        # the first invalid item determines message and key
+        self.assert_equals('invalid_number', e.key())
+        self.assert_equals('Please enter a number.', e.msg())
+    
+    def test_can_stop_after_max_errors(self):
+        self.init_validator(ForEachValidator(IntegerValidator(min=0), max_errors=2))
+        e = self.assert_error(['1', 'foo', '-1', 'bar', '-2'])
+        self.assert_equals([1, 2], sorted(e.error_dict()))
+        self.assert_equals([1, 2], self.process(['1', '2']))
+    
+    def test_checks_length(self):
+        self.init_validator(ForEachValidator(IntegerValidator(), min_length=1, max_length=2))
+        self.assert_equals('too_short', self.assert_error([]).key())
+        self.assert_equals('Please enter at least 1 items.', self.assert_error([]).msg())
+        self.assert_equals('too_long', self.assert_error(['1', '2', '3']).key())
+        self.assert_equals([1, 2], self.process(['1', '2']))
+    
+    def test_rejects_invalid_arguments(self):
+        self.assert_raises(InvalidArgumentsError, lambda: ForEachValidator(IntegerValidator(), min_length=3, max_length=2))
+        self.assert_raises(InvalidArgumentsError, lambda: ForEachValidator(IntegerValidator(), max_errors=0))
+    
+    def test_rejects_non_list_input(self):
+        self.assert_equals('invalid_type', self.assert_error('123').key())
+        self.assert_equals('invalid_type', self.assert_error({'a': 1}).key())
+        self.assert_equals('invalid_type', self.assert_error(42).key())
+        self.assert_isinstance(self.assert_error(None), EmptyError)
+        self.assert_none(ForEachValidator(IntegerValidator(), required=False).process(None))
+    
+    def test_can_validate_list_of_schemas(self):
+        class PersonSchema(SchemaValidator):
+            name = StringValidator()
+            age = IntegerValidator(min=0)
+        self.init_validator(ForEachValidator(PersonSchema))
+        people = [{'name': 'Foo', 'age': '42'}, {'name': None, 'age': '-1'}]
+        e = self.assert_error(people)
+        self.assert_equals([1], list(e.error_dict()))
+        self.assert_equals(['age', 'name'], sorted(e.error_for(1).error_dict()))
+        self.assert_equals([{'name': 'Foo', 'age': 42}], self.process(people[:1]))
+    
+    def test_passes_context_to_items(self):
+        e = self.assert_error_with_locale(['foo'], locale='de')
+        self.assert_equals(u'Bitte geben Sie eine Zahl ein.', e.error_for(0).msg())
+    
+    def test_is_pure_if_item_validator_is_pure(self):
+        self.assert_true(self.validator().is_pure())
+        class SubClass(ForEachValidator):
+            pass
+        self.assert_false(SubClass(IntegerValidator()).is_pure())
+    
+    # --------------------------------------------------------------------------
+    # lazy processing
+    
+    def test_processes_generators_lazily(self):
+        processed = []
+        def items():
+            for i in range(3):
+                processed.append(i)
+                yield str(i)
+        results = self.process(items())
+        self.assert_isinstance(results, types.GeneratorType)
+        self.assert_equals([], processed)
+        self.assert_equals(0, next(results))
+        self.assert_equals([0], processed)
+        self.assert_equals([1, 2], list(results))
+    
+    def test_lazy_processing_raises_errors_at_the_end(self):
+        results = self.process(iter(['1', 'foo', '2', '-1']))
+        self.assert_equals(1, next(results))
+        self.assert_equals(2, next(results))
+        e = self.assert_raises(InvalidDataError, lambda: next(results))
+        self.assert_equals([1, 3], sorted(e.error_dict()))
+    
+    def test_lazy_processing_stops_after_max_errors(self):
+        self.init_validator(ForEachValidator(IntegerValidator(), max_errors=1))
+        results = self.process(iter(['1', 'foo', '2']))
+        self.assert_equals(1, next(results))
+        e = self.assert_raises(InvalidDataError, lambda: next(results))
+        self.assert_equals([1], list(e.error_dict()))
+    
+    def test_lazy_processing_checks_length(self):
+        self.init_validator(ForEachValidator(IntegerValidator(), min_length=2, max_length=3))
+        results = self.process(iter(['1', '2', '3', '4', '5']))
+        self.assert_equals([1, 2, 3], [next(results) for i in range(3)])
+        self.assert_equals('too_long', self.assert_raises(InvalidDataError, lambda: next(results)).key())
+        
+        results = self.process(iter(['1']))
+        self.assert_equals(1, next(results))
+        self.assert_equals('too_short', self.assert_raises(InvalidDataError, lambda: next(results)).key())
+
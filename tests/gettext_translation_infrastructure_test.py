@@ -22,10 +22,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import gettext
 import os
 
 from pycerberus.test_util import PythonicTestCase
-from pycerberus.i18n import GettextTranslation
+from pycerberus.i18n import catalog_cache, CatalogCache, GettextTranslation
 
 
 class GettextTranslationInfrastructureTest(PythonicTestCase):
@@ -52,5 +53,45 @@ class GettextTranslationInfrastructureTest(PythonicTestCase):
         self.assert_equals('en', translation._locale(None))
         self.assert_equals('en', translation._locale({}))
         self.assert_equals('fr', translation._locale({'locale': 'fr'}))
-
+    
+    def test_translations_are_cached(self):
+        translation = GettextTranslation(domain='pycerberus')
+        catalog = translation.translation({'locale': 'de'})
+        self.assert_true(catalog is translation.translation({'locale': 'de'}))
+        self.assert_true(catalog is GettextTranslation(domain='pycerberus').translation({'locale': 'de'}))
+        self.assert_false(catalog is translation.translation({'locale': 'fr'}))
+    
+    def test_cache_key_contains_localedir(self):
+        translation = GettextTranslation(domain='pycerberus')
+        custom_dir = GettextTranslation(domain='pycerberus', localedir='/does/not/exist')
+        self.assert_false(translation.translation({'locale': 'de'}) is 
+                          custom_dir.translation({'locale': 'de'}))
+    
+    def test_can_warm_up_cache(self):
+        cache = CatalogCache()
+        cache.warm_up('pycerberus', ['de', 'en'])
+        self.assert_equals(2, len(cache._catalogs))
+        localedir = cache.default_localedir()
+        self.assert_equals(set([('pycerberus', localedir, 'de'), ('pycerberus', localedir, 'en')]), 
+                           set(cache._catalogs.keys()))
+    
+    def test_cache_size_is_bounded(self):
+        cache = CatalogCache(maxsize=2)
+        localedir = cache.default_localedir()
+        for locale in ('de', 'en', 'xx-unknown', 'yy-unknown'):
+            cache.catalog('pycerberus', localedir, locale)
+        self.assert_equals([('pycerberus', localedir, 'xx-unknown'), ('pycerberus', localedir, 'yy-unknown')], 
+                           cache._catalogs.keys())
+    
+    def test_can_invalidate_cache(self):
+        translation = GettextTranslation(domain='pycerberus')
+        catalog = translation.translation({'locale': 'de'})
+        catalog_cache.invalidate()
+        self.assert_equals(0, len(catalog_cache._catalogs))
+        self.assert_false(catalog is translation.translation({'locale': 'de'}))
+    
+    def test_bypasses_cache_for_custom_gettext_arguments(self):
+        translation = GettextTranslation(domain='pycerberus', class_=gettext.GNUTranslations)
+        self.assert_false(translation.translation({'locale': 'de'}) is 
+                          translation.translation({'locale': 'de'}))
 
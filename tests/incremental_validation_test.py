@@ -0,0 +1,375 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import random
+
+from pycerberus.api import Validator
+from pycerberus.lib import AttrDict, PythonicTestCase
+from pycerberus.result import IncrementalResult
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class CountingValidator(IntegerValidator):
+    
+    def __init__(self, calls, *args, **kwargs):
+        self.calls = calls
+        self.super(*args, **kwargs)
+    
+    def convert(self, value, context):
+        self.calls.append(value)
+        return self.super()
+
+
+class SumValidator(Validator):
+    """Form validator: the sum of all fields in 'depends_on' must not exceed
+    the limit."""
+    def __init__(self, calls, depends_on, limit=100, *args, **kwargs):
+        self.calls = calls
+        self.depends_on = depends_on
+        self.limit = limit
+        self.super(*args, **kwargs)
+    
+    def messages(self):
+        return {'too_big': 'Sum is too big.'}
+    
+    def convert(self, fields, context):
+        self.calls.append(self.depends_on)
+        total = 0
+        for name in self.depends_on:
+            total += fields[name]
+        if total > self.limit:
+            self.error('too_big', fields, context)
+        return fields
+
+
+class IncrementalValidationTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        self.calls = []
+        self.form_calls = []
+    
+    def _schema(self, nr_fields=5, **kwargs):
+        schema = SchemaValidator(**kwargs)
+        for i in range(nr_fields):
+            schema.add('f%d' % i, CountingValidator(self.calls))
+        return schema
+    
+    def _values(self, nr_fields=5):
+        values = {}
+        for i in range(nr_fields):
+            values['f%d' % i] = str(i)
+        return values
+    
+    def assert_same_as_check(self, schema, result, values, context=None):
+        expected = schema.check(values, context)
+        self.assert_equals(expected.is_valid(), result.is_valid())
+        if expected.is_valid():
+            self.assert_equals(expected.value(), result.value())
+            return
+        expected_error = expected.error()
+        error = result.error()
+        self.assert_equals(expected_error.details().key(), error.details().key())
+        self.assert_equals(expected_error.details().msg(), error.details().msg())
+        if expected_error.error_dict():
+            expected_keys = dict([(key, e.details().key()) for key, e in expected_error.error_dict().items()])
+            keys = dict([(key, e.details().key()) for key, e in error.error_dict().items()])
+            self.assert_equals(expected_keys, keys)
+    
+    def test_first_call_runs_all_validators(self):
+        schema = self._schema()
+        result = schema.check_incremental(self._values())
+        self.assert_isinstance(result, IncrementalResult)
+        self.assert_equals(schema.process(self._values()), result.value())
+        self.assert_length(10, self.calls)
+    
+    def test_only_reruns_changed_fields(self):
+        schema = self._schema()
+        values = self._values()
+        previous = schema.check_incremental(values)
+        self.calls[:] = []
+        
+        values = values.copy()
+        values['f3'] = '42'
+        result = schema.check_incremental(values, previous)
+        self.assert_equals(['42'], self.calls)
+        self.assert_equals(42, result.value()['f3'])
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_can_specify_changed_fields_explicitely(self):
+        schema = self._schema()
+        values = self._values()
+        previous = schema.check_incremental(values)
+        self.calls[:] = []
+        
+        values['f1'] = '21'
+        result = schema.check_incremental(values, previous, changed=('f1',))
+        self.assert_equals(['21'], self.calls)
+        self.assert_equals(21, result.value()['f1'])
+    
+    def test_detects_added_and_removed_fields(self):
+        schema = self._schema(nr_fields=2)
+        previous = schema.check_incremental({'f0': '1'})
+        self.assert_false(previous.is_valid())
+        self.calls[:] = []
+        
+        result = schema.check_incremental({'f1': '2'}, previous)
+        self.assert_equals(['2'], self.calls)
+        self.assert_equals(['f0'], list(result.error_dict().keys()))
+        self.assert_same_as_check(schema, result, {'f1': '2'})
+    
+    def test_reuses_errors_of_unchanged_fields(self):
+        schema = self._schema()
+        values = self._values()
+        values['f0'] = 'invalid'
+        previous = schema.check_incremental(values)
+        self.calls[:] = []
+        
+        values = values.copy()
+        values['f4'] = 'also invalid'
+        result = schema.check_incremental(values, previous)
+        self.assert_equals(['also invalid'], self.calls)
+        self.assert_equals(set(['f0', 'f4']), set(result.error_dict().keys()))
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_full_rerun_if_context_or_schema_changed(self):
+        schema = self._schema()
+        values = self._values()
+        previous = schema.check_incremental(values)
+        self.calls[:] = []
+        schema.check_incremental(values, previous, context={'locale': 'de'})
+        self.assert_length(5, self.calls)
+        
+        self.calls[:] = []
+        other_schema = self._schema()
+        other_schema.check_incremental(values, previous)
+        self.assert_length(5, self.calls)
+    
+    def test_fail_fast(self):
+        schema = self._schema(fail_fast=True)
+        values = self._values()
+        values['f1'] = 'invalid'
+        values['f3'] = 'invalid'
+        previous = schema.check_incremental(values)
+        self.assert_same_as_check(schema, previous, values)
+        
+        values = values.copy()
+        values['f1'] = '1'
+        result = schema.check_incremental(values, previous)
+        self.assert_equals(['f3'], list(result.error_dict().keys()))
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_additional_items(self):
+        schema = self._schema()
+        values = self._values()
+        values['unknown'] = 'x'
+        previous = schema.check_incremental(values)
+        self.assert_same_as_check(schema, previous, values)
+        
+        del values['unknown']
+        result = schema.check_incremental(values, previous, changed=('unknown',))
+        self.assert_true(result.is_valid())
+    
+    # -------------------------------------------------------------------------
+    # form validators
+    
+    def _schema_with_formvalidators(self):
+        schema = self._schema()
+        schema.add_formvalidator(SumValidator(self.form_calls, depends_on=('f0', 'f1')))
+        schema.add_formvalidator(SumValidator(self.form_calls, ('f2', 'f3')), depends_on=('f2', 'f3'))
+        return schema
+    
+    def test_can_declare_formvalidator_dependencies(self):
+        schema = self._schema_with_formvalidators()
+        schema.add_formvalidator(Validator())
+        self.assert_equals((('f0', 'f1'), ('f2', 'f3'), None), schema.formvalidator_dependencies())
+    
+    def test_only_reruns_formvalidators_with_changed_dependencies(self):
+        schema = self._schema_with_formvalidators()
+        values = self._values()
+        previous = schema.check_incremental(values)
+        self.assert_length(2, self.form_calls)
+        self.form_calls[:] = []
+        
+        values = values.copy()
+        values['f3'] = '10'
+        result = schema.check_incremental(values, previous)
+        self.assert_equals([('f2', 'f3')], self.form_calls)
+        self.assert_same_as_check(schema, result, values)
+        
+        self.form_calls[:] = []
+        values = values.copy()
+        values['f4'] = '99'
+        result = schema.check_incremental(values, result)
+        self.assert_equals([], self.form_calls)
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_reuses_formvalidator_errors(self):
+        schema = self._schema_with_formvalidators()
+        values = self._values()
+        values['f0'] = '200'
+        previous = schema.check_incremental(values)
+        self.assert_equals('too_big', previous.error().details().key())
+        self.form_calls[:] = []
+        
+        values = values.copy()
+        values['f3'] = '5'
+        result = schema.check_incremental(values, previous)
+        self.assert_equals([], self.form_calls)
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_reruns_formvalidators_without_dependencies(self):
+        schema = self._schema()
+        calls = []
+        def process(fields, context=None):
+            calls.append(fields)
+            return fields
+        schema.add_formvalidator(AttrDict(process=process))
+        previous = schema.check_incremental(self._values())
+        schema.check_incremental(self._values(), previous, changed=())
+        self.assert_length(2, calls)
+    
+    def _schema_with_modifying_formvalidator(self):
+        schema = self._schema()
+        class DoubleFirst(Validator):
+            depends_on = ('f0',)
+            def convert(self, fields, context):
+                fields = fields.copy()
+                fields['f0'] = 2 * fields['f0']
+                return fields
+        schema.add_formvalidator(DoubleFirst())
+        schema.add_formvalidator(SumValidator(self.form_calls, depends_on=('f0', 'f1'), limit=100))
+        return schema
+    
+    def test_tracks_values_modified_by_formvalidators(self):
+        schema = self._schema_with_modifying_formvalidator()
+        values = self._values()
+        previous = schema.check_incremental(values)
+        self.form_calls[:] = []
+        
+        values = values.copy()
+        values['f4'] = '99'
+        result = schema.check_incremental(values, previous)
+        self.assert_length(0, self.form_calls)
+        self.assert_equals(0, result.value()['f0'])
+        self.assert_same_as_check(schema, result, values)
+        
+        values = values.copy()
+        values['f0'] = '60'
+        self.form_calls[:] = []
+        result = schema.check_incremental(values, result)
+        self.assert_length(1, self.form_calls)
+        self.assert_equals('too_big', result.error().details().key())
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_reruns_formvalidators_which_write_values_in_place(self):
+        class CityFromZip(Validator):
+            depends_on = ('zip', )
+            def convert(self, fields, context):
+                fields['city'] = 'Berlin'
+                return fields
+        schema = SchemaValidator()
+        schema.add('zip', IntegerValidator())
+        schema.add('city', StringValidator())
+        schema.add_formvalidator(CityFromZip())
+        # the first call does not change any value
+        values = {'zip': '1', 'city': 'Berlin'}
+        previous = schema.check_incremental(values)
+        self.assert_same_as_check(schema, previous, values)
+        
+        values = {'zip': '1', 'city': 'Paris'}
+        result = schema.check_incremental(values, previous)
+        self.assert_equals({'zip': 1, 'city': 'Berlin'}, result.value())
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_matches_full_validation_for_random_edits(self):
+        rng = random.Random(42)
+        schema = self._schema_with_formvalidators()
+        values = self._values()
+        result = None
+        for i in range(300):
+            values = values.copy()
+            key = 'f%d' % rng.randint(0, 5)
+            choice = rng.random()
+            if choice < 0.1:
+                values.pop(key, None)
+            elif choice < 0.3:
+                values[key] = 'invalid'
+            else:
+                values[key] = str(rng.randint(0, 80))
+            result = schema.check_incremental(values, result)
+            self.assert_same_as_check(schema, result, values)
+    
+    def test_matches_full_validation_for_random_edits_with_modifying_formvalidators(self):
+        rng = random.Random(23)
+        schema = self._schema_with_modifying_formvalidator()
+        schema.add_formvalidator(SumValidator(self.form_calls, depends_on=('f2', 'f3')))
+        values = self._values()
+        result = None
+        for i in range(300):
+            values = values.copy()
+            values['f%d' % rng.randint(0, 4)] = str(rng.randint(0, 60))
+            result = schema.check_incremental(values, result)
+            self.assert_same_as_check(schema, result, values)
+    
+    def test_runs_early_formvalidators_in_fail_fast_mode(self):
+        schema = SchemaValidator(fail_fast=True)
+        schema.add('a', IntegerValidator())
+        schema.add('b', IntegerValidator())
+        schema.add_formvalidator(SumValidator(self.form_calls, depends_on=('a',), limit=41))
+        values = {'a': '42', 'b': 'x'}
+        result = schema.check_incremental(values)
+        self.assert_equals('too_big', result.error().details().key())
+        self.assert_equals({}, result.error().error_dict())
+        self.assert_same_as_check(schema, result, values)
+        
+        values = {'a': '1', 'b': 'x'}
+        result = schema.check_incremental(values, result)
+        self.assert_equals(['b'], list(result.error_dict().keys()))
+        self.assert_same_as_check(schema, result, values)
+    
+    def test_matches_full_validation_for_random_edits_in_fail_fast_mode(self):
+        rng = random.Random(7)
+        context = {'fail_fast': True}
+        schema = self._schema_with_formvalidators()
+        modifying_schema = self._schema_with_modifying_formvalidator()
+        modifying_schema.add_formvalidator(SumValidator(self.form_calls, depends_on=('f2', 'f3')))
+        for schema in (schema, modifying_schema):
+            values = self._values()
+            result = None
+            for i in range(300):
+                values = values.copy()
+                key = 'f%d' % rng.randint(0, 4)
+                if rng.random() < 0.2:
+                    values[key] = 'invalid'
+                else:
+                    values[key] = str(rng.randint(0, 80))
+                result = schema.check_incremental(values, result, context=context)
+                self.assert_same_as_check(schema, result, values, context)
+    
+    def test_falls_back_to_check_for_non_dict_input(self):
+        schema = self._schema()
+        result = schema.check_incremental('foo')
+        self.assert_equals(schema.check('foo').is_valid(), result.is_valid())
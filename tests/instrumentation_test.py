@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus import instrumentation
+from pycerberus.errors import InvalidDataError
+from pycerberus.instrumentation import FieldMetrics, Registry
+from pycerberus.lib import AttrDict, PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class UserSchema(SchemaValidator):
+    id = IntegerValidator()
+    name = StringValidator()
+
+schema_name = __name__ + '.UserSchema'
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 0
+    
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class InstrumentationTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        self.registry = Registry(timer=FakeTimer())
+    
+    def tearDown(self):
+        instrumentation.disable()
+        self.super()
+    
+    def metrics(self):
+        metrics = {}
+        for item in self.registry.snapshot():
+            metrics[(item['schema'], item['field'])] = item
+        return metrics
+    
+    def test_disabled_by_default(self):
+        self.assert_false(instrumentation.is_enabled())
+        schema = UserSchema()
+        plan = schema.compile()
+        self.assert_equals(schema.validator_for('id').process, dict([(step[0], step[1]) for step in plan.fields])['id'])
+    
+    def test_records_calls_and_errors_per_field(self):
+        instrumentation.enable(self.registry)
+        schema = UserSchema()
+        schema.process({'id': '1', 'name': 'foo'})
+        self.assert_raises(InvalidDataError, schema.process, {'id': 'foo', 'name': 'bar'})
+        self.assert_raises(InvalidDataError, schema.process, {'id': None, 'name': 'bar'})
+        
+        metrics = self.metrics()
+        id_metrics = metrics[(schema_name, 'id')]
+        self.assert_equals(3, id_metrics['calls'])
+        self.assert_equals(2, id_metrics['errors'])
+        self.assert_equals({'invalid_number': 1, 'empty': 1}, id_metrics['errors_by_key'])
+        self.assert_equals(3, id_metrics['total_seconds'])
+        self.assert_equals(1, id_metrics['p50'])
+        name_metrics = metrics[(schema_name, 'name')]
+        self.assert_equals(3, name_metrics['calls'])
+        self.assert_equals(0, name_metrics['errors'])
+        
+        schema_metrics = metrics[(schema_name, None)]
+        self.assert_equals(3, schema_metrics['calls'])
+        self.assert_equals(2, schema_metrics['errors'])
+    
+    def test_records_skipped_formvalidators(self):
+        instrumentation.enable(self.registry)
+        schema = UserSchema()
+        def fail(fields, context=None):
+            raise InvalidDataError('foo', fields, 'foo', context)
+        schema.add_formvalidator(AttrDict(process=lambda fields, context=None: fields))
+        schema.add_formvalidator(AttrDict(process=fail))
+        schema.add_formvalidator(AttrDict(process=lambda fields, context=None: fields))
+        
+        self.assert_raises(InvalidDataError, schema.process, {'id': 'foo', 'name': 'bar'})
+        self.assert_equals(3, self.metrics()[(schema_name, None)]['skipped'])
+        self.assert_raises(InvalidDataError, schema.process, {'id': '1', 'name': 'bar'})
+        self.assert_equals(4, self.metrics()[(schema_name, None)]['skipped'])
+        schema.check({'id': 'foo', 'name': 'bar'})
+        self.assert_equals(7, self.metrics()[(schema_name, None)]['skipped'])
+        self.assert_equals(0, self.metrics()[(schema_name, 'id')]['skipped'])
+        
+        output = self.registry.to_prometheus()
+        labels = 'schema="%s",field=""' % schema_name
+        self.assert_contains('pycerberus_validation_skipped_formvalidators_total{%s} 7' % labels, output)
+    
+    def test_enabling_rebuilds_existing_plans(self):
+        schema = UserSchema()
+        schema.process({'id': '1', 'name': 'foo'})
+        instrumentation.enable(self.registry)
+        schema.process({'id': '1', 'name': 'foo'})
+        self.assert_equals(1, self.metrics()[(schema_name, 'id')]['calls'])
+        
+        instrumentation.disable()
+        schema.process({'id': '1', 'name': 'foo'})
+        self.assert_equals(1, self.metrics()[(schema_name, 'id')]['calls'])
+    
+    def test_plans_are_rebuilt_only_when_the_registry_changes(self):
+        schema = UserSchema()
+        plan = schema.compile()
+        self.assert_true(plan is schema.compile())
+        instrumentation.enable(self.registry)
+        instrumented_plan = schema.compile()
+        self.assert_false(instrumented_plan is plan)
+        self.assert_true(instrumented_plan is schema.compile())
+        instrumentation.disable()
+        self.assert_false(schema.compile() is instrumented_plan)
+    
+    def test_can_reset_metrics(self):
+        instrumentation.enable(self.registry)
+        UserSchema().process({'id': '1', 'name': 'foo'})
+        self.registry.reset()
+        id_metrics = self.metrics()[(schema_name, 'id')]
+        self.assert_equals(0, id_metrics['calls'])
+        self.assert_none(id_metrics['p50'])
+    
+    def test_nested_schemas_are_recorded_separately(self):
+        instrumentation.enable(self.registry)
+        schema = SchemaValidator()
+        schema.add('user', UserSchema())
+        schema.process({'user': {'id': '1', 'name': 'foo'}})
+        metrics = self.metrics()
+        self.assert_equals(1, metrics[('pycerberus.schema.SchemaValidator', 'user')]['calls'])
+        self.assert_equals(1, metrics[(schema_name, 'id')]['calls'])
+    
+    def test_unnamed_instances_of_a_class_share_metrics(self):
+        instrumentation.enable(self.registry)
+        UserSchema().process({'id': '1', 'name': 'foo'})
+        UserSchema().process({'id': '2', 'name': 'bar'})
+        self.assert_equals(2, self.metrics()[(schema_name, 'id')]['calls'])
+    
+    def test_schemas_can_be_named(self):
+        instrumentation.enable(self.registry)
+        signup = SchemaValidator(instrumentation_name='signup')
+        signup.add('id', IntegerValidator())
+        login = SchemaValidator()
+        login.add('id', IntegerValidator())
+        login.set_instrumentation_name('login')
+        signup.process({'id': '1'})
+        login.process({'id': '1'})
+        login.process({'id': '2'})
+        metrics = self.metrics()
+        self.assert_equals(1, metrics[('signup', 'id')]['calls'])
+        self.assert_equals(2, metrics[('login', 'id')]['calls'])
+        self.assert_equals(2, metrics[('login', None)]['calls'])
+        self.assert_false(('pycerberus.schema.SchemaValidator', 'id') in metrics)
+        
+        login.set_instrumentation_name(None)
+        self.assert_equals('pycerberus.schema.SchemaValidator', login.instrumentation_name())
+    
+    def test_percentiles(self):
+        metrics = FieldMetrics('schema', 'field', sample_size=101)
+        for i in range(1, 201):
+            metrics.record(i)
+        self.assert_equals(200, metrics.calls)
+        # only the latest 101 samples are used
+        self.assert_equals(150, metrics.percentile(50))
+        self.assert_equals(200, metrics.percentile(100))
+        self.assert_equals(100, metrics.percentile(0))
+    
+    def test_prometheus_export(self):
+        instrumentation.enable(self.registry)
+        self.assert_raises(InvalidDataError, UserSchema().process, {'id': 'foo', 'name': 'bar'})
+        output = self.registry.to_prometheus()
+        labels = 'schema="%s",field="id"' % schema_name
+        self.assert_contains('# TYPE pycerberus_validation_seconds summary', output)
+        self.assert_contains('pycerberus_validation_seconds_count{%s} 1' % labels, output)
+        self.assert_contains('pycerberus_validation_seconds{%s,quantile="0.5"} 1' % labels, output)
+        self.assert_contains('pycerberus_validation_errors_total{%s,key="invalid_number"} 1' % labels, output)
+        self.assert_contains('pycerberus_validation_seconds_count{schema="%s",field=""} 1' % schema_name, output)
+    
+    def test_json_export(self):
+        try:
+            import json
+        except ImportError:
+            return
+        instrumentation.enable(self.registry)
+        UserSchema().process({'id': '1', 'name': 'foo'})
+        items = json.loads(self.registry.to_json())
+        self.assert_equals(3, len(items))
+        self.assert_equals(set(['calls', 'errors', 'errors_by_key', 'field', 'p50', 'p90', 'p99', 
+                                'schema', 'skipped', 'total_seconds']), set(items[0].keys()))
+
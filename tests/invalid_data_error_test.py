@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pickle
+
+from pycerberus.errors import EmptyError, InvalidDataError, ThreadSafetyError
+from pycerberus.lib import PythonicTestCase
+
+
+class InvalidDataErrorTest(PythonicTestCase):
+    
+    def error(self, msg='a message', value='value', key='key', **kwargs):
+        return InvalidDataError(msg, value, key=key, **kwargs)
+    
+    def test_details_api(self):
+        error = self.error(context={'locale': 'de'})
+        details = error.details()
+        self.assert_equals('a message', details.msg())
+        self.assert_equals('value', details.value())
+        self.assert_equals('key', details.key())
+        self.assert_equals({'locale': 'de'}, details.context())
+        self.assert_equals({}, error.error_dict())
+    
+    def test_stores_details_in_slots(self):
+        error = self.error()
+        self.assert_false('_key' in getattr(error, '__dict__', {}))
+        self.assert_false('_details' in getattr(error, '__dict__', {}))
+    
+    def test_error_dict_can_be_modified(self):
+        error = self.error()
+        error.error_dict()['foo'] = self.error()
+        self.assert_equals(['foo'], list(error.error_dict().keys()))
+        self.assert_equals({}, self.error().error_dict())
+    
+    def test_equality(self):
+        self.assert_equals(self.error(), self.error())
+        self.assert_equals(self.error(context={'locale': 'de'}), self.error())
+        self.assert_not_equals(self.error(), self.error(key='other'))
+        self.assert_not_equals(self.error(), self.error(value='other'))
+        self.assert_not_equals(self.error(), self.error(msg='other'))
+        self.assert_not_equals(self.error(), EmptyError('a message', 'value', key='key'))
+        self.assert_not_equals(self.error(), self.error(error_dict={'foo': self.error()}))
+        self.assert_false(self.error() != self.error())
+        self.assert_false(self.error() == 'a message')
+    
+    def test_equal_errors_have_same_hash(self):
+        self.assert_equals(hash(self.error(value=[])), hash(self.error(value=[])))
+    
+    def test_pickles_compactly(self):
+        error = self.error()
+        unpickled = pickle.loads(pickle.dumps(error, pickle.HIGHEST_PROTOCOL))
+        self.assert_equals(error, unpickled)
+        self.assert_equals(repr(error), repr(unpickled))
+    
+    def test_other_validation_errors_can_be_pickled(self):
+        error = pickle.loads(pickle.dumps(ThreadSafetyError('foo'), pickle.HIGHEST_PROTOCOL))
+        self.assert_equals('foo', error.msg())
+
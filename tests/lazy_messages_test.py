@@ -0,0 +1,129 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.errors import InvalidDataError, LazyMessage
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator
+
+
+class CountingValidator(IntegerValidator):
+    
+    def __init__(self, *args, **kwargs):
+        self.super()
+        self.__dict__['translations'] = []
+    
+    def translate_message(self, key, native_message, translation_parameters, context):
+        self.translations.append(key)
+        return self.super()
+
+
+class LazyMessagesTest(PythonicTestCase):
+    
+    def error_for(self, validator, value, context):
+        try:
+            validator.process(value, context)
+        except InvalidDataError, e:
+            return e
+        self.fail('No error for %r' % value)
+    
+    def test_translates_message_immediately_by_default(self):
+        validator = CountingValidator()
+        e = self.error_for(validator, 'foo', {})
+        self.assert_equals(['invalid_number'], validator.translations)
+        self.assert_false(isinstance(e.raw_msg(), LazyMessage))
+    
+    def test_can_defer_translation(self):
+        validator = CountingValidator(max=10)
+        e = self.error_for(validator, '42', {'lazy_messages': True})
+        self.assert_equals('too_big', e.details().key())
+        self.assert_equals(42, e.details().value())
+        self.assert_equals([], validator.translations)
+        
+        self.assert_equals('Number must be 10 or smaller.', e.msg())
+        self.assert_equals(['too_big'], validator.translations)
+    
+    def test_memoizes_translated_message(self):
+        validator = CountingValidator()
+        e = self.error_for(validator, 'foo', {'lazy_messages': True})
+        e.msg()
+        e.details().msg()
+        str(e)
+        self.assert_equals(['invalid_number'], validator.translations)
+    
+    def test_str_contains_translated_message(self):
+        e = self.error_for(IntegerValidator(), 'foo', {'lazy_messages': True})
+        self.assert_contains('Please enter a number.', str(e))
+    
+    def test_translates_lazy_messages_with_locale_from_context(self):
+        context = {'locale': 'de', 'lazy_messages': True}
+        e = self.error_for(IntegerValidator(), 'foo', context)
+        self.assert_equals(u'Bitte geben Sie eine Zahl ein.', e.details().msg())
+    
+    def test_schema_does_not_translate_field_errors(self):
+        validator = CountingValidator()
+        schema = SchemaValidator()
+        schema.add('id', validator)
+        e = self.error_for(schema, {'id': 'foo'}, {'lazy_messages': True})
+        self.assert_equals(['id'], list(e.error_dict().keys()))
+        self.assert_equals('invalid_number', e.error_for('id').details().key())
+        self.assert_equals([], validator.translations)
+        
+        self.assert_equals('Please enter a number.', e.msg())
+        self.assert_equals('Please enter a number.', e.error_for('id').msg())
+        self.assert_equals(['invalid_number'], validator.translations)
+    
+    def test_comparing_errors_does_not_translate_messages(self):
+        validator = CountingValidator(max=10)
+        context = {'lazy_messages': True}
+        e = self.error_for(validator, '42', context)
+        self.assert_equals(e, self.error_for(validator, '42', context))
+        self.assert_not_equals(e, self.error_for(validator, '43', context))
+        german_error = self.error_for(validator, '42', {'lazy_messages': True, 'locale': 'de'})
+        self.assert_not_equals(e, german_error)
+        self.assert_equals([], validator.translations)
+    
+    def test_lazy_messages_are_never_equal_to_strings(self):
+        validator = CountingValidator()
+        e = self.error_for(validator, 'foo', {'lazy_messages': True})
+        lazy_message = e.raw_msg()
+        self.assert_not_equals(lazy_message, 'Please enter a number.')
+        self.assert_not_equals('Please enter a number.', lazy_message)
+        self.assert_not_equals(e, self.error_for(validator, 'foo', {}))
+        self.assert_equals(['invalid_number'], validator.translations)
+        
+        # reading the message does not change equality
+        other = self.error_for(validator, 'foo', {'lazy_messages': True})
+        e.msg()
+        self.assert_equals(e, other)
+        self.assert_true(isinstance(e.raw_msg(), LazyMessage))
+        self.assert_equals(1, len(set([lazy_message, other.raw_msg()])))
+    
+    def test_process_many_supports_lazy_messages(self):
+        validator = CountingValidator()
+        results = validator.process_many(['foo', 'bar'], {'lazy_messages': True})
+        self.assert_equals(['invalid_number', 'invalid_number'], 
+                           [result.details().key() for result in results])
+        self.assert_equals([], validator.translations)
+
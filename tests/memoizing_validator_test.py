@@ -0,0 +1,166 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pickle
+import threading
+
+from pycerberus.errors import EmptyError, InvalidArgumentsError, InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import DomainNameValidator, EmailAddressValidator, \
+    IntegerValidator, MemoizingValidator, StringValidator
+
+
+class CountingDomainValidator(DomainNameValidator):
+    
+    def __init__(self, *args, **kwargs):
+        self.super(*args, **kwargs)
+        self.__dict__['calls'] = []
+    
+    def is_pure(self):
+        return True
+    
+    def validate(self, value, context):
+        self.calls.append(value)
+        self.super()
+
+
+class MemoizingValidatorTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        self.wrapped = CountingDomainValidator()
+        self.validator = MemoizingValidator(self.wrapped, maxsize=2)
+    
+    def test_builtin_validators_are_pure(self):
+        for validator_class in (IntegerValidator, StringValidator, DomainNameValidator, EmailAddressValidator):
+            self.assert_true(validator_class().is_pure())
+        class UniqueNameValidator(StringValidator):
+            pass
+        self.assert_false(UniqueNameValidator().is_pure())
+        self.assert_true(CountingDomainValidator().is_pure())
+    
+    def test_rejects_impure_validators(self):
+        class UniqueNameValidator(StringValidator):
+            pass
+        self.assert_raises(InvalidArgumentsError, MemoizingValidator, UniqueNameValidator())
+    
+    def test_caches_converted_values(self):
+        self.assert_equals('example.com', self.validator.process('example.com'))
+        self.assert_equals('example.com', self.validator.process('example.com'))
+        self.assert_equals(['example.com'], self.wrapped.calls)
+        self.assert_equals(1, self.validator.cache_stats()['hits'])
+        self.assert_equals(1, self.validator.cache_stats()['misses'])
+    
+    def test_caches_errors(self):
+        first = self.assert_raises(InvalidDataError, self.validator.process, 'foo..com', {'foo': 1})
+        second = self.assert_raises(InvalidDataError, self.validator.process, 'foo..com', {'foo': 2})
+        self.assert_equals(['foo..com'], self.wrapped.calls)
+        self.assert_false(first is second)
+        self.assert_equals('double_dot', second.details().key())
+        self.assert_equals(first.details().msg(), second.details().msg())
+        self.assert_equals({'foo': 2}, second.details().context())
+    
+    def test_locale_is_part_of_cache_key(self):
+        english = self.assert_raises(InvalidDataError, MemoizingValidator(IntegerValidator()).process, 'foo')
+        validator = MemoizingValidator(IntegerValidator())
+        self.assert_raises(InvalidDataError, validator.process, 'foo', {'locale': 'en'})
+        german = self.assert_raises(InvalidDataError, validator.process, 'foo', {'locale': 'de'})
+        self.assert_equals(u'Bitte geben Sie eine Zahl ein.', german.details().msg())
+        self.assert_equals(2, validator.cache_stats()['misses'])
+        self.assert_equals('Please enter a number.', english.details().msg())
+    
+    def test_type_is_part_of_cache_key(self):
+        validator = MemoizingValidator(IntegerValidator())
+        self.assert_equals(1, validator.process(1))
+        error = self.assert_raises(InvalidDataError, validator.process, 1.0)
+        self.assert_equals('invalid_type', error.details().key())
+        
+        validator = MemoizingValidator(StringValidator())
+        validator.process('abc')
+        self.assert_isinstance(validator.process(u'abc'), unicode)
+    
+    def test_cache_is_bounded(self):
+        for value in ('a.com', 'b.com', 'c.com', 'a.com'):
+            self.validator.process(value)
+        self.assert_equals(['a.com', 'b.com', 'c.com', 'a.com'], self.wrapped.calls)
+        stats = self.validator.cache_stats()
+        self.assert_equals(2, stats['size'])
+        self.assert_equals(2, stats['evictions'])
+    
+    def test_does_not_cache_unhashable_values(self):
+        validator = MemoizingValidator(StringValidator())
+        self.assert_raises(InvalidDataError, validator.process, ['foo'])
+        self.assert_equals(0, validator.cache_stats()['size'])
+    
+    def test_handles_empty_values_like_wrapped_validator(self):
+        self.assert_raises(EmptyError, self.validator.process, None)
+        optional = MemoizingValidator(IntegerValidator(required=False, default=42))
+        self.assert_equals(42, optional.process(None))
+        self.assert_equals(42, optional.empty_value({}))
+    
+    def test_can_clear_cache(self):
+        self.validator.process('example.com')
+        self.validator.clear_cache()
+        self.validator.process('example.com')
+        self.assert_length(2, self.wrapped.calls)
+    
+    def test_keeps_thread_safety_protection(self):
+        self.assert_true(self.validator.is_internal_state_frozen())
+        self.validator.process('example.com')
+        self.assert_true(self.validator.is_internal_state_frozen())
+    
+    def test_can_be_used_from_multiple_threads(self):
+        validator = MemoizingValidator(IntegerValidator(), maxsize=50)
+        errors = []
+        def worker():
+            try:
+                for i in range(500):
+                    assert validator.process(str(i % 100)) == i % 100
+            except Exception, e:
+                errors.append(e)
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assert_equals([], errors)
+        stats = validator.cache_stats()
+        self.assert_equals(2000, stats['hits'] + stats['misses'])
+        self.assert_equals(50, stats['size'])
+    
+    def test_can_use_memoizing_validator_in_schema(self):
+        schema = SchemaValidator()
+        schema.add('domain', self.validator)
+        self.assert_equals({'domain': 'example.com'}, schema.process({'domain': 'example.com'}))
+        self.assert_equals({'domain': 'example.com'}, schema.process({'domain': 'example.com'}))
+        self.assert_length(1, self.wrapped.calls)
+    
+    def test_can_pickle_memoizing_validator(self):
+        validator = MemoizingValidator(IntegerValidator())
+        validator.process('42')
+        unpickled = pickle.loads(pickle.dumps(validator, pickle.HIGHEST_PROTOCOL))
+        self.assert_equals(42, unpickled.process('42'))
+        self.assert_equals(1, unpickled.cache_stats()['misses'])
+
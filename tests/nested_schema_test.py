@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class GeoSchema(SchemaValidator):
+    lat = IntegerValidator()
+    lon = IntegerValidator()
+
+
+class AddressSchema(SchemaValidator):
+    street = StringValidator()
+    geo = GeoSchema
+
+
+class PersonSchema(SchemaValidator):
+    name = StringValidator()
+    address = AddressSchema
+
+
+class OpaqueSchema(SchemaValidator):
+    # custom process() - processed like any other validator (not flattened)
+    def process(self, value, context=None):
+        return super(OpaqueSchema, self).process(value, context=context)
+
+
+def opaque_person_schema():
+    geo = OpaqueSchema()
+    geo.add('lat', IntegerValidator())
+    geo.add('lon', IntegerValidator())
+    address = OpaqueSchema()
+    address.add('street', StringValidator())
+    address.add('geo', geo)
+    person = SchemaValidator()
+    person.add('name', StringValidator())
+    person.add('address', address)
+    return person
+
+
+def error_structure(error):
+    "Return a comparable representation of a (nested) InvalidDataError."
+    structure = {'key': error.key(), 'msg': error.msg(), 'value': error.value()}
+    for name, field_error in error.error_dict().items():
+        structure[name] = error_structure(field_error)
+    return structure
+
+
+class NestedSchemaTest(PythonicTestCase):
+    
+    def payload(self, **address):
+        values = {'street': 'Main Street', 'geo': {'lat': '1', 'lon': '2'}}
+        values.update(address)
+        return {'name': 'Foo', 'address': values}
+    
+    def assert_same_as_unflattened(self, payload):
+        expected = opaque_person_schema().check(payload)
+        actual = PersonSchema().check(payload)
+        self.assert_equals(expected.is_valid(), actual.is_valid())
+        if expected.is_valid():
+            self.assert_equals(expected.value(), actual.value())
+            self.assert_equals(expected.value(), PersonSchema().process(payload))
+            return
+        self.assert_equals(error_structure(expected.error()), error_structure(actual.error()))
+        e = self.assert_raises(InvalidDataError, lambda: PersonSchema().process(payload))
+        self.assert_equals(error_structure(expected.error()), error_structure(e))
+    
+    def test_builds_nested_output(self):
+        expected = {'name': 'Foo', 'address': {'street': 'Main Street', 'geo': {'lat': 1, 'lon': 2}}}
+        self.assert_equals(expected, PersonSchema().process(self.payload()))
+        self.assert_same_as_unflattened(self.payload())
+    
+    def test_nested_error_dict_is_unchanged(self):
+        e = self.assert_raises(InvalidDataError, lambda: PersonSchema().process(self.payload(geo={'lat': 'x', 'lon': '2'})))
+        self.assert_equals(['address'], list(e.error_dict()))
+        geo_error = e.error_for('address').error_for('geo')
+        self.assert_equals('invalid_number', geo_error.error_for('lat').key())
+        
+        self.assert_same_as_unflattened(self.payload(geo={'lat': 'x', 'lon': None}))
+        self.assert_same_as_unflattened(self.payload(street=None, geo={'lat': 'x', 'lon': 'y'}))
+    
+    def test_handles_missing_empty_and_invalid_nested_values(self):
+        self.assert_same_as_unflattened({'name': 'Foo'})
+        self.assert_same_as_unflattened({'name': 'Foo', 'address': None})
+        self.assert_same_as_unflattened(self.payload(geo=None))
+        self.assert_same_as_unflattened(self.payload(geo='invalid'))
+        self.assert_same_as_unflattened({'name': 'Foo', 'address': 42})
+    
+    def test_runs_nested_formvalidators(self):
+        class LatBelowLon(Validator):
+            def validate(self, fields, context):
+                if fields['lat'] > fields['lon']:
+                    self.error('empty', fields, context)
+        schema = PersonSchema()
+        geo = schema.validator_for_path('address.geo')
+        geo.set_internal_state_freeze(False)
+        geo.add_formvalidator(LatBelowLon())
+        geo.set_internal_state_freeze(True)
+        schema.process(self.payload())
+        e = self.assert_raises(InvalidDataError, lambda: schema.process(self.payload(geo={'lat': '5', 'lon': '2'})))
+        self.assert_equals('empty', e.error_for('address').error_for('geo').key())
+    
+    def test_checks_additional_items_in_nested_schemas(self):
+        schema = PersonSchema()
+        address = schema.validator_for_path(('address', ))
+        address.set_internal_state_freeze(False)
+        address.set_allow_additional_parameters(False)
+        address.set_internal_state_freeze(True)
+        e = self.assert_raises(InvalidDataError, lambda: schema.process(self.payload(zip='12345')))
+        self.assert_equals('additional_items', e.error_for('address').key())
+    
+    def test_picks_up_changes_of_nested_schemas(self):
+        schema = PersonSchema()
+        schema.process(self.payload())
+        address = schema.validator_for_path('address')
+        address.set_internal_state_freeze(False)
+        address.add('city', StringValidator())
+        address.set_internal_state_freeze(True)
+        e = self.assert_raises(InvalidDataError, lambda: schema.process(self.payload()))
+        self.assert_equals(['city'], list(e.error_for('address').error_dict()))
+    
+    def test_supports_fail_fast_in_nested_schemas(self):
+        payload = self.payload(street=None, geo={'lat': 'x', 'lon': 'y'})
+        e = self.assert_raises(InvalidDataError, lambda: PersonSchema().process(payload, context={'fail_fast': True}))
+        self.assert_length(1, e.error_for('address').error_dict())
+    
+    def test_can_address_fields_by_path(self):
+        schema = PersonSchema()
+        expected = [('address', 'geo', 'lat'), ('address', 'geo', 'lon'), ('address', 'street'), ('name', )]
+        self.assert_equals(expected, schema.paths())
+        self.assert_isinstance(schema.validator_for_path('address.geo.lat'), IntegerValidator)
+        self.assert_isinstance(schema.validator_for_path(('address', 'geo')), GeoSchema)
+        self.assert_raises(KeyError, lambda: schema.validator_for_path('address.zip'))
+
@@ -0,0 +1,122 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pickle
+
+from pycerberus.errors import EmptyError, InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.parallel import ParallelProcessor, process_parallel, \
+    ProcessPoolExecutor
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import EmailAddressValidator, IntegerValidator
+
+
+class RecordSchema(SchemaValidator):
+    id = IntegerValidator()
+    email = EmailAddressValidator()
+
+
+class PickleTest(PythonicTestCase):
+    
+    def roundtrip(self, obj):
+        return pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+    
+    def test_can_pickle_errors(self):
+        error = InvalidDataError('a message', 'value', key='key', context={'locale': 'de'})
+        unpickled = self.roundtrip(error)
+        self.assert_isinstance(unpickled, InvalidDataError)
+        self.assert_equals(repr(error), repr(unpickled))
+        details = unpickled.details()
+        self.assert_equals('a message', details.msg())
+        self.assert_equals('value', details.value())
+        self.assert_equals('key', details.key())
+        self.assert_equals({'locale': 'de'}, details.context())
+    
+    def test_can_pickle_schema_errors(self):
+        error = self.assert_raises(InvalidDataError, RecordSchema().process, {'id': 'foo'})
+        unpickled = self.roundtrip(error)
+        self.assert_equals(['email', 'id'], sorted(unpickled.error_dict().keys()))
+        self.assert_isinstance(unpickled.error_for('email'), EmptyError)
+        self.assert_equals('invalid_number', unpickled.error_for('id').details().key())
+    
+    def test_can_pickle_validators(self):
+        validator = self.roundtrip(IntegerValidator(min=10))
+        self.assert_equals(42, validator.process('42'))
+        error = self.assert_raises(InvalidDataError, validator.process, '5')
+        self.assert_equals('Number must be 10 or greater.', error.details().msg())
+    
+    def test_can_pickle_schemas(self):
+        schema = RecordSchema()
+        schema.process({'id': '1', 'email': 'foo@example.com'})
+        unpickled = self.roundtrip(schema)
+        self.assert_equals({'id': 1, 'email': 'foo@example.com'}, 
+                           unpickled.process({'id': '1', 'email': 'foo@example.com'}))
+        self.assert_raises(InvalidDataError, unpickled.process, {'id': '1', 'email': 'foo'})
+    
+    def test_thread_safety_protection_is_preserved(self):
+        unpickled = self.roundtrip(IntegerValidator())
+        self.assert_true(unpickled.is_internal_state_frozen())
+
+
+class ParallelProcessingTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        if ProcessPoolExecutor is None:
+            self.skipTest('concurrent.futures not available')
+    
+    def _records(self):
+        records = []
+        for i in range(50):
+            email = 'user%d@example.com' % i
+            if i % 7 == 0:
+                email = 'invalid'
+            records.append({'id': str(i), 'email': email})
+        return records
+    
+    def test_returns_same_results_as_process_many_in_input_order(self):
+        schema = RecordSchema()
+        records = self._records()
+        expected = schema.process_many(records)
+        results = process_parallel(schema, records, workers=2, chunksize=8)
+        self.assert_length(len(expected), results)
+        for expected_result, result in zip(expected, results):
+            if isinstance(expected_result, InvalidDataError):
+                self.assert_isinstance(result, InvalidDataError)
+                self.assert_equals(expected_result.error_dict().keys(), result.error_dict().keys())
+            else:
+                self.assert_equals(expected_result, result)
+    
+    def test_can_reuse_processor_for_multiple_batches(self):
+        processor = ParallelProcessor(IntegerValidator(), workers=2, chunksize=3)
+        try:
+            self.assert_equals([1, 2, 3, 4], processor.process_many(['1', '2', '3', '4']))
+            results = processor.process_many(['5', 'foo'])
+            self.assert_equals(5, results[0])
+            self.assert_equals('invalid_number', results[1].details().key())
+        finally:
+            processor.shutdown()
+    
+    def test_can_process_empty_input(self):
+        self.assert_equals([], process_parallel(RecordSchema(), [], workers=1))
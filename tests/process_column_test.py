@@ -0,0 +1,146 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import random
+
+from pycerberus.api import Validator
+from pycerberus.errors import EmptyError, InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.result import ColumnResult
+from pycerberus.validators import IntegerValidator, StringValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ProcessColumnTest(PythonicTestCase):
+    
+    def assert_results_like_process(self, validator, column):
+        result = validator.process_column(column)
+        self.assert_isinstance(result, ColumnResult)
+        self.assert_length(len(column), result.converted())
+        for index, value in enumerate(column):
+            try:
+                expected = validator.process(value, {})
+            except InvalidDataError, e:
+                self.assert_true(result.mask()[index])
+                self.assert_equals(e.key(), result.error_keys()[index], repr(value))
+                error = result.error(index)
+                self.assert_equals(e.__class__, error.__class__)
+                self.assert_equals(e.key(), error.key())
+                self.assert_equals(e.msg(), error.msg())
+            else:
+                self.assert_false(result.mask()[index])
+                self.assert_none(result.error(index))
+                self.assert_equals(expected, result.converted()[index])
+        return result
+    
+    def test_integer_validator_converts_column(self):
+        result = IntegerValidator().process_column(['1', ' 2 ', 3, '-4'])
+        self.assert_true(result.is_valid())
+        self.assert_equals([1, 2, 3, -4], result.converted())
+        self.assert_equals([], result.failed_indices())
+        self.assert_equals({}, result.errors())
+    
+    def test_integer_validator_reports_failures(self):
+        result = IntegerValidator(min=0, max=100).process_column(['1', 'x', None, '-5', '500', 3.5, '42'])
+        self.assert_false(result.is_valid())
+        self.assert_equals([1, None, None, None, None, None, 42], result.converted())
+        self.assert_equals([1, 2, 3, 4, 5], result.failed_indices())
+        expected_keys = {1: 'invalid_number', 2: 'empty', 3: 'too_low', 4: 'too_big', 5: 'invalid_type'}
+        self.assert_equals(expected_keys, result.error_keys())
+        self.assert_equals([False, True, True, True, True, True, False], result.mask())
+        self.assert_isinstance(result.error(2), EmptyError)
+        self.assert_equals('Number must be 0 or greater.', result.error(3).msg())
+    
+    def test_creates_errors_only_on_demand(self):
+        result = IntegerValidator(max=10).process_column(['1', '20', '30'])
+        self.assert_equals({}, result._errors)
+        error = result.error(1)
+        self.assert_equals([1], list(result._errors))
+        self.assert_equals(error, result.error(1))
+        self.assert_equals([1, 2], sorted(result.errors()))
+    
+    def test_integer_validator_behaves_like_process(self):
+        randomizer = random.Random(42)
+        cells = ['0', '7', '-3', ' 12 ', '100', '101', '', 'abc', '1.5', None, 5, 2.0, True]
+        column = [randomizer.choice(cells) for i in range(500)]
+        self.assert_results_like_process(IntegerValidator(min=-2, max=100), column)
+        self.assert_results_like_process(IntegerValidator(required=False, default=-1), column)
+        self.assert_results_like_process(IntegerValidator(strip=True), column)
+    
+    def test_uses_per_cell_processing_for_subclasses(self):
+        class EvenNumberValidator(IntegerValidator):
+            def validate(self, value, context):
+                if value % 2:
+                    self.error('invalid_number', value, context)
+        result = self.assert_results_like_process(EvenNumberValidator(), ['2', '3', 'x'])
+        self.assert_equals([1, 2], result.failed_indices())
+    
+    def test_other_validators_process_each_cell(self):
+        result = self.assert_results_like_process(StringValidator(), ['foo', None, 42])
+        self.assert_equals(['foo', None, None], result.converted())
+        self.assert_equals({1: 'empty', 2: 'invalid_type'}, result.error_keys())
+        
+        result = Validator().process_column(['foo', None])
+        self.assert_equals(['foo', None], result.converted())
+        self.assert_isinstance(result.error(1), EmptyError)
+    
+    def test_accepts_iterables(self):
+        result = IntegerValidator().process_column(iter(['1', '2']))
+        self.assert_equals([1, 2], result.converted())
+    
+    # --------------------------------------------------------------------------
+    # NumPy
+    
+    def _require_numpy(self):
+        if numpy is None:
+            self.skipTest('NumPy not available')
+    
+    def test_checks_integer_arrays_without_conversion(self):
+        self._require_numpy()
+        column = numpy.array([1, -2, 50, 101, 7])
+        result = IntegerValidator(min=0, max=100).process_column(column)
+        self.assert_equals([1, 0, 50, 0, 7], result.converted().tolist())
+        self.assert_equals([False, True, False, True, False], result.mask().tolist())
+        self.assert_equals({1: 'too_low', 3: 'too_big'}, result.error_keys())
+        self.assert_equals('Number must be 0 or greater.', result.error(1).msg())
+        self.assert_equals(-2, result.error(1).value())
+        
+        valid_column = numpy.array([1, 2, 3], dtype=numpy.int8)
+        self.assert_true(IntegerValidator(max=3).process_column(valid_column).converted() is valid_column)
+    
+    def test_converts_other_arrays_to_integer_arrays(self):
+        self._require_numpy()
+        result = IntegerValidator(max=100).process_column(numpy.array(['1', 'a', '300']))
+        self.assert_equals(numpy.int64, result.converted().dtype)
+        self.assert_equals([1, 0, 0], result.converted().tolist())
+        self.assert_equals({1: 'invalid_number', 2: 'too_big'}, result.error_keys())
+        
+        result = IntegerValidator().process_column(numpy.array(['1', str(2**70)]))
+        self.assert_equals(object, result.converted().dtype)
+        self.assert_equals(2**70, result.converted()[1])
+
@@ -0,0 +1,124 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import BaseValidator, Validator
+from pycerberus.errors import EmptyError, InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class ProcessManyTest(PythonicTestCase):
+    
+    def assert_results_like_process(self, validator, values):
+        results = validator.process_many(values)
+        self.assert_length(len(values), results)
+        for value, result in zip(values, results):
+            try:
+                expected = validator.process(value, {})
+            except InvalidDataError, e:
+                self.assert_isinstance(result, e.__class__)
+                self.assert_equals(e.details().key(), result.details().key())
+                self.assert_equals(e.error_dict().keys(), result.error_dict().keys())
+            else:
+                self.assert_equals(expected, result)
+        return results
+    
+    def test_base_validator_returns_values(self):
+        self.assert_equals([1, 'foo', None], BaseValidator().process_many([1, 'foo', None]))
+    
+    def test_returns_errors_instead_of_raising(self):
+        results = IntegerValidator(max=100).process_many(['1', 'foo', '200', None, 42])
+        self.assert_equals(1, results[0])
+        self.assert_equals('invalid_number', results[1].details().key())
+        self.assert_equals('too_big', results[2].details().key())
+        self.assert_isinstance(results[3], EmptyError)
+        self.assert_equals(42, results[4])
+    
+    def test_behaves_like_process(self):
+        values = ['1', ' 2 ', '', None, 'foo', 42]
+        self.assert_results_like_process(IntegerValidator(required=False), values)
+        self.assert_results_like_process(StringValidator(strip=True, required=False), values)
+        self.assert_results_like_process(StringValidator(default='empty', required=False), values)
+    
+    def test_accepts_any_iterable(self):
+        values = iter(['1', '2'])
+        self.assert_equals([1, 2], IntegerValidator().process_many(values))
+    
+    def test_uses_same_context_for_all_values(self):
+        seen_contexts = []
+        class ContextValidator(Validator):
+            def convert(self, value, context):
+                seen_contexts.append(context)
+                return value
+        context = {'locale': 'de'}
+        ContextValidator().process_many([1, 2], context)
+        self.assert_equals(2, len(seen_contexts))
+        self.assert_true(seen_contexts[0] is context)
+        self.assert_true(seen_contexts[1] is context)
+    
+    def test_uses_overridden_process_method(self):
+        class UpperCaseValidator(Validator):
+            def process(self, value, context=None):
+                return value.upper()
+        self.assert_equals(['FOO', 'BAR'], UpperCaseValidator().process_many(['foo', 'bar']))
+    
+    # -------------------------------------------------------------------------
+    # schemas
+    
+    def _schema(self):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        schema.add('name', StringValidator(required=False))
+        return schema
+    
+    def test_schema_behaves_like_process(self):
+        values = [{'id': '1', 'name': 'foo'}, {'id': 'invalid'}, {}, None, 'foo', {'id': 2}]
+        results = self.assert_results_like_process(self._schema(), values)
+        self.assert_equals({'id': 1, 'name': 'foo'}, results[0])
+        self.assert_equals(['id'], results[1].error_dict().keys())
+        self.assert_equals({}, results[3])
+        self.assert_equals('invalid_type', results[4].details().key())
+    
+    def test_schema_runs_formvalidators(self):
+        class FormValidator(Validator):
+            def validate(self, fields, context):
+                if fields['id'] > 10:
+                    self.error('too_big', fields, context)
+            messages = {'too_big': 'too big'}
+        schema = self._schema()
+        schema.add_formvalidator(FormValidator())
+        results = schema.process_many([{'id': '1'}, {'id': '11'}])
+        self.assert_equals({'id': 1, 'name': None}, results[0])
+        self.assert_equals('too_big', results[1].details().key())
+    
+    def test_schema_uses_overridden_methods(self):
+        class PrefixSchema(SchemaValidator):
+            def convert(self, fields, context):
+                fields = dict(fields)
+                fields['id'] = 'prefix-' + fields['id']
+                return self.super()
+        schema = PrefixSchema()
+        schema.add('id', StringValidator())
+        self.assert_equals([{'id': 'prefix-1'}], schema.process_many([{'id': '1'}]))
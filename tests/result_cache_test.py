@@ -0,0 +1,223 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pickle
+import time
+
+from pycerberus import instrumentation
+from pycerberus.api import Validator
+from pycerberus.errors import InvalidArgumentsError, InvalidDataError
+from pycerberus.instrumentation import Registry
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import canonical_key, SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class CountingIntegerValidator(IntegerValidator):
+    
+    def __init__(self, *args, **kwargs):
+        self.super(*args, **kwargs)
+        self.__dict__['calls'] = []
+    
+    def is_pure(self):
+        return True
+    
+    def convert(self, value, context):
+        self.calls.append(value)
+        return self.super()
+
+
+class ImpureValidator(StringValidator):
+    # e.g. checks a database
+    pass
+
+
+class ResultCacheTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        self.counter = CountingIntegerValidator()
+        self.schema = SchemaValidator()
+        self.schema.add('id', self.counter)
+        self.schema.add('name', StringValidator())
+        self.schema.enable_result_cache(maxsize=10)
+    
+    def test_schemas_with_pure_validators_are_pure(self):
+        self.assert_true(self.schema.is_pure())
+        self.assert_true(SchemaValidator().is_pure())
+        schema = SchemaValidator()
+        schema.add('name', ImpureValidator())
+        self.assert_false(schema.is_pure())
+        schema = SchemaValidator()
+        schema.add_formvalidator(Validator())
+        self.assert_false(schema.is_pure())
+    
+    def test_refuses_to_cache_impure_schemas(self):
+        schema = SchemaValidator()
+        schema.add('name', ImpureValidator())
+        self.assert_raises(InvalidArgumentsError, schema.enable_result_cache)
+        self.assert_none(schema.cache_stats())
+        
+        self.assert_raises(InvalidArgumentsError, self.schema.add, 'foo', ImpureValidator())
+        self.assert_raises(InvalidArgumentsError, self.schema.add_formvalidator, Validator())
+        self.assert_equals(set(['id', 'name']), set(self.schema.fieldvalidators().keys()))
+    
+    def test_caches_validated_fields(self):
+        values = {'id': '42', 'name': 'foo'}
+        self.assert_equals({'id': 42, 'name': 'foo'}, self.schema.process(values))
+        self.assert_equals({'id': 42, 'name': 'foo'}, self.schema.process(values.copy()))
+        self.assert_equals(['42'], self.counter.calls)
+        stats = self.schema.cache_stats()
+        self.assert_equals(1, stats['hits'])
+        self.assert_equals(1, stats['misses'])
+        self.assert_equals(0.5, stats['hit_rate'])
+    
+    def test_returns_a_copy_of_the_validated_fields(self):
+        self.schema.process({'id': '42', 'name': 'foo'})['id'] = 21
+        self.assert_equals(42, self.schema.process({'id': '42', 'name': 'foo'})['id'])
+    
+    def test_caches_errors(self):
+        values = {'id': 'invalid', 'name': 'foo'}
+        first = self.assert_raises(InvalidDataError, self.schema.process, values)
+        second = self.assert_raises(InvalidDataError, self.schema.process, values, {'foo': 'bar'})
+        self.assert_not_equals(id(first), id(second))
+        self.assert_equals(['invalid'], self.counter.calls)
+        self.assert_equals(first.details().msg(), second.details().msg())
+        self.assert_equals('invalid_number', second.error_for('id').details().key())
+        self.assert_equals({'foo': 'bar'}, second.details().context())
+    
+    def test_respects_locale(self):
+        values = {'id': 'invalid', 'name': 'foo'}
+        english = self.assert_raises(InvalidDataError, self.schema.process, values, {'locale': 'en'})
+        german = self.assert_raises(InvalidDataError, self.schema.process, values, {'locale': 'de'})
+        self.assert_length(2, self.counter.calls)
+        self.assert_equals('Please enter a number.', english.error_for('id').details().msg())
+        self.assert_equals(u'Bitte geben Sie eine Zahl ein.', german.error_for('id').details().msg())
+    
+    def test_respects_fail_fast_from_context(self):
+        values = {'id': 'invalid', 'name': None}
+        self.assert_length(2, self.assert_raises(InvalidDataError, self.schema.process, values).error_dict())
+        error = self.assert_raises(InvalidDataError, self.schema.process, values, {'fail_fast': True})
+        self.assert_length(1, error.error_dict())
+    
+    def test_payloads_are_compared_canonically(self):
+        self.assert_equals(canonical_key({'a': 1, 'b': [1, 2]}), canonical_key({'b': [1, 2], 'a': 1}))
+        self.assert_not_equals(canonical_key({'a': 1}), canonical_key({'a': '1'}))
+        self.assert_not_equals(canonical_key({'a': 1}), canonical_key({'a': True}))
+        self.assert_not_equals(canonical_key({'a': [1]}), canonical_key({'a': (1, )}))
+        
+        self.schema.process({'id': '1', 'name': 'foo'})
+        self.schema.process({'name': 'foo', 'id': '1'})
+        self.assert_equals(1, self.schema.cache_stats()['hits'])
+    
+    def test_does_not_cache_unhashable_values(self):
+        class Unhashable(object):
+            __hash__ = None
+            def strip(self):
+                return 'foo'
+        self.assert_raises(TypeError, canonical_key, {'a': Unhashable()})
+        self.schema.process({'id': '1', 'name': 'foo', 'extra': Unhashable()})
+        self.assert_equals(0, self.schema.cache_stats()['size'])
+    
+    def test_entries_expire(self):
+        self.schema.enable_result_cache(ttl=0.05)
+        self.schema.process({'id': '1', 'name': 'foo'})
+        time.sleep(0.1)
+        self.schema.process({'id': '1', 'name': 'foo'})
+        self.assert_length(2, self.counter.calls)
+        self.assert_equals(1, self.schema.cache_stats()['expirations'])
+    
+    def test_cache_is_bounded(self):
+        for i in range(20):
+            self.schema.process({'id': str(i), 'name': 'foo'})
+        stats = self.schema.cache_stats()
+        self.assert_equals(10, stats['size'])
+        self.assert_equals(10, stats['evictions'])
+    
+    def test_cache_is_cleared_when_schema_changes(self):
+        self.schema.process({'id': '1', 'name': 'foo'})
+        self.schema.add('other', StringValidator(required=False))
+        self.assert_equals({'id': 1, 'name': 'foo', 'other': None}, self.schema.process({'id': '1', 'name': 'foo'}))
+        self.assert_length(2, self.counter.calls)
+    
+    def test_check_and_process_many_use_the_cache(self):
+        values = {'id': '1', 'name': 'foo'}
+        self.schema.process(values)
+        self.assert_equals({'id': 1, 'name': 'foo'}, self.schema.check(values).value())
+        self.assert_equals([{'id': 1, 'name': 'foo'}], self.schema.process_many([values]))
+        self.assert_length(1, self.counter.calls)
+    
+    def test_can_disable_cache(self):
+        self.schema.disable_result_cache()
+        self.assert_none(self.schema.cache_stats())
+        self.schema.process({'id': '1', 'name': 'foo'})
+        self.schema.process({'id': '1', 'name': 'foo'})
+        self.assert_length(2, self.counter.calls)
+    
+    def test_cache_survives_pickling(self):
+        schema = pickle.loads(pickle.dumps(self.schema, pickle.HIGHEST_PROTOCOL))
+        schema.process({'id': '1', 'name': 'foo'})
+        schema.process({'id': '1', 'name': 'foo'})
+        self.assert_equals(1, schema.cache_stats()['hits'])
+    
+    def test_toggling_instrumentation_keeps_the_cache(self):
+        values = {'id': '1', 'name': 'foo'}
+        self.schema.process(values)
+        instrumentation.enable(Registry())
+        try:
+            self.schema.process(values)
+        finally:
+            instrumentation.disable()
+        self.schema.process(values)
+        self.assert_length(1, self.counter.calls)
+        self.assert_equals(2, self.schema.cache_stats()['hits'])
+    
+    def test_nested_schema_uses_cache_enabled_after_parent_was_compiled(self):
+        nested = self.schema
+        nested.disable_result_cache()
+        parent = SchemaValidator()
+        parent.add('user', nested)
+        values = {'user': {'id': '1', 'name': 'foo'}}
+        parent.process(values)
+        
+        nested.enable_result_cache()
+        parent.process(values)
+        parent.process(values)
+        self.assert_length(2, self.counter.calls)
+        self.assert_equals(1, nested.cache_stats()['hits'])
+        
+        nested.disable_result_cache()
+        parent.process(values)
+        self.assert_length(3, self.counter.calls)
+    
+    def test_nested_schema_with_cache_is_used_by_parent(self):
+        parent = SchemaValidator()
+        parent.add('user', self.schema)
+        values = {'user': {'id': '1', 'name': 'foo'}}
+        self.assert_equals({'user': {'id': 1, 'name': 'foo'}}, parent.process(values))
+        self.assert_equals({'user': {'id': 1, 'name': 'foo'}}, parent.process(values))
+        self.assert_length(1, self.counter.calls)
+        
+        error = self.assert_raises(InvalidDataError, parent.process, {'user': {'id': 'x', 'name': 'foo'}})
+        self.assert_equals('invalid_number', error.error_for('user').error_for('id').details().key())
@@ -200,5 +200,68 @@ class SchemaTest(PythonicTestCase):
         
         error = self.assert_raises(InvalidDataError, schema.process, {'id': '42'})
         self.assert_equals('expected', error.details().key())
+    
+    # -------------------------------------------------------------------------
+    # compiled execution plan
+    
+    def test_can_compile_schema(self):
+        schema = self._schema(('id', 'key'))
+        plan = schema.compile()
+        self.assert_equals(set(['id', 'key']), set(plan.allowed_keys))
+        self.assert_equals(['id', 'key'], sorted([step[0] for step in plan.fields]))
+        self.assert_equals({'id': 42, 'key': 'foo'}, plan.process({'id': '42', 'key': 'foo'}, {}))
+    
+    def test_plan_is_reused(self):
+        schema = self._schema()
+        schema.process({'id': '42'})
+        self.assert_true(schema.compile() is schema.compile())
+    
+    def test_adding_validators_rebuilds_plan(self):
+        schema = self._schema()
+        self.assert_equals({'id': 42}, schema.process({'id': '42'}))
+        schema.add('amount', IntegerValidator())
+        self.assert_equals({'id': 42, 'amount': 21}, schema.process({'id': '42', 'amount': '21'}))
+        
+        schema.add_formvalidator(self._failing_validator())
+        self.assert_raises(InvalidDataError, schema.process, {'id': '42', 'amount': '21'})
+    
+    def test_plan_respects_changed_setting_for_additional_parameters(self):
+        schema = self._schema()
+        self.assert_equals({'id': 42}, schema.process(dict(id=42, foo=21)))
+        schema.set_internal_state_freeze(False)
+        schema.set_allow_additional_parameters(False)
+        error = self.assert_raises(InvalidDataError, schema.process, dict(id=42, foo=21))
+        self.assert_equals('additional_items', error.details().key())
 
 
+    
+    def test_overridden_value_for_field_is_used(self):
+        class DefaultIDSchema(SchemaValidator):
+            id = IntegerValidator()
+            def _value_for_field(self, field_name, validator, fields, context):
+                if field_name not in fields:
+                    return '21'
+                return self.super()
+        schema = DefaultIDSchema()
+        self.assert_false(schema._uses_default_processing())
+        self.assert_equals({'id': 21}, schema.process({}))
+        self.assert_equals({'id': 42}, schema.process({'id': '42'}))
+        self.assert_equals({'id': 21}, schema.check({}).value())
+        self.assert_equals([{'id': 21}], schema.process_many([{}]))
+    
+    def test_overridden_field_and_form_processing_is_used(self):
+        calls = []
+        class LoggingSchema(SchemaValidator):
+            id = IntegerValidator()
+            def _process_field_validators(self, fields, context):
+                calls.append('fields')
+                return self.super()
+            def _process_form_validators(self, validated_fields, context):
+                calls.append('form')
+                return self.super()
+        schema = LoggingSchema()
+        self.assert_equals({'id': 42}, schema.process({'id': '42'}))
+        self.assert_equals(['fields', 'form'], calls)
+        
+        self.assert_raises(InvalidDataError, schema.process, {'id': 'foo'})
+        self.assert_equals(['fields', 'form', 'fields'], calls)
@@ -0,0 +1,140 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.stream import StreamStatistics, validate_stream
+from pycerberus.validators import IntegerValidator
+
+
+class Record(dict):
+    "Counts how many records are alive at the same time."
+    alive = 0
+    max_alive = 0
+    
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        Record.alive += 1
+        Record.max_alive = max(Record.alive, Record.max_alive)
+    
+    def __del__(self):
+        Record.alive -= 1
+
+
+class ValidateStreamTest(PythonicTestCase):
+    
+    def _schema(self):
+        schema = SchemaValidator()
+        schema.add('id', IntegerValidator())
+        return schema
+    
+    def test_yields_index_and_result(self):
+        results = list(validate_stream(IntegerValidator(), ['1', 'foo', '3']))
+        self.assert_equals([0, 1, 2], [index for index, result in results])
+        self.assert_equals(1, results[0][1])
+        self.assert_isinstance(results[1][1], InvalidDataError)
+        self.assert_equals(3, results[2][1])
+    
+    def test_is_lazy(self):
+        consumed = []
+        def values():
+            for i in range(3):
+                consumed.append(i)
+                yield str(i)
+        stream = validate_stream(IntegerValidator(), values())
+        self.assert_equals([], consumed)
+        self.assert_equals((0, 0), stream.next())
+        self.assert_equals([0], consumed)
+    
+    def test_can_route_invalid_items_to_error_sink(self):
+        errors = []
+        def sink(index, error):
+            errors.append((index, error.details().key()))
+        records = [{'id': '1'}, {'id': 'foo'}, {}, {'id': '4'}]
+        results = list(validate_stream(self._schema(), records, error_sink=sink))
+        self.assert_equals([(0, {'id': 1}), (3, {'id': 4})], results)
+        self.assert_equals([(1, 'invalid_number'), (2, 'empty')], errors)
+    
+    def test_can_stop_after_max_errors(self):
+        statistics = StreamStatistics()
+        values = ['1', 'a', '2', 'b', '3', 'c']
+        results = list(validate_stream(IntegerValidator(), values, max_errors=2, statistics=statistics))
+        self.assert_equals([0, 1, 2, 3], [index for index, result in results])
+        self.assert_true(statistics.aborted)
+        self.assert_equals(4, statistics.processed)
+    
+    def test_reports_progress(self):
+        reported = []
+        def progress(statistics):
+            reported.append((statistics.processed, statistics.valid, statistics.invalid))
+        values = ['1', 'a', '2', 'b', '3']
+        list(validate_stream(IntegerValidator(), values, progress=progress, progress_interval=2))
+        self.assert_equals([(2, 1, 1), (4, 2, 2), (5, 3, 2)], reported)
+    
+    def test_reports_final_progress_only_once(self):
+        reported = []
+        def progress(statistics):
+            reported.append((statistics.processed, statistics.valid, statistics.invalid))
+        values = ['1', 'a', '2', 'b']
+        list(validate_stream(IntegerValidator(), values, progress=progress, progress_interval=2))
+        self.assert_equals([(2, 1, 1), (4, 2, 2)], reported)
+        
+        reported = []
+        list(validate_stream(IntegerValidator(), [], progress=progress))
+        self.assert_equals([(0, 0, 0)], reported)
+    
+    def test_reports_progress_when_aborting(self):
+        reported = []
+        def progress(statistics):
+            reported.append((statistics.processed, statistics.invalid, statistics.aborted))
+        values = ['1', 'a', 'b', '2', 'c', 'd']
+        list(validate_stream(IntegerValidator(), values, max_errors=2, progress=progress, progress_interval=3))
+        self.assert_equals([(3, 2, True)], reported)
+        
+        reported = []
+        list(validate_stream(IntegerValidator(), values, max_errors=2, progress=progress, progress_interval=2))
+        self.assert_equals([(2, 1, False), (3, 2, True)], reported)
+    
+    def test_memory_is_bounded_for_large_inputs(self):
+        Record.alive = 0
+        Record.max_alive = 0
+        def records(nr_records):
+            for i in xrange(nr_records):
+                if i % 10 == 0:
+                    yield Record(id='invalid')
+                else:
+                    yield Record(id=str(i))
+        
+        statistics = StreamStatistics()
+        # Enough to detect leaks (each record would stay alive), 
+        # benchmarks/stream_memory_benchmark.py streams millions of records.
+        nr_records = 100000
+        for index, result in validate_stream(self._schema(), records(nr_records), statistics=statistics):
+            pass
+        self.assert_equals(nr_records, statistics.processed)
+        self.assert_equals(nr_records / 10, statistics.invalid)
+        # Exception tracebacks (Python 3) keep invalid records alive until the
+        # garbage collector breaks the reference cycles.
+        self.assert_true(Record.max_alive < 1000, Record.max_alive)
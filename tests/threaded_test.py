@@ -0,0 +1,209 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import threading
+import time
+
+from pycerberus.errors import InvalidDataError
+from pycerberus.lib import PythonicTestCase
+from pycerberus.schema import SchemaValidator
+from pycerberus.threaded import is_blocking, ThreadedProcessor, ThreadPoolExecutor
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class FakeCacheDaemon(object):
+    """Stand-in for a local service: every lookup takes ``delay`` seconds. 
+    Records how many lookups were running at the same time."""
+    
+    def __init__(self, delay=0.05, known=()):
+        self.delay = delay
+        self.known = set(known)
+        self.active = 0
+        self.max_active = 0
+        self.lookups = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+    
+    def lookup(self, key):
+        self._lock.acquire()
+        try:
+            self.active += 1
+            self.lookups += 1
+            self.max_active = max(self.max_active, self.active)
+            self.threads.add(threading.current_thread())
+        finally:
+            self._lock.release()
+        time.sleep(self.delay)
+        self._lock.acquire()
+        try:
+            self.active -= 1
+        finally:
+            self._lock.release()
+        return key in self.known
+
+
+class KnownKeyValidator(StringValidator):
+    blocking = True
+    
+    def __init__(self, daemon, *args, **kwargs):
+        self.daemon = daemon
+        self.super(*args, **kwargs)
+    
+    def messages(self):
+        return {'unknown': 'Unknown key.'}
+    
+    def validate(self, value, context):
+        self.super()
+        if not self.daemon.lookup(value):
+            self.error('unknown', value, context)
+
+
+class InlineRecordingValidator(IntegerValidator):
+    def __init__(self, threads, *args, **kwargs):
+        self.threads = threads
+        self.super(*args, **kwargs)
+    
+    def convert(self, value, context):
+        self.threads.append(threading.current_thread())
+        return self.super()
+
+
+class ThreadedProcessorTest(PythonicTestCase):
+    
+    def setUp(self):
+        self.super()
+        if ThreadPoolExecutor is None:
+            self.skipTest('concurrent.futures not available')
+        self.daemon = FakeCacheDaemon(known=('a', 'b', 'c', 'd'))
+        self.inline_threads = []
+    
+    def _schema(self, nr_blocking=4, **kwargs):
+        schema = SchemaValidator(**kwargs)
+        for i in range(nr_blocking):
+            schema.add('key%d' % i, KnownKeyValidator(self.daemon))
+        schema.add('id', InlineRecordingValidator(self.inline_threads))
+        return schema
+    
+    def _values(self, **values):
+        fields = {'key0': 'a', 'key1': 'b', 'key2': 'c', 'key3': 'd', 'id': '42'}
+        fields.update(values)
+        return fields
+    
+    def test_can_detect_blocking_validators(self):
+        schema = self._schema()
+        self.assert_true(is_blocking(schema.validator_for('key0')))
+        self.assert_false(is_blocking(schema.validator_for('id')))
+        self.assert_true(is_blocking(schema))
+        self.assert_false(is_blocking(SchemaValidator()))
+    
+    def test_processes_blocking_fields_concurrently(self):
+        schema = self._schema()
+        expected = schema.process(self._values())
+        self.daemon.threads.clear()
+        self.assert_equals(expected, ThreadedProcessor(schema).process(self._values()))
+        self.assert_equals(4, self.daemon.max_active)
+        self.assert_not_contains(threading.current_thread(), self.daemon.threads)
+    
+    def test_processes_other_fields_inline(self):
+        ThreadedProcessor(self._schema()).process(self._values())
+        self.assert_equals([threading.current_thread()], self.inline_threads)
+    
+    def test_merges_errors_like_process(self):
+        schema = self._schema()
+        values = self._values(key1='x', key3='y', id='invalid')
+        expected = self.assert_raises(InvalidDataError, schema.process, values)
+        error = self.assert_raises(InvalidDataError, ThreadedProcessor(schema).process, values)
+        self.assert_equals(set(['id', 'key1', 'key3']), set(error.error_dict().keys()))
+        for key, field_error in expected.error_dict().items():
+            self.assert_equals(field_error.details().key(), error.error_for(key).details().key())
+        self.assert_equals(expected.details().msg(), error.details().msg())
+    
+    def test_runs_form_validators_after_all_fields(self):
+        schema = self._schema()
+        calls = []
+        class FormValidator(StringValidator):
+            def convert(self, fields, context):
+                calls.append(fields.copy())
+                return fields
+        schema.add_formvalidator(FormValidator())
+        ThreadedProcessor(schema).process(self._values())
+        self.assert_equals([schema.process(self._values())], calls[:1])
+    
+    def test_can_limit_concurrency(self):
+        processor = ThreadedProcessor(self._schema(), max_concurrency=2)
+        processor.process(self._values())
+        self.assert_equals(2, self.daemon.max_active)
+        self.assert_equals(4, self.daemon.lookups)
+    
+    def test_timeout_raises_invalid_data_error(self):
+        self.daemon.delay = 0.5
+        processor = ThreadedProcessor(self._schema(nr_blocking=2), timeout=0.05)
+        start = time.time()
+        error = self.assert_raises(InvalidDataError, processor.process, self._values())
+        self.assert_true(time.time() - start < 0.4)
+        self.assert_equals(set(['key0', 'key1']), set(error.error_dict().keys()))
+        timeout_error = error.error_for('key0')
+        self.assert_equals('timeout', timeout_error.details().key())
+        self.assert_equals('Validation did not finish in time.', timeout_error.details().msg())
+    
+    def test_timeout_can_be_set_per_call(self):
+        self.daemon.delay = 0.5
+        processor = ThreadedProcessor(self._schema(nr_blocking=1))
+        error = self.assert_raises(InvalidDataError, processor.process, self._values(), timeout=0.05)
+        self.assert_equals('timeout', error.error_for('key0').details().key())
+    
+    def test_timeout_while_waiting_for_free_slot(self):
+        self.daemon.delay = 0.3
+        processor = ThreadedProcessor(self._schema(nr_blocking=2), max_concurrency=1, timeout=0.05)
+        error = self.assert_raises(InvalidDataError, processor.process, self._values())
+        self.assert_equals(set(['key0', 'key1']), set(error.error_dict().keys()))
+        self.assert_equals(1, self.daemon.lookups)
+    
+    def test_fail_fast_checks_inline_fields_first(self):
+        schema = self._schema(fail_fast=True)
+        values = self._values(key0='x', id='invalid')
+        error = self.assert_raises(InvalidDataError, ThreadedProcessor(schema).process, values)
+        self.assert_equals(['id'], list(error.error_dict().keys()))
+        
+        values = self._values(key2='x', key1='y')
+        error = self.assert_raises(InvalidDataError, ThreadedProcessor(schema).process, values)
+        # deterministic: first invalid field in plan order (not the first 
+        # thread which finished)
+        expected = self.assert_raises(InvalidDataError, schema.process, values)
+        self.assert_equals(list(expected.error_dict().keys()), list(error.error_dict().keys()))
+    
+    def test_schema_without_blocking_fields_is_processed_inline(self):
+        schema = SchemaValidator()
+        schema.add('id', InlineRecordingValidator(self.inline_threads))
+        self.assert_equals({'id': 1}, ThreadedProcessor(schema).process({'id': '1'}))
+        self.assert_equals([threading.current_thread()], self.inline_threads)
+    
+    def test_can_use_custom_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            ThreadedProcessor(self._schema(), executor=executor).process(self._values())
+        finally:
+            executor.shutdown()
+        self.assert_equals(1, self.daemon.max_active)
+        self.assert_length(1, self.daemon.threads)
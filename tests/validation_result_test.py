@@ -0,0 +1,142 @@
+# -*- coding: UTF-8 -*-
+#
+# The MIT License
+# 
+# Copyright (c) 2026 Felix Schwarz <felix.schwarz@oss.schwarz.eu>
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pycerberus.api import BaseValidator, Validator
+from pycerberus.errors import EmptyError, InvalidDataError, LazyMessage
+from pycerberus.lib import PythonicTestCase
+from pycerberus.result import ValidationResult
+from pycerberus.schema import SchemaValidator
+from pycerberus.validators import IntegerValidator, StringValidator
+
+
+class ValidationResultTest(PythonicTestCase):
+    
+    def test_valid_result(self):
+        result = IntegerValidator().check('42')
+        self.assert_isinstance(result, ValidationResult)
+        self.assert_true(result.is_valid())
+        self.assert_equals(42, result.value())
+        self.assert_none(result.error())
+        self.assert_equals({}, result.error_dict())
+    
+    def test_invalid_result(self):
+        result = IntegerValidator().check('foo')
+        self.assert_false(result.is_valid())
+        error = result.error()
+        self.assert_isinstance(error, InvalidDataError)
+        self.assert_equals('invalid_number', error.details().key())
+        self.assert_equals('Please enter a number.', error.details().msg())
+        self.assert_raises(InvalidDataError, result.value)
+    
+    def test_messages_are_translated_lazily(self):
+        context = {'locale': 'de'}
+        result = IntegerValidator().check('foo', context)
+        self.assert_isinstance(result.error().raw_msg(), LazyMessage)
+        self.assert_equals(u'Bitte geben Sie eine Zahl ein.', result.error().msg())
+        # the context of the caller is not modified
+        self.assert_equals({'locale': 'de'}, context)
+    
+    def test_empty_values(self):
+        result = IntegerValidator().check(None)
+        self.assert_isinstance(result.error(), EmptyError)
+        self.assert_equals('empty', result.error().details().key())
+        self.assert_equals('Value must not be empty.', result.error().msg())
+        self.assert_none(IntegerValidator(required=False).check(None).value())
+        self.assert_equals(5, IntegerValidator(default=5, required=False).check(None).value())
+    
+    def test_strips_input(self):
+        self.assert_equals('foo', StringValidator(strip=True).check(' foo ').value())
+        self.assert_equals('empty', StringValidator(strip=True).check('  ').error().details().key())
+    
+    def test_works_with_custom_process_methods(self):
+        class CustomValidator(Validator):
+            def process(self, value, context=None):
+                if value != 'ok':
+                    self.error('empty', value, context)
+                return 'processed'
+        self.assert_equals('processed', CustomValidator().check('ok').value())
+        self.assert_equals('empty', CustomValidator().check('nok').error().details().key())
+        self.assert_equals(42, BaseValidator().check(42).value())
+    
+    # -------------------------------------------------------------------------
+    # schemas
+    
+    def _schema(self, **kwargs):
+        schema = SchemaValidator(**kwargs)
+        schema.add('id', IntegerValidator())
+        schema.add('name', StringValidator())
+        return schema
+    
+    def test_valid_schema(self):
+        result = self._schema().check({'id': '1', 'name': 'foo'})
+        self.assert_equals({'id': 1, 'name': 'foo'}, result.value())
+    
+    def test_schema_collects_field_errors(self):
+        values = {'id': 'foo', 'name': None}
+        result = self._schema().check(values)
+        self.assert_false(result.is_valid())
+        self.assert_equals(['id', 'name'], sorted(result.error_dict().keys()))
+        self.assert_equals('invalid_number', result.error_dict()['id'].details().key())
+        
+        error = result.error()
+        expected_error = self.assert_raises(InvalidDataError, self._schema().process, values)
+        self.assert_equals(expected_error.details().key(), error.details().key())
+        self.assert_equals(expected_error.details().msg(), error.details().msg())
+        self.assert_true(error is result.error())
+    
+    def test_schema_rejects_invalid_types(self):
+        self.assert_equals('invalid_type', self._schema().check('foo').error().details().key())
+        self.assert_equals({}, self._schema().check(None).value())
+    
+    def test_schema_checks_additional_items(self):
+        schema = self._schema()
+        schema.set_internal_state_freeze(False)
+        schema.set_allow_additional_parameters(False)
+        schema.set_internal_state_freeze(True)
+        result = schema.check({'id': '1', 'name': 'foo', 'foo': 'bar'})
+        self.assert_equals('additional_items', result.error().details().key())
+    
+    def test_schema_runs_form_validators(self):
+        class FormValidator(Validator):
+            def validate(self, fields, context):
+                if fields['id'] != 1:
+                    self.error('empty', fields, context)
+        schema = self._schema()
+        schema.add_formvalidator(FormValidator())
+        self.assert_true(schema.check({'id': '1', 'name': 'foo'}).is_valid())
+        self.assert_equals('empty', schema.check({'id': '2', 'name': 'foo'}).error().details().key())
+    
+    def test_nested_schemas(self):
+        schema = SchemaValidator()
+        schema.add('nested', self._schema())
+        result = schema.check({'nested': {'id': 'foo', 'name': 'bar'}})
+        nested_error = result.error_dict()['nested']
+        self.assert_equals(['id'], list(nested_error.error_dict().keys()))
+        self.assert_equals({'nested': {'id': 1, 'name': 'bar'}}, 
+                           schema.check({'nested': {'id': '1', 'name': 'bar'}}).value())
+    
+    def test_schema_supports_fail_fast(self):
+        result = self._schema(fail_fast=True).check({'id': 'foo', 'name': None})
+        self.assert_length(1, result.error_dict())
+
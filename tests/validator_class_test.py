@@ -116,3 +116,47 @@ class StripValueTest(ValidationTest):
         self.assert_error(' ')
 
 
+
+
+class ImplementationTableIsComputedOncePerClassTest(ValidationTest):
+    
+    def test_instances_share_implementation_table(self):
+        first = Validator()
+        second = Validator(required=False)
+        self.assert_true(first._implementations is second._implementations)
+    
+    def test_messages_are_only_collected_for_first_instance(self):
+        calls = []
+        class CountingValidator(Validator):
+            def messages(self):
+                calls.append(self)
+                return {'foo': 'bar'}
+        
+        CountingValidator()
+        CountingValidator()
+        self.assert_length(1, calls)
+        self.assert_equals('bar', CountingValidator().message('foo', {}))
+    
+    def test_subclasses_do_not_reuse_table_of_super_class(self):
+        class FooValidator(Validator):
+            messages = {'foo': 'foo'}
+        class BarValidator(FooValidator):
+            messages = {'bar': 'bar'}
+        
+        self.assert_not_contains('bar', FooValidator()._implementations)
+        self.assert_contains('bar', BarValidator()._implementations)
+        self.assert_contains('foo', BarValidator()._implementations)
+    
+    def test_changing_class_hierarchy_invalidates_table(self):
+        class FooValidator(Validator):
+            messages = {'foo': 'foo'}
+        class BarValidator(Validator):
+            messages = {'bar': 'bar'}
+        class DerivedValidator(FooValidator):
+            pass
+        self.assert_contains('foo', DerivedValidator()._implementations)
+        
+        DerivedValidator.__bases__ = (BarValidator, )
+        implementations = DerivedValidator()._implementations
+        self.assert_contains('bar', implementations)
+        self.assert_not_contains('foo', implementations)